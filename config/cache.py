@@ -0,0 +1,61 @@
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+
+
+def get_version(key):
+    """
+    key에 저장된 버전 번호를 반환합니다.
+    버전이 없으면(처음 조회하거나 캐시에서 밀려난 경우) 현재 시각으로 새 버전을 만들어,
+    이전 버전으로 저장된 데이터가 다시 사용되지 않도록 합니다.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """
+    key의 버전 번호를 1 올려 이전 버전으로 저장된 캐시 데이터를 무효화합니다.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_version_on_commit(key):
+    """
+    지금 바로, 그리고 현재 트랜잭션이 커밋된 뒤에 한 번 더 버전을 올립니다.
+    커밋 전에 DB를 읽어 캐시를 채운 요청이 있어도 그 데이터는 이전 버전에 남아 사용되지 않습니다.
+    """
+    bump_version(key)
+    transaction.on_commit(lambda: bump_version(key))
+
+
+def incr_counter(key):
+    """
+    캐시에 저장된 카운터를 1 올립니다. (hit/miss 집계용)
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+@contextmanager
+def bench_cache():
+    """
+    측정 명령에서 default 캐시 대신 CACHES["bench"]를 비운 채로 사용합니다.
+    운영 캐시(세션, 버전, 카운터 등)를 비우거나 측정 데이터로 채우지 않습니다.
+    """
+    with override_settings(CACHES={**settings.CACHES, "default": settings.CACHES["bench"]}):
+        cache.clear()
+        yield
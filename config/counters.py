@@ -0,0 +1,105 @@
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+
+def increment(model, ids, **deltas):
+    """
+    model에서 id가 ids에 있는 행의 카운터 컬럼에 deltas를 더합니다.
+    F 식을 사용한 UPDATE 한 번으로 처리되므로 동시에 실행되어도 값을 잃어버리지 않습니다.
+    ex) increment(Event, [1, 2], like_count=1)
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    ids = list(ids)
+    if ids and deltas:
+        model.objects.filter(pk__in=ids).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+
+
+def count_relation(model, field_name, counter):
+    """
+    model의 회원 M2M 필드(field_name)가 바뀔 때마다 model의 counter 컬럼을 갱신합니다.
+    event.likes.add(user)처럼 model 쪽에서 바뀌는 경우와
+    user.like_event.add(event)처럼 회원 쪽에서 바뀌는 경우를 모두 처리합니다.
+    제거할 때는 실제로 존재하던 관계만 셉니다.
+    """
+    field = model._meta.get_field(field_name)
+    through = field.remote_field.through
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+
+    def changed(sender, instance, action, reverse, pk_set, **kwargs):
+        if not reverse:
+            if action == "post_add":
+                increment(model, [instance.pk], **{counter: len(pk_set)})
+            elif action == "pre_remove":
+                removed = through.objects.filter(
+                    **{source: instance.pk, f"{target}__in": pk_set}
+                ).count()
+                increment(model, [instance.pk], **{counter: -removed})
+            elif action == "pre_clear":
+                model.objects.filter(pk=instance.pk).update(**{counter: 0})
+            return
+
+        if action == "post_add":
+            increment(model, pk_set, **{counter: 1})
+        elif action in ("pre_remove", "pre_clear"):
+            related = through.objects.filter(**{target: instance.pk})
+            if action == "pre_remove":
+                related = related.filter(**{f"{source}__in": pk_set})
+            increment(
+                model, related.values_list(f"{source}_id", flat=True), **{counter: -1}
+            )
+
+    m2m_changed.connect(
+        changed,
+        sender=through,
+        weak=False,
+        dispatch_uid=f"count_relation:{model._meta.label}.{field_name}",
+    )
+
+
+def count_reviews(review_model, target_field, model):
+    """
+    리뷰(review_model)가 생성/수정/삭제될 때마다 리뷰 대상(model)의
+    review_count, rating_count, rating_sum 컬럼을 갱신합니다.
+    target_field는 리뷰가 대상을 가리키는 ForeignKey 이름입니다.
+    """
+    uid = f"count_reviews:{review_model._meta.label}"
+
+    def before_save(sender, instance, **kwargs):
+        instance._counted_grade = None
+        if not instance._state.adding:
+            instance._counted_grade = (
+                review_model.objects.filter(pk=instance.pk)
+                .values_list("grade", flat=True)
+                .first()
+            )
+
+    def saved(sender, instance, created, **kwargs):
+        target_id = getattr(instance, f"{target_field}_id")
+        if created:
+            increment(
+                model,
+                [target_id],
+                review_count=1,
+                rating_count=1,
+                rating_sum=instance.grade,
+            )
+        elif instance._counted_grade is not None:
+            increment(
+                model, [target_id], rating_sum=instance.grade - instance._counted_grade
+            )
+
+    def deleted(sender, instance, **kwargs):
+        increment(
+            model,
+            [getattr(instance, f"{target_field}_id")],
+            review_count=-1,
+            rating_count=-1,
+            rating_sum=-instance.grade,
+        )
+
+    pre_save.connect(before_save, sender=review_model, weak=False, dispatch_uid=uid)
+    post_save.connect(saved, sender=review_model, weak=False, dispatch_uid=uid)
+    post_delete.connect(deleted, sender=review_model, weak=False, dispatch_uid=uid)
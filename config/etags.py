@@ -0,0 +1,64 @@
+import functools
+import hashlib
+
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from config.cache import bump_version_on_commit, get_version
+
+
+def collection_key(name):
+    return f"collection:{name}:version"
+
+
+def touch(*names):
+    """
+    목록(collection)의 데이터가 바뀌었을 때 버전을 올려 이전 ETag를 무효화합니다. 모델 신호에서 호출합니다.
+    """
+    for name in names:
+        bump_version_on_commit(collection_key(name))
+
+
+def collections(*names):
+    """
+    conditional_get에 넘길 version_keys를 목록 이름으로 만듭니다.
+    """
+    return lambda request, **kwargs: [collection_key(name) for name in names]
+
+
+def conditional_get(version_keys, vary=()):
+    """
+    목록 조회 view의 get에 ETag를 붙입니다.
+    ETag는 version_keys(request, **kwargs)가 반환한 캐시 키들과 이미지 변환본("images")의 버전,
+    요청 경로(쿼리 포함), Accept 헤더로 만들며,
+    If-None-Match가 같으면 쿼리나 직렬화 없이 304를 응답합니다.
+    회원마다 응답이 다르면 회원별 버전 키를 포함하고 vary에 "Authorization"을 넘깁니다.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            keys = [collection_key("images"), *version_keys(request, **kwargs)]
+            versions = ",".join(f"{key}={get_version(key)}" for key in keys)
+            accept = request.META.get("HTTP_ACCEPT", "")
+            digest = hashlib.md5(
+                f"{versions}:{request.get_full_path()}:{accept}".encode()
+            )
+            etag = quote_etag(digest.hexdigest())
+
+            # 압축 미들웨어가 ETag를 weak(W/)로 바꾸므로 weak 비교를 합니다.
+            if_none_match = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+            if etag in [tag.removeprefix("W/") for tag in if_none_match]:
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = method(self, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response["ETag"] = etag
+                patch_vary_headers(response, ("Accept", *vary))
+            return response
+
+        return wrapper
+
+    return decorator
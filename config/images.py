@@ -0,0 +1,156 @@
+import functools
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db.models.signals import post_save
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from config import etags
+from config.media import DerivedContentFile
+from config.tasks import run_in_background
+
+logger = logging.getLogger(__name__)
+
+FORMATS = (("webp", "WEBP"), ("jpeg", "JPEG"))
+
+# 변환 상태 (images:state:<원본 이름>)
+READY = "ready"
+FAILED = "failed"
+PENDING = "pending"
+# 변환본이 아직 없는 이미지의 파일 확인 결과를 캐시하는 시간(초)
+PENDING_TIMEOUT = 60
+
+
+def variant_name(name, variant, extension):
+    """
+    원본 파일 이름에서 변환본 파일 이름을 만듭니다. ex) 2023/06/a.png -> 2023/06/a.thumb.webp
+    """
+    root, _ = os.path.splitext(name)
+    return f"{root}.{variant}.{extension}"
+
+
+def _state_key(name):
+    return f"images:state:{name}"
+
+
+def is_ready(name):
+    """
+    변환본이 모두 만들어졌는지 확인합니다.
+    변환이 끝났거나 실패한 이미지는 캐시만 확인하고, 상태를 모르는 이미지만 파일을 확인합니다.
+    변환본이 없으면 PENDING_TIMEOUT 동안은 다시 확인하지 않습니다.
+    """
+    state = cache.get(_state_key(name))
+    if state is not None:
+        return state == READY
+    # 마지막으로 저장되는 변환본이 있으면 모든 변환본이 만들어진 것입니다.
+    variant = list(settings.IMAGE_VARIANTS)[-1]
+    extension = FORMATS[-1][0]
+    if default_storage.exists(variant_name(name, variant, extension)):
+        cache.set(_state_key(name), READY, None)
+        return True
+    cache.add(_state_key(name), PENDING, PENDING_TIMEOUT)
+    return False
+
+
+def generate_variants(name):
+    """
+    원본 이미지를 IMAGE_VARIANTS의 너비로 줄인 WebP/JPEG 변환본을 만듭니다.
+    원본보다 큰 너비로는 늘리지 않으며, 이미 만들어진 변환본은 다시 만들지 않습니다.
+    """
+    if is_ready(name):
+        return
+    with default_storage.open(name, "rb") as f:
+        image = ImageOps.exif_transpose(Image.open(f))
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    for variant, width in settings.IMAGE_VARIANTS.items():
+        resized = image.copy()
+        resized.thumbnail((width, width * 4), Image.LANCZOS)
+        for extension, image_format in FORMATS:
+            output = resized.convert("RGB") if image_format == "JPEG" else resized
+            buffer = BytesIO()
+            output.save(
+                buffer,
+                image_format,
+                quality=settings.IMAGE_VARIANT_QUALITY,
+                optimize=True,
+            )
+            target = variant_name(name, variant, extension)
+            if default_storage.exists(target):
+                default_storage.delete(target)
+            default_storage.save(target, DerivedContentFile(buffer.getvalue()))
+    cache.set(_state_key(name), READY, None)
+    # 목록 응답의 이미지 URL이 변환본으로 바뀝니다.
+    etags.touch("images")
+
+
+def _generate(name, on_ready):
+    try:
+        generate_variants(name)
+    except (OSError, Image.DecompressionBombError):
+        logger.exception("failed to generate image variants for %s", name)
+        # 실패한 이미지는 원본 URL을 사용하며, 목록을 직렬화할 때마다 파일을 확인하지 않습니다.
+        cache.set(_state_key(name), FAILED, None)
+        return
+    if on_ready is not None:
+        on_ready()
+
+
+def register(model, field_name, on_ready=None):
+    """
+    model의 이미지 필드(field_name)가 저장되면 커밋 후 백그라운드에서 변환본을 만듭니다.
+    on_ready(instance)는 변환본이 만들어진 뒤 호출되며, 변환본 URL이 포함된 응답 캐시를 무효화할 때 사용합니다.
+    """
+
+    def receiver(sender, instance, **kwargs):
+        name = getattr(instance, field_name).name
+        if name and cache.get(_state_key(name)) not in (READY, FAILED):
+            callback = functools.partial(on_ready, instance) if on_ready else None
+            run_in_background(_generate, name, callback)
+
+    post_save.connect(
+        receiver,
+        sender=model,
+        weak=False,
+        dispatch_uid=f"image_variants:{model._meta.label}:{field_name}",
+    )
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    이미지 필드의 변환본 URL을 {"thumb": {"webp": url, "jpeg": url}, ...} 형태로 보여줍니다.
+    변환본이 아직 만들어지지 않았으면 모든 URL이 원본 URL 입니다.
+
+    ex) image_variants = ImageVariantsField(source="image")
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        request = self.context.get("request")
+
+        def url(name):
+            url = default_storage.url(name)
+            return request.build_absolute_uri(url) if request else url
+
+        ready = is_ready(value.name)
+        return {
+            variant: {
+                extension: url(
+                    variant_name(value.name, variant, extension) if ready else value.name
+                )
+                for extension, _ in FORMATS
+            }
+            for variant in settings.IMAGE_VARIANTS
+        }
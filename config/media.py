@@ -0,0 +1,190 @@
+import hashlib
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+from django.utils._os import safe_join
+from django.utils.http import (
+    http_date,
+    parse_etags,
+    parse_http_date_safe,
+    quote_etag,
+)
+from django.views.decorators.http import require_safe
+
+RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+CHUNK_SIZE = 64 * 1024
+HASH_SUFFIX_LENGTH = len(".") + 12
+
+
+class DerivedContentFile(ContentFile):
+    """
+    해시가 붙은 원본에서 만든 파일(이미지 변환본 등)입니다.
+    이름에 원본의 해시가 이미 들어 있으므로 HashedFileSystemStorage가 다시 해시를 붙이지 않습니다.
+    """
+
+
+class HashedFileSystemStorage(FileSystemStorage):
+    """
+    업로드한 파일 이름에 내용의 sha256 앞 12자리를 붙여 저장합니다. ex) poster.jpg -> poster.1a2b3c4d5e6f.jpg
+    내용이 바뀌면 URL도 바뀌므로 브라우저가 파일을 영구 캐시(immutable)할 수 있습니다.
+    업로드한 이름이 이미 해시처럼 생겼더라도 다시 해시를 붙이며, DerivedContentFile만 그대로 저장합니다.
+    """
+
+    def save(self, name, content, max_length=None):
+        if max_length is not None and not isinstance(content, DerivedContentFile):
+            # get_available_name이 이름을 자를 때 _save가 붙일 ".<해시 12자리>" 만큼 남겨 둡니다.
+            max_length -= HASH_SUFFIX_LENGTH
+        return super().save(name, content, max_length)
+
+    def _save(self, name, content):
+        if isinstance(content, DerivedContentFile):
+            return super()._save(name, content)
+        digest = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        root, extension = os.path.splitext(name)
+        name = f"{root}.{digest.hexdigest()[:12]}{extension}"
+        if self.exists(name):
+            # 내용이 같은 파일이 이미 있으면 다시 저장하지 않습니다.
+            return name
+        return super()._save(name, content)
+
+
+def _is_hashed(path):
+    """
+    HashedFileSystemStorage가 만든 이름(poster.<해시>.jpg, poster.<해시>.thumb.webp)인지 확인합니다.
+    """
+    variants = "|".join(map(re.escape, settings.IMAGE_VARIANTS))
+    return bool(
+        re.search(
+            rf"\.[0-9a-f]{{12}}(\.({variants}))?(\.[^.]+)?$", os.path.basename(path)
+        )
+    )
+
+
+def _etag(stat_result):
+    return quote_etag(f"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}")
+
+
+def _not_modified(request, etag, mtime):
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        # If-None-Match는 약한 비교를 합니다. (W/"..." 와 "..." 는 같은 태그)
+        tags = parse_etags(if_none_match)
+        return tags == ["*"] or etag.removeprefix("W/") in [
+            tag.removeprefix("W/") for tag in tags
+        ]
+    if_modified_since = parse_http_date_safe(
+        request.META.get("HTTP_IF_MODIFIED_SINCE", "")
+    )
+    return if_modified_since is not None and int(mtime) <= if_modified_since
+
+
+def _byte_range(request, etag, size):
+    """
+    Range 헤더(단일 범위만 지원)를 (시작, 끝) 으로 반환합니다.
+    범위 요청이 아니면 None, 만족할 수 없는 범위이면 False를 반환합니다.
+    """
+    header = request.META.get("HTTP_RANGE", "")
+    match = RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range is not None and if_range.strip() != etag:
+        return None
+    start, end = match.groups()
+    if start == "":
+        # bytes=-500: 마지막 500바이트
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _stream(path, start, length):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+@require_safe
+def serve(request, path):
+    """
+    MEDIA_ROOT의 파일을 ETag/Last-Modified 조건부 요청과 Range 요청을 지원하며 내려줍니다.
+    MEDIA_SENDFILE이 "x-accel-redirect"(nginx) 또는 "x-sendfile"(apache 등)이면
+    헤더만 만들고 파일 전송은 앞단 프록시에 넘기며, 없으면 파일을 나누어 직접 스트리밍합니다.
+    HashedFileSystemStorage가 해시를 붙인 파일 이름은 immutable로 캐시하게 합니다.
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat_result = os.stat(full_path)
+    except (OSError, ValueError, SuspiciousFileOperation):
+        raise Http404
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise Http404
+
+    etag = _etag(stat_result)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(stat_result.st_mtime),
+        "Cache-Control": IMMUTABLE
+        if _is_hashed(path)
+        else f"public, max-age={settings.MEDIA_CACHE_MAX_AGE}",
+    }
+    if _not_modified(request, etag, stat_result.st_mtime):
+        response = HttpResponseNotModified()
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+    sendfile = settings.MEDIA_SENDFILE
+    if sendfile == "x-accel-redirect":
+        response = HttpResponse(content_type=content_type, headers=headers)
+        response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_PREFIX + quote(path)
+        return response
+    if sendfile == "x-sendfile":
+        response = HttpResponse(content_type=content_type, headers=headers)
+        response["X-Sendfile"] = full_path
+        return response
+
+    size = stat_result.st_size
+    headers["Accept-Ranges"] = "bytes"
+    byte_range = _byte_range(request, etag, size)
+    if byte_range is False:
+        headers["Content-Range"] = f"bytes */{size}"
+        return HttpResponse(status=416, headers=headers)
+    start, end = byte_range or (0, size - 1)
+    response = StreamingHttpResponse(
+        _stream(full_path, start, end - start + 1),
+        status=206 if byte_range else 200,
+        content_type=content_type,
+        headers=headers,
+    )
+    response["Content-Length"] = end - start + 1
+    if byte_range:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
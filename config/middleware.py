@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+ACCEPT_ENCODING = _lazy_re_compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*$")
+
+
+def accepted_encodings(header):
+    """
+    Accept-Encoding 헤더에서 받을 수 있는(q > 0) 인코딩 이름을 반환합니다.
+    """
+    encodings = set()
+    for item in header.lower().split(","):
+        match = ACCEPT_ENCODING.match(item)
+        if match is None:
+            continue
+        name, q = match.groups()
+        try:
+            if q is None or float(q) > 0:
+                encodings.add(name)
+        except ValueError:
+            continue
+    return encodings
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    COMPRESSION_MIN_SIZE 바이트 이상인 응답을 Accept-Encoding에 따라 brotli(br) 또는 gzip으로 압축합니다.
+    brotli는 brotli 패키지가 설치되어 있을 때만 사용합니다.
+    작은 응답은 압축해도 줄어드는 양보다 CPU 비용이 크므로 그대로 보냅니다.
+    스트리밍 응답(미디어 파일)과 Range 응답, 이미 인코딩된 응답은 압축하지 않습니다.
+    gzip은 django.middleware.gzip.GZipMiddleware와 같이 BREACH 완화를 위한 임의 바이트를 덧붙입니다.
+    """
+
+    max_random_bytes = 100
+
+    def process_response(self, request, response):
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or response.has_header("Content-Range")
+            or len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encodings = accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if brotli is not None and "br" in encodings:
+            content = brotli.compress(
+                response.content,
+                mode=brotli.MODE_TEXT,
+                quality=settings.COMPRESSION_BROTLI_QUALITY,
+            )
+            encoding = "br"
+        elif "gzip" in encodings:
+            content = compress_string(
+                response.content, max_random_bytes=self.max_random_bytes
+            )
+            encoding = "gzip"
+        else:
+            return response
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response["Content-Length"] = str(len(content))
+        response["Content-Encoding"] = encoding
+        # 압축한 응답은 원본과 바이트가 다르므로 strong ETag를 weak ETag로 바꿉니다.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
@@ -0,0 +1,34 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson이 설치되어 있으면 orjson으로 JSON을 만듭니다. 없으면 DRF의 JSONRenderer와 같습니다.
+    날짜/시간, Decimal, lazy 문자열 등은 DRF의 JSONEncoder로 변환하므로 응답 형식은 JSONRenderer와 같으며,
+    들여쓰기를 요청했거나(ex: Accept: application/json; indent=4) orjson이 변환하지 못하는 값은
+    JSONRenderer로 만듭니다.
+    JSONRenderer처럼 U+2028, U+2029는 \u2028, \u2029로 이스케이프합니다. (JavaScript 문자열에서 줄바꿈으로 해석됨)
+    """
+
+    if orjson is not None:
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -109,14 +110,49 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 STATIC_URL = "/static/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "/media/"
+# 미디어 파일 제공
+# 업로드 파일 이름에 내용 해시를 붙여 저장하고(immutable 캐시), config.media.serve로 제공합니다.
+# MEDIA_SENDFILE을 "x-accel-redirect"(nginx: MEDIA_ACCEL_PREFIX를 internal location으로 설정) 또는
+# "x-sendfile"로 설정하면 파일 전송을 앞단 프록시에 넘깁니다.
+STORAGES = {
+    "default": {"BACKEND": "config.media.HashedFileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+MEDIA_SERVE = env.bool("MEDIA_SERVE", default=DEBUG)
+MEDIA_SENDFILE = os.environ.get("MEDIA_SENDFILE")
+MEDIA_ACCEL_PREFIX = "/protected-media/"
+MEDIA_CACHE_MAX_AGE = 60 * 60
+# 업로드한 이미지의 변환본 (이름: 최대 너비). 목록에서는 thumb, 상세에서는 medium을 사용합니다.
+IMAGE_VARIANTS = {"thumb": 320, "medium": 960}
+IMAGE_VARIANT_QUALITY = 80
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# 응답 압축 (config.middleware.CompressionMiddleware)
+# COMPRESSION_MIN_SIZE 바이트 이상인 응답만 압축합니다. brotli는 brotli 패키지가 설치되어 있을 때만 사용합니다.
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_BROTLI_QUALITY = 5
+
+# 캐시
+# 테스트와 로컬에서는 locmem을, 운영에서는 CACHE_URL(ex: redis://127.0.0.1:6379/1)로 공유 캐시를 사용합니다.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+    # 측정 명령(bench_*)이 사용하는 캐시. 측정 전에 비우므로 운영 캐시와 다른 곳을 지정합니다.
+    "bench": env.cache("BENCH_CACHE_URL", default="locmemcache://bench"),
+}
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
-    )
+    ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
+# 인증된 회원 캐시 시간(초). 회원 정보가 바뀌면 신호로 바로 무효화됩니다.
+# 캐시는 CachedJWTAuthentication을 지정한 조회용 view에서만 사용합니다.
+AUTH_USER_CACHE_TIMEOUT = 60 * 5
 
 
 REST_USE_JWT = True
@@ -167,3 +203,28 @@ ACCOUNT_USERNAME_REQUIRED = False
 # taggit
 TAGGIT_CASE_INSENSITIVE = True
 TAGGIT_LIMIT = 50
+
+# 티켓 생성
+# 공연 기간이 TICKET_BACKGROUND_DAYS일을 넘으면 티켓을 백그라운드에서 생성합니다.
+TICKET_BACKGROUND_DAYS = 60
+TICKET_BULK_BATCH_SIZE = 500
+
+# 캐시 만료 시간(초)
+# 아래 캐시들은 데이터가 바뀌면 신호로 바로 무효화되며, 만료 시간은 안전장치로만 사용됩니다.
+TICKET_AVAILABILITY_TIMEOUT = 60 * 10
+EVENT_DETAIL_CACHE_TIMEOUT = 60 * 60
+PURCHASE_ELIGIBILITY_TIMEOUT = 60 * 60
+EVENT_REVIEW_ELIGIBILITY_TIMEOUT = 60 * 60
+
+# 공연 검색
+# 검색어 중 가장 드문 n-gram을 고르기 위해 n-gram별 문서 수를 아래 값까지만 세어 캐시합니다.
+SEARCH_FREQUENCY_LIMIT = 1000
+SEARCH_FREQUENCY_TIMEOUT = 60 * 60
+
+# 주소 -> 좌표 변환 (stores.geocoding)
+# 테스트와 로컬에서는 GEOCODER_BACKEND를 "stores.geocoding.StubGeocoder"로 바꾸어 외부 API 없이 사용할 수 있습니다.
+GEOCODER_BACKEND = os.environ.get("GEOCODER_BACKEND", "stores.geocoding.KakaoGeocoder")
+GEOCODE_TIMEOUT = 3
+GEOCODE_RETRIES = 2
+GEOCODE_CONCURRENCY = 4
+GEOCODE_CACHE_TTL = 60 * 60 * 24 * 30
@@ -0,0 +1,32 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_background(func, *args):
+    """
+    현재 트랜잭션이 커밋된 뒤 별도 스레드에서 func(*args)를 실행합니다.
+    요청을 처리하는 동안 오래 걸리는 작업을 응답 밖으로 미룰 때 사용합니다.
+    BACKGROUND_TASKS_EAGER가 True이면 스레드 없이 바로 실행합니다. (테스트용)
+    """
+
+    def start():
+        if getattr(settings, "BACKGROUND_TASKS_EAGER", False):
+            func(*args)
+        else:
+            threading.Thread(target=_run, args=(func, *args), daemon=True).start()
+
+    transaction.on_commit(start)
+
+
+def _run(func, *args):
+    try:
+        func(*args)
+    except Exception:
+        logger.exception("background task %s failed", func.__name__)
+    finally:
+        connection.close()
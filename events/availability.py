@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.dateparse import parse_date, parse_time
+
+from config.cache import bump_version_on_commit, get_version
+from events.models import Ticket
+from events.serializers import TicketSerializer
+
+
+def parse_event_date(value):
+    """
+    url의 공연 날짜를 date로 변환합니다. 올바른 날짜가 아니면 None을 반환합니다.
+    """
+    try:
+        return parse_date(value)
+    except ValueError:
+        return None
+
+
+def parse_event_time(value):
+    """
+    url의 공연 시간대("19:00-20:00")를 티켓에 저장된 형식(HH:MM-HH:MM)으로 맞춥니다.
+    올바른 시간대가 아니면 None을 반환합니다. ex) "9:00-10:00" -> "09:00-10:00"
+    """
+    try:
+        start, end = [parse_time(part.strip()) for part in value.split("-")]
+    except ValueError:
+        return None
+    if start is None or end is None:
+        return None
+    return f"{start:%H:%M}-{end:%H:%M}"
+
+
+def _version_key(event_id, event_date):
+    # 예매 신호(date)와 조회(url의 문자열)가 같은 키를 쓰도록 항상 isoformat을 사용합니다.
+    return f"availability:{event_id}:{event_date.isoformat()}:version"
+
+
+def _key(event_id, event_date, event_time=None):
+    version = get_version(_version_key(event_id, event_date))
+    if event_time is None:
+        return f"availability:{event_id}:{event_date.isoformat()}:v{version}"
+    return f"availability:{event_id}:{event_date.isoformat()}:{event_time}:v{version}"
+
+
+def get_tickets(event_id, event_date, event_time=None):
+    """
+    (공연, 날짜, 시간) 단위로 티켓의 잔여 좌석 정보를 캐시에서 조회합니다.
+    event_date는 date, event_time은 parse_event_time으로 맞춘 문자열이어야 합니다.
+    event_time이 없으면 해당 날짜의 모든 시간대를 조회합니다.
+    캐시에 없을 때만 Ticket 테이블을 조회하여 캐시를 채웁니다.
+    티켓이 아직 생성되지 않은 경우(백그라운드 생성 중)에는 빈 결과를 캐시하지 않습니다.
+    """
+    key = _key(event_id, event_date, event_time)
+    tickets = cache.get(key)
+    if tickets is None:
+        queryset = Ticket.objects.filter(event=event_id, event_date=event_date)
+        if event_time is not None:
+            queryset = queryset.filter(event_time=event_time)
+        tickets = TicketSerializer(queryset, many=True).data
+        if tickets:
+            cache.set(key, tickets, settings.TICKET_AVAILABILITY_TIMEOUT)
+    return tickets
+
+
+def invalidate(event_id, event_date):
+    """
+    예매, 취소, 티켓 수정이 일어난 날짜의 잔여 좌석 캐시를 무효화합니다.
+    커밋 전후로 버전을 올리기 때문에 실제보다 많은 잔여 좌석이 캐시에 남지 않습니다.
+    """
+    bump_version_on_commit(_version_key(event_id, event_date))
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from config.cache import bump_version_on_commit, get_version, incr_counter
+
+HITS_KEY = "event_detail:hits"
+MISSES_KEY = "event_detail:misses"
+
+
+def _version_key(event_id):
+    return f"event_detail:{event_id}:version"
+
+
+def get_or_build(event_id, build):
+    """
+    공연 상세 응답을 공연별 버전 번호가 포함된 키로 캐시합니다.
+    캐시에 없으면 build()로 응답 데이터를 만들어 저장합니다.
+    """
+    key = f"event_detail:{event_id}:v{get_version(_version_key(event_id))}"
+    data = cache.get(key)
+    if data is None:
+        incr_counter(MISSES_KEY)
+        data = build()
+        cache.set(key, data, settings.EVENT_DETAIL_CACHE_TIMEOUT)
+    else:
+        incr_counter(HITS_KEY)
+    return data
+
+
+def invalidate(event_id):
+    """
+    공연, 리뷰, 티켓, 좋아요, 북마크가 바뀌면 공연의 버전을 올려 이전 응답을 무효화합니다.
+    """
+    bump_version_on_commit(_version_key(event_id))
+
+
+def stats():
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+    }
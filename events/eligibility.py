@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from config.cache import bump_version_on_commit, get_version
+from events.models import TicketBooking
+
+
+def _version_key(user_id):
+    return f"eligibility:events:{user_id}:version"
+
+
+def reviewable_event_ids(user):
+    """
+    회원이 후기를 작성할 수 있는(티켓을 예매한) 공연 id 집합을 캐시에서 조회합니다.
+    캐시에 없을 때만 (author, ticket) 인덱스를 따라 예매 내역과 티켓을 JOIN 하는 쿼리 한 번으로 채웁니다.
+    """
+    key = f"eligibility:events:{user.id}:v{get_version(_version_key(user.id))}"
+    event_ids = cache.get(key)
+    if event_ids is None:
+        event_ids = set(
+            TicketBooking.objects.filter(author=user)
+            .values_list("ticket__event_id", flat=True)
+            .distinct()
+        )
+        cache.set(key, event_ids, settings.EVENT_REVIEW_ELIGIBILITY_TIMEOUT)
+    return event_ids
+
+
+def can_review(user, event_id):
+    return event_id in reviewable_event_ids(user)
+
+
+def reviewable(user, event_ids):
+    """
+    event_ids 중 회원이 후기를 작성할 수 있는 공연 id 집합을 반환합니다. (공연 목록의 "후기 작성" 표시용)
+    """
+    return reviewable_event_ids(user).intersection(event_ids)
+
+
+def invalidate(user_id):
+    """
+    예매/예매 취소가 일어난 회원의 캐시를 무효화합니다.
+    """
+    bump_version_on_commit(_version_key(user_id))
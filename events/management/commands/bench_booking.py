@@ -0,0 +1,91 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from events.models import Event, Ticket, TicketBooking
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    하나의 티켓에 동시 예매 요청을 보내 처리량과 초과 예매 수를 측정합니다.
+    초과 예매(oversell)는 항상 0이어야 합니다.
+    SQLite는 동시 쓰기를 지원하지 않으므로 PostgreSQL 환경에서 실행해야 합니다.
+
+    python manage.py bench_booking --requests 500 --workers 50 --seats 300
+    """
+
+    help = "하나의 티켓에 동시 예매를 보내 처리량과 초과 예매 수를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=50)
+        parser.add_argument("--seats", type=int, default=300)
+        parser.add_argument("--quantity", type=int, default=1)
+        parser.add_argument("--keep", action="store_true", help="측정 데이터를 삭제하지 않습니다.")
+
+    def handle(self, *args, **options):
+        user, _ = User.objects.get_or_create(
+            email="bench_booking@gwolnadri.local",
+            defaults={"username": "bench_booking"},
+        )
+        now = timezone.now()
+        event = Event.objects.create(
+            author=user,
+            title="bench_booking",
+            content="bench_booking",
+            event_start_date=now,
+            event_end_date=now + timedelta(hours=1),
+            time_slots={"1": "19:00-20:00"},
+            max_booking=options["seats"],
+            money=1000,
+        )
+        ticket = Ticket.objects.filter(event=event).first()
+        quantity = options["quantity"]
+
+        def book(_):
+            try:
+                return ticket.book(user, quantity) is not None
+            except Exception:
+                return None
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            results = list(executor.map(book, range(options["requests"])))
+        elapsed = time.perf_counter() - started
+
+        ticket.refresh_from_db()
+        booked = sum(
+            TicketBooking.objects.filter(ticket=ticket).values_list(
+                "quantity", flat=True
+            )
+        )
+        oversell = max(0, booked - ticket.max_booking_count)
+        lost = booked - ticket.current_booking
+
+        self.stdout.write(f"requests   : {len(results)}")
+        self.stdout.write(f"workers    : {options['workers']}")
+        self.stdout.write(f"elapsed    : {elapsed:.3f}s")
+        self.stdout.write(f"throughput : {len(results) / elapsed:.1f} req/s")
+        self.stdout.write(f"booked     : {results.count(True)}")
+        self.stdout.write(f"rejected   : {results.count(False)}")
+        self.stdout.write(f"errors     : {results.count(None)}")
+        self.stdout.write(
+            f"seats      : {ticket.current_booking}/{ticket.max_booking_count}"
+        )
+        self.stdout.write(f"oversell   : {oversell}")
+        self.stdout.write(f"lost       : {lost}")
+
+        if not options["keep"]:
+            event.delete()
+
+        if oversell or lost:
+            self.stderr.write(self.style.ERROR("초과 예매가 발생했습니다."))
+        else:
+            self.stdout.write(self.style.SUCCESS("초과 예매 0건"))
@@ -0,0 +1,528 @@
+import json
+import random
+import statistics
+import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.cache import bench_cache
+from events.models import Event, EventReview, Ticket, TicketBooking
+from stores.models import Hanbok, HanbokComment, Store
+from users.models import User
+
+BENCH_DOMAIN = "bench.gwolnadri.local"
+TIME_SLOTS = ("10:00-11:00", "14:00-15:00", "19:00-20:00", "20:00-21:00")
+TAGS = ("경복궁", "창덕궁", "덕수궁", "창경궁", "경희궁", "당의", "철릭", "단령", "대여", "촬영")
+ENDPOINTS = (
+    "event_list",
+    "event_detail",
+    "ticket_date_detail",
+    "booking_ticket",
+    "store_list",
+    "store_detail",
+    "me",
+)
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def percentile(quantiles, p):
+    return round(quantiles[p - 1] * 1000, 3)
+
+
+class Command(BaseCommand):
+    """
+    측정용 데이터(회원 10만 명, 공연 수천 건, 티켓 수백만 건, 예매 10만 건, 한복집)를 DB에 만들고
+    주요 API의 응답 시간 백분위(p50/p90/p99)와 처리량(req/s)을 측정해 JSON 파일로 저장합니다.
+    --compare로 이전 커밋의 결과 파일을 넘기면 변화율을 함께 출력합니다.
+
+    측정용 데이터는 처음 실행할 때 한 번만 만들고 이후 실행에서 재사용합니다(--reseed로 다시 생성).
+    예매(booking_ticket)는 실제로 예매를 저장하므로 실행할수록 예매 수가 늘어납니다.
+    운영 DB가 아닌 측정 전용 DB에서 실행해야 하며, 데이터 삭제(--cleanup)는 티켓 수만큼 오래 걸리므로
+    측정 DB를 통째로 지우는 편이 빠릅니다.
+
+    python manage.py bench_endpoints --concurrency 4 --output bench/HEAD.json
+    python manage.py bench_endpoints --compare bench/main.json --output bench/HEAD.json
+    python manage.py bench_endpoints --users 1000 --events 50 --days 30 --bookings 1000
+    """
+
+    help = "측정용 데이터를 만들고 주요 API의 응답 시간 백분위와 처리량을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100000)
+        parser.add_argument("--events", type=int, default=2000)
+        parser.add_argument("--days", type=int, default=180, help="공연 기간(일)")
+        parser.add_argument("--slots", type=int, default=3, help="하루 회차 수")
+        parser.add_argument("--bookings", type=int, default=100000)
+        parser.add_argument("--stores", type=int, default=500)
+        parser.add_argument("--auth-users", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--warmup", type=int, default=50)
+        parser.add_argument("--concurrency", type=int, default=1)
+        parser.add_argument("--only", nargs="+", choices=ENDPOINTS)
+        parser.add_argument("--output", default="bench_endpoints.json")
+        parser.add_argument("--compare", help="비교할 이전 결과 파일")
+        parser.add_argument("--reseed", action="store_true")
+        parser.add_argument(
+            "--cleanup", action="store_true", help="측정용 데이터를 삭제하고 종료합니다."
+        )
+
+    def handle(self, *args, **options):
+        if options["cleanup"] or options["reseed"]:
+            self.cleanup()
+            if options["cleanup"]:
+                return
+        bench_users = User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}")
+        if not bench_users.exists():
+            started = time.perf_counter()
+            self.seed(options)
+            self.stdout.write(f"seed       : {time.perf_counter() - started:.1f}s")
+
+        rng = random.Random(1)
+        self.load_targets(options, rng)
+        results = {}
+        with bench_cache():
+            for name in options["only"] or ENDPOINTS:
+                make_request = getattr(self, f"request_{name}")
+                self.run(make_request, options["warmup"], 1, rng)
+                results[name] = self.run(
+                    make_request, options["requests"], options["concurrency"], rng
+                )
+                self.report(name, results[name])
+
+        artifact = {
+            "commit": self.commit(),
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "requests": options["requests"],
+            "concurrency": options["concurrency"],
+            "seed": self.seed_counts(),
+            "results": results,
+        }
+        with open(options["output"], "w") as f:
+            json.dump(artifact, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"결과를 {options['output']}에 저장했습니다."))
+        if options["compare"]:
+            self.compare(options["compare"], results)
+
+    # 측정용 데이터
+
+    def seed(self, options):
+        rng = random.Random(0)
+        batch_size = options["batch_size"]
+        password = make_password(None)
+        User.objects.bulk_create(
+            (
+                User(
+                    email=f"user{i}@{BENCH_DOMAIN}",
+                    username=f"bench{i}",
+                    password=password,
+                )
+                for i in range(options["users"])
+            ),
+            batch_size=batch_size,
+        )
+        user_ids = list(
+            User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if not user_ids:
+            raise CommandError("--users는 1 이상이어야 합니다.")
+        auth_user_ids = user_ids[: options["auth_users"]]
+        self.stdout.write(f"users      : {len(user_ids)}")
+
+        events = self.seed_events(options, rng, user_ids)
+        self.seed_tickets(options, rng, user_ids, events)
+        stores = self.seed_stores(options, rng, user_ids)
+
+        # 인증 요청에 사용하는 회원은 공연/한복집을 10개씩 북마크합니다(Me 응답).
+        for model, relation, objects in (
+            (Event, Event.event_bookmarks, events),
+            (Store, Store.store_bookmarks, stores),
+        ):
+            self.add_relations(
+                relation,
+                [
+                    (obj.id, user_id)
+                    for user_id in auth_user_ids
+                    for obj in rng.sample(objects, min(10, len(objects)))
+                ],
+                batch_size,
+            )
+            source = relation.field.m2m_field_name() + "_id"
+            counts = Counter(relation.through.objects.values_list(source, flat=True))
+            for obj in objects:
+                obj.bookmark_count = counts[obj.id]
+            model.objects.bulk_update(
+                objects, ["bookmark_count"], batch_size=batch_size
+            )
+
+    def seed_events(self, options, rng, user_ids):
+        batch_size = options["batch_size"]
+        today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        time_slots = {
+            str(i + 1): slot for i, slot in enumerate(TIME_SLOTS[: options["slots"]])
+        }
+        likes = [
+            rng.sample(user_ids, min(rng.randint(0, 20), len(user_ids)))
+            for _ in range(options["events"])
+        ]
+        grades = [
+            [rng.randint(1, 5) for _ in range(rng.randint(0, 10))]
+            for _ in range(options["events"])
+        ]
+        events = Event.objects.bulk_create(
+            (
+                Event(
+                    author_id=user_ids[0],
+                    title=f"bench 공연{i}",
+                    content="경복궁 야간관람 " * 20,
+                    event_start_date=today,
+                    event_end_date=today + timedelta(days=options["days"] - 1),
+                    time_slots=time_slots,
+                    max_booking=1000,
+                    money=rng.choice((1000, 3000, 5000)),
+                    # 티켓은 seed_tickets에서 직접 bulk insert 합니다.
+                    ticket_status=Event.TICKET_READY,
+                    like_count=len(likes[i]),
+                    review_count=len(grades[i]),
+                    rating_sum=sum(grades[i]),
+                    rating_count=len(grades[i]),
+                )
+                for i in range(options["events"])
+            ),
+            batch_size=batch_size,
+        )
+        self.add_relations(
+            Event.likes,
+            [
+                (event.id, user_id)
+                for event, users in zip(events, likes)
+                for user_id in users
+            ],
+            batch_size,
+        )
+        EventReview.objects.bulk_create(
+            (
+                EventReview(
+                    author_id=rng.choice(user_ids),
+                    event_id=event.id,
+                    content="좋아요",
+                    grade=grade,
+                )
+                for event, event_grades in zip(events, grades)
+                for grade in event_grades
+            ),
+            batch_size=batch_size,
+        )
+        self.stdout.write(f"events     : {len(events)}")
+        return events
+
+    def seed_tickets(self, options, rng, user_ids, events):
+        """
+        티켓을 만들기 전에 예매할 티켓을 먼저 골라 current_booking을 예매 수와 맞춥니다.
+        """
+        days, slots = options["days"], options["slots"]
+        total = len(events) * days * slots
+        if not total:
+            return
+        booked = Counter(rng.randrange(total) for _ in range(options["bookings"]))
+
+        def tickets():
+            for event in events:
+                for day in range(days):
+                    event_date = (event.event_start_date + timedelta(days=day)).date()
+                    for slot in TIME_SLOTS[:slots]:
+                        yield Ticket(
+                            author_id=event.author_id,
+                            event_id=event.id,
+                            event_date=event_date,
+                            event_time=slot,
+                            max_booking_count=event.max_booking,
+                            money=event.money,
+                        )
+
+        index = 0
+        for chunk in chunked(tickets(), options["batch_size"]):
+            for ticket in chunk:
+                ticket.current_booking = booked[index]
+                index += 1
+            created = Ticket.objects.bulk_create(chunk)
+            TicketBooking.objects.bulk_create(
+                TicketBooking(
+                    author_id=rng.choice(user_ids),
+                    ticket_id=ticket.id,
+                    money=ticket.money,
+                    quantity=1,
+                )
+                for ticket in created
+                for _ in range(ticket.current_booking)
+            )
+        self.stdout.write(f"tickets    : {total}")
+        self.stdout.write(f"bookings   : {options['bookings']}")
+
+    def seed_stores(self, options, rng, user_ids):
+        batch_size = options["batch_size"]
+        likes = [
+            rng.sample(user_ids, min(rng.randint(0, 20), len(user_ids)))
+            for _ in range(options["stores"])
+        ]
+        grades = [
+            [rng.randint(1, 5) for _ in range(rng.randint(0, 10))]
+            for _ in range(options["stores"])
+        ]
+        stores = Store.objects.bulk_create(
+            (
+                Store(
+                    owner_id=user_ids[0],
+                    store_name=f"bench 한복집{i}",
+                    store_address=f"{BENCH_DOMAIN} 서울 종로구 {i}",
+                    location_x=rng.uniform(126.8, 127.2),
+                    location_y=rng.uniform(37.4, 37.7),
+                    like_count=len(likes[i]),
+                    review_count=len(grades[i]),
+                    rating_sum=sum(grades[i]),
+                    rating_count=len(grades[i]),
+                )
+                for i in range(options["stores"])
+            ),
+            batch_size=batch_size,
+        )
+        self.add_relations(
+            Store.likes,
+            [
+                (store.id, user_id)
+                for store, users in zip(stores, likes)
+                for user_id in users
+            ],
+            batch_size,
+        )
+        Hanbok.objects.bulk_create(
+            (
+                Hanbok(
+                    store_id=store.id,
+                    owner_id=user_ids[0],
+                    hanbok_name=name,
+                    hanbok_description=f"{name} 대여",
+                    hanbok_price=rng.choice((20000, 30000, 50000)),
+                )
+                for store in stores
+                for name in ("당의", "철릭", "단령")
+            ),
+            batch_size=batch_size,
+        )
+        HanbokComment.objects.bulk_create(
+            (
+                HanbokComment(
+                    store_id=store.id,
+                    user_id=rng.choice(user_ids),
+                    content="예뻐요",
+                    grade=grade,
+                )
+                for store, store_grades in zip(stores, grades)
+                for grade in store_grades
+            ),
+            batch_size=batch_size,
+        )
+        for store in stores:
+            store.tags.add(*rng.sample(TAGS, 3))
+        self.stdout.write(f"stores     : {len(stores)}")
+        return stores
+
+    def add_relations(self, relation, pairs, batch_size):
+        through = relation.through
+        source = relation.field.m2m_field_name() + "_id"
+        target = relation.field.m2m_reverse_field_name() + "_id"
+        through.objects.bulk_create(
+            (through(**{source: obj_id, target: user_id}) for obj_id, user_id in pairs),
+            batch_size=batch_size,
+        )
+
+    def seed_counts(self):
+        events = Event.objects.filter(author__email__endswith=f"@{BENCH_DOMAIN}")
+        tickets = Ticket.objects.filter(author__email__endswith=f"@{BENCH_DOMAIN}")
+        return {
+            "users": User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}").count(),
+            "events": events.count(),
+            "tickets": tickets.count(),
+            "bookings": TicketBooking.objects.filter(ticket__in=tickets).count(),
+            "stores": Store.objects.filter(
+                store_address__startswith=BENCH_DOMAIN
+            ).count(),
+        }
+
+    def cleanup(self):
+        users = User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}")
+        TicketBooking.objects.filter(author__in=users).delete()
+        Ticket.objects.filter(author__in=users).delete()
+        Store.objects.filter(owner__in=users).delete()
+        Event.objects.filter(author__in=users).delete()
+        users.delete()
+
+    # 측정
+
+    def load_targets(self, options, rng):
+        users = list(
+            User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}").order_by("id")[
+                : options["auth_users"]
+            ]
+        )
+        if not users:
+            raise CommandError("측정용 회원이 없습니다. --reseed로 다시 생성해 주세요.")
+        self.tokens = []
+        for user in users:
+            token = RefreshToken.for_user(user)
+            token["email"] = user.email
+            self.tokens.append(f"Bearer {token.access_token}")
+        self.event_ids = list(
+            Event.objects.filter(author__in=users[:1]).values_list("id", flat=True)
+        )
+        tickets = Ticket.objects.filter(event_id__in=self.event_ids)
+        self.ticket_dates = list(
+            tickets.filter(event_time=TIME_SLOTS[0])
+            .order_by("?")
+            .values_list("event_id", "event_date")[:1000]
+        )
+        self.ticket_ids = list(
+            tickets.filter(current_booking__lt=500)
+            .order_by("?")
+            .values_list("id", flat=True)[:1000]
+        )
+        self.store_ids = list(
+            Store.objects.filter(owner__in=users[:1]).values_list("id", flat=True)
+        )
+
+    def request_event_list(self, client, rng):
+        return client.get(reverse("event_view"))
+
+    def request_event_detail(self, client, rng):
+        return client.get(
+            reverse("event_detail_view", args=[rng.choice(self.event_ids)])
+        )
+
+    def request_ticket_date_detail(self, client, rng):
+        event_id, event_date = rng.choice(self.ticket_dates)
+        return client.get(
+            reverse("ticket_date_detail_view", args=[event_id, str(event_date)]),
+            HTTP_AUTHORIZATION=rng.choice(self.tokens),
+        )
+
+    def request_booking_ticket(self, client, rng):
+        return client.post(
+            reverse("booking_ticket_view", args=[rng.choice(self.ticket_ids)]),
+            {"quantity": 1},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=rng.choice(self.tokens),
+        )
+
+    def request_store_list(self, client, rng):
+        return client.get(reverse("store_list"))
+
+    def request_store_detail(self, client, rng):
+        return client.get(
+            reverse("store_detail_view", args=[rng.choice(self.store_ids)])
+        )
+
+    def request_me(self, client, rng):
+        return client.get(
+            reverse("profile_view"), HTTP_AUTHORIZATION=rng.choice(self.tokens)
+        )
+
+    def run(self, make_request, total, concurrency, rng):
+        """
+        concurrency개 스레드가 total개의 요청을 나누어 보내고 요청별 응답 시간을 잽니다.
+        """
+        seeds = [rng.random() for _ in range(concurrency)]
+
+        def worker(n):
+            client = Client(HTTP_HOST="localhost")
+            worker_rng = random.Random(seeds[n])
+            latencies, errors = [], 0
+            try:
+                for _ in range(n, total, concurrency):
+                    started = time.perf_counter()
+                    response = make_request(client, worker_rng)
+                    latencies.append(time.perf_counter() - started)
+                    if response.status_code >= 400:
+                        errors += 1
+            finally:
+                if concurrency > 1:
+                    connection.close()
+            return latencies, errors
+
+        started = time.perf_counter()
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(worker, range(concurrency)))
+        else:
+            results = [worker(0)]
+        elapsed = time.perf_counter() - started
+
+        latencies = [latency for result, _ in results for latency in result]
+        if len(latencies) < 2:
+            return {"requests": len(latencies)}
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        return {
+            "requests": len(latencies),
+            "errors": sum(errors for _, errors in results),
+            "p50_ms": percentile(quantiles, 50),
+            "p90_ms": percentile(quantiles, 90),
+            "p99_ms": percentile(quantiles, 99),
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+            "max_ms": round(max(latencies) * 1000, 3),
+            "throughput_rps": round(len(latencies) / elapsed, 1),
+        }
+
+    def report(self, name, result):
+        if "p50_ms" not in result:
+            return
+        self.stdout.write(
+            f"{name:>18}: p50 {result['p50_ms']:8.2f}ms  p90 {result['p90_ms']:8.2f}ms"
+            f"  p99 {result['p99_ms']:8.2f}ms  {result['throughput_rps']:8.1f} req/s"
+            f"  errors {result['errors']}"
+        )
+
+    def compare(self, path, results):
+        with open(path) as f:
+            previous = json.load(f)
+        self.stdout.write(f"[{previous.get('commit') or path} 대비]")
+        for name, result in results.items():
+            before = previous["results"].get(name)
+            if not before or "p50_ms" not in before or "p50_ms" not in result:
+                continue
+            changes = "  ".join(
+                f"{key} {(result[key] - before[key]) / before[key] * 100:+.1f}%"
+                for key in ("p50_ms", "p99_ms", "throughput_rps")
+                if before[key]
+            )
+            self.stdout.write(f"{name:>18}: {changes}")
+
+    def commit(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
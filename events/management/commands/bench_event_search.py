@@ -0,0 +1,101 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.models import Event
+from events.search import index_events, rank
+from users.models import User
+
+WORDS = [
+    "경복궁", "창덕궁", "덕수궁", "창경궁", "경희궁", "종묘", "야간", "관람",
+    "달빛", "기행", "별빛", "야행", "궁중", "음식", "체험", "한복", "국악",
+    "공연", "전통", "문화", "축제", "산책", "해설", "수라간", "생과방",
+]
+RARE_TITLE = "무형문화재 줄타기 특별공연"
+
+
+class Command(BaseCommand):
+    """
+    공연 수를 늘려가며 n-gram 색인 검색과 icontains(LIKE '%...%') 검색의 조회 시간을 비교합니다.
+    드문 제목의 공연은 처음에 10건만 넣어, 결과 수는 같고 테이블 크기만 커지는 상황을 측정합니다.
+    측정용 공연은 마지막에 삭제됩니다.
+
+    python manage.py bench_event_search --sizes 1000 10000 100000
+    """
+
+    help = "공연 수에 따른 n-gram 색인 검색과 icontains 검색 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[1000, 10000, 100000]
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        user, _ = User.objects.get_or_create(
+            email="bench_search@gwolnadri.local",
+            defaults={"username": "bench_search"},
+        )
+        rng = random.Random(0)
+        now = timezone.now()
+        created = 0
+
+        self.stdout.write(f"{'events':>8} {'ngram(ms)':>10} {'icontains(ms)':>14}")
+        try:
+            for size in sorted(options["sizes"]):
+                rare = 0 if created else 10
+                events = [
+                    Event(
+                        author=user,
+                        title=" ".join(rng.sample(WORDS, 3)),
+                        content=" ".join(rng.sample(WORDS, 6)),
+                        event_start_date=now,
+                        event_end_date=now,
+                        time_slots={},
+                        max_booking=1,
+                        money=0,
+                        ticket_status=Event.TICKET_READY,
+                    )
+                    for _ in range(size - created - rare)
+                ]
+                events += [
+                    Event(
+                        author=user,
+                        title=RARE_TITLE,
+                        content=" ".join(rng.sample(WORDS, 6)),
+                        event_start_date=now,
+                        event_end_date=now,
+                        time_slots={},
+                        max_booking=1,
+                        money=0,
+                        ticket_status=Event.TICKET_READY,
+                    )
+                    for _ in range(rare)
+                ]
+                # bulk_create는 post_save 신호가 없으므로 색인을 직접 만듭니다.
+                for i in range(0, len(events), 5000):
+                    index_events(Event.objects.bulk_create(events[i : i + 5000]))
+                created = size
+
+                ngram = self.measure(
+                    lambda: list(rank("줄타기 특별공연")[:20]), options["repeat"]
+                )
+                icontains = self.measure(
+                    lambda: list(
+                        Event.objects.filter(title__icontains="줄타기 특별공연")
+                        .values_list("id", flat=True)[:20]
+                    ),
+                    options["repeat"],
+                )
+                self.stdout.write(f"{size:>8} {ngram:>10.2f} {icontains:>14.2f}")
+        finally:
+            Event.objects.filter(author=user).delete()
+
+    def measure(self, func, repeat):
+        func()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - started) / repeat * 1000
@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from django.utils import timezone
+from PIL import Image
+
+from config.images import variant_name
+from events.models import Event
+from events.pagination import EventCursorPagination
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    공연 목록 한 페이지가 내려받게 하는 이미지 용량을 원본과 변환본(thumb WebP/JPEG)으로 비교합니다.
+    임시 MEDIA_ROOT에 사진 크기의 이미지를 올리고, 측정용 회원과 공연은 마지막에 삭제됩니다.
+
+    python manage.py bench_image_variants --width 3000 --height 2000
+    """
+
+    help = "공연 목록 한 페이지의 이미지 용량을 원본과 변환본으로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--width", type=int, default=3000)
+        parser.add_argument("--height", type=int, default=2000)
+
+    def image(self, seed):
+        size = (self.width, self.height)
+        noise = Image.effect_noise(size, 40 + seed)
+        gradient = Image.linear_gradient("L").resize(size)
+        image = Image.merge("RGB", (noise, gradient, gradient.rotate(90)))
+        buffer = BytesIO()
+        image.save(buffer, "JPEG", quality=90)
+        return SimpleUploadedFile(f"bench_{seed}.jpg", buffer.getvalue(), "image/jpeg")
+
+    def handle(self, *args, **options):
+        self.width, self.height = options["width"], options["height"]
+        page_size = EventCursorPagination.page_size
+        media_root = tempfile.mkdtemp()
+        user = User.objects.create_user(
+            email="bench_image@gwolnadri.local", username="bench_image", password="bench"
+        )
+        try:
+            with override_settings(MEDIA_ROOT=media_root, BACKGROUND_TASKS_EAGER=True):
+                now = timezone.now()
+                events = [
+                    Event.objects.create(
+                        author=user,
+                        title=f"bench_image{i}",
+                        content="",
+                        image=self.image(i),
+                        event_start_date=now,
+                        event_end_date=now,
+                        time_slots={},
+                        max_booking=1,
+                        money=0,
+                    )
+                    for i in range(page_size)
+                ]
+                names = [event.image.name for event in events]
+                sizes = {"original": sum(default_storage.size(n) for n in names)}
+                for variant in settings.IMAGE_VARIANTS:
+                    for extension in ("webp", "jpeg"):
+                        sizes[f"{variant}.{extension}"] = sum(
+                            default_storage.size(variant_name(n, variant, extension))
+                            for n in names
+                        )
+            for name, size in sizes.items():
+                ratio = size / sizes["original"] * 100
+                self.stdout.write(
+                    f"{name:>12}: {size / 1024:,.0f} KiB / page ({page_size}건, {ratio:.1f}%)"
+                )
+        finally:
+            user.delete()
+            shutil.rmtree(media_root)
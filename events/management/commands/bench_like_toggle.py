@@ -0,0 +1,73 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.models import Event
+from users.models import User
+from users.relations import set_relation
+
+
+class Command(BaseCommand):
+    """
+    좋아요가 많이 쌓인 공연에서 좋아요 토글 시간을 측정합니다.
+    기존 방식(request.user in event.likes.all())과 through 테이블 인덱스 조회 방식을 비교합니다.
+    측정용 회원과 공연은 마지막에 삭제됩니다.
+
+    python manage.py bench_like_toggle --likes 100000
+    """
+
+    help = "좋아요가 많은 공연에서 좋아요 토글 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--likes", type=int, default=100000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        prefix = "bench_like"
+        User.objects.bulk_create(
+            [
+                User(email=f"{prefix}{i}@gwolnadri.local", username=f"{prefix}{i}")
+                for i in range(options["likes"] + 1)
+            ],
+            batch_size=5000,
+        )
+        users = list(
+            User.objects.filter(username__startswith=prefix).order_by("id")
+        )
+        user = users.pop()
+        now = timezone.now()
+        event = Event.objects.create(
+            author=user,
+            title=prefix,
+            content=prefix,
+            event_start_date=now,
+            event_end_date=now,
+            time_slots={},
+            max_booking=1,
+            money=0,
+        )
+        try:
+            Event.likes.through.objects.bulk_create(
+                [Event.likes.through(event_id=event.id, user_id=u.id) for u in users],
+                batch_size=5000,
+            )
+
+            def legacy():
+                if user in event.likes.all():
+                    event.likes.remove(user)
+                else:
+                    event.likes.add(user)
+
+            def indexed():
+                set_relation(event.likes, user)
+
+            for name, func in (("legacy", legacy), ("indexed", indexed)):
+                started = time.perf_counter()
+                for _ in range(options["repeat"]):
+                    func()
+                elapsed = (time.perf_counter() - started) / options["repeat"] * 1000
+                self.stdout.write(f"{name:>8}: {elapsed:.2f}ms / toggle")
+        finally:
+            event.delete()
+            User.objects.filter(username__startswith=prefix).delete()
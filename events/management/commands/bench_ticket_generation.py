@@ -0,0 +1,74 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.models import Event, Ticket, build_tickets, generate_tickets
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    1일, 30일, 365일 공연의 티켓 생성 시간을 비교합니다.
+    row 단위 INSERT(기존 방식)와 chunk 단위 bulk INSERT를 각각 측정합니다.
+    측정용 회원은 마지막에 삭제됩니다.
+
+    python manage.py bench_ticket_generation --slots 6
+    """
+
+    help = "공연 기간별 티켓 생성 시간을 row 단위 INSERT와 bulk INSERT로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, nargs="+", default=[1, 30, 365])
+        parser.add_argument("--slots", type=int, default=6)
+
+    def handle(self, *args, **options):
+        user, _ = User.objects.get_or_create(
+            email="bench_ticket@gwolnadri.local",
+            defaults={"username": "bench_ticket"},
+        )
+        time_slots = {
+            str(i + 1): f"{9 + i:02d}:00-{10 + i:02d}:00"
+            for i in range(options["slots"])
+        }
+
+        self.stdout.write(f"{'days':>6} {'tickets':>8} {'row(s)':>10} {'bulk(s)':>10}")
+        try:
+            for days in options["days"]:
+                start = timezone.now()
+                event = Event.objects.create(
+                    author=user,
+                    title="bench_ticket",
+                    content="bench_ticket",
+                    event_start_date=start,
+                    event_end_date=start,
+                    time_slots=time_slots,
+                    max_booking=100,
+                    money=1000,
+                )
+                # 신호로 생성된 1일치 티켓을 지우고 기간만 늘려 두 방식을 같은 조건에서 측정합니다.
+                Event.objects.filter(id=event.id).update(
+                    event_end_date=start + timedelta(days=days - 1)
+                )
+                event.refresh_from_db()
+
+                Ticket.objects.filter(event=event).delete()
+                started = time.perf_counter()
+                for ticket in build_tickets(event):
+                    ticket.save()
+                row_elapsed = time.perf_counter() - started
+
+                Ticket.objects.filter(event=event).delete()
+                started = time.perf_counter()
+                generate_tickets(event.id)
+                bulk_elapsed = time.perf_counter() - started
+
+                count = Ticket.objects.filter(event=event).count()
+                self.stdout.write(
+                    f"{days:>6} {count:>8} {row_elapsed:>10.3f} {bulk_elapsed:>10.3f}"
+                )
+                event.delete()
+        finally:
+            # 측정용 회원을 지우면 남은 공연과 티켓도 함께 삭제됩니다.
+            user.delete()
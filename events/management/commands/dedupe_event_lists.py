@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from events.models import EventList, SearchGram
+
+
+class Command(BaseCommand):
+    """
+    (제목, 시작일, 장소)가 같은 크롤링 공연을 하나로 합칩니다. 시작일이 없는 공연은 (제목, 장소)로 합칩니다.
+    가장 먼저 저장된 행을 남기고 가장 최근 행의 종료일/이미지로 갱신하며,
+    다른 행을 참조하던 외래 키는 남긴 행으로 옮긴 뒤 나머지 행을 삭제합니다.
+    eventlist_natural_key 제약을 추가하는 migrate 전에 실행해야 합니다.
+
+    python manage.py dedupe_event_lists --dry-run
+    python manage.py dedupe_event_lists
+    """
+
+    help = "중복된 크롤링 공연을 합칩니다. 유니크 제약을 추가하기 전에 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        # GROUP BY는 NULL 시작일도 하나의 그룹으로 묶습니다.
+        groups = (
+            EventList.objects.values("title", "start_date", "venue")
+            .annotate(count=Count("id"))
+            .filter(count__gt=1)
+        )
+        merged = deleted = 0
+        for group in groups.iterator():
+            with transaction.atomic():
+                rows = list(
+                    EventList.objects.select_for_update()
+                    .filter(
+                        title=group["title"],
+                        start_date=group["start_date"],
+                        venue=group["venue"],
+                    )
+                    .order_by("id")
+                )
+                if len(rows) < 2:
+                    continue
+                keep, latest, duplicates = rows[0], rows[-1], rows[1:]
+                merged += 1
+                deleted += len(duplicates)
+                if options["dry_run"]:
+                    continue
+                self.merge(keep, latest, duplicates)
+
+        prefix = "[dry-run] " if options["dry_run"] else ""
+        self.stdout.write(f"{prefix}중복 공연 {merged}건, 삭제할 행 {deleted}개")
+
+    def merge(self, keep, latest, duplicates):
+        ids = [row.id for row in duplicates]
+        for relation in EventList._meta.related_objects:
+            if relation.related_model is SearchGram:
+                # 검색 색인은 중복 행과 함께 지워지고, 남긴 행은 저장할 때 다시 색인됩니다.
+                continue
+            relation.related_model._base_manager.filter(
+                **{f"{relation.field.name}__in": ids}
+            ).update(**{relation.field.name: keep})
+        EventList.objects.filter(id__in=ids).delete()
+        keep.end_date, keep.image = latest.end_date, latest.image
+        keep.save(update_fields=["end_date", "image"])
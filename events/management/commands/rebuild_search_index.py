@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from events.models import Event, EventList
+from events.search import index_event_lists, index_events
+
+
+class Command(BaseCommand):
+    """
+    공연/크롤링 공연 검색용 n-gram 색인을 처음부터 다시 만듭니다.
+    bulk insert 처럼 신호가 발생하지 않는 경로로 데이터를 넣은 뒤에 실행합니다.
+    """
+
+    help = "공연 검색용 n-gram 색인을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        targets = (
+            (Event.objects.only("id", "title", "content"), index_events),
+            (EventList.objects.only("id", "title"), index_event_lists),
+        )
+        for queryset, index in targets:
+            queryset = queryset.order_by("id")
+            total = 0
+            last_id = 0
+            while True:
+                batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+                if not batch:
+                    break
+                index(batch)
+                total += len(batch)
+                last_id = batch[-1].id
+            self.stdout.write(f"{queryset.model.__name__}: {total}건 색인 완료")
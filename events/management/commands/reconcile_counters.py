@@ -0,0 +1,92 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from config import etags
+from events import detail_cache
+from events.models import Event, EventReview
+from stores.models import HanbokComment, Store
+
+
+def _aggregate(queryset, field, aggregate):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(value=aggregate)
+            .values("value"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def _expected(model, likes, bookmarks, reviews, target):
+    return {
+        "like_count": _aggregate(
+            getattr(model, likes).through.objects.all(), target, Count("*")
+        ),
+        "bookmark_count": _aggregate(
+            getattr(model, bookmarks).through.objects.all(), target, Count("*")
+        ),
+        "review_count": _aggregate(reviews.objects.all(), target, Count("*")),
+        "rating_count": _aggregate(reviews.objects.all(), target, Count("grade")),
+        "rating_sum": _aggregate(reviews.objects.all(), target, Sum("grade")),
+    }
+
+
+class Command(BaseCommand):
+    """
+    Event, Store에 저장된 좋아요/북마크/리뷰 집계 값을 실제 데이터와 비교하여 보정합니다.
+    신호를 거치지 않고 데이터를 바꾼 경우(bulk insert, 직접 SQL 등)에 실행합니다.
+
+    python manage.py reconcile_counters --dry-run
+    """
+
+    help = "공연/한복점의 좋아요, 북마크, 리뷰 집계 값을 보정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="보정하지 않고 개수만 출력합니다.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        targets = (
+            (
+                Event,
+                _expected(Event, "likes", "event_bookmarks", EventReview, "event"),
+                "events",
+                detail_cache.invalidate,
+            ),
+            (
+                Store,
+                _expected(Store, "likes", "store_bookmarks", HanbokComment, "store"),
+                "stores",
+                None,
+            ),
+        )
+        for model, expected, collection, invalidate in targets:
+            drift = Q()
+            for field in expected:
+                drift |= ~Q(**{field: F(f"expected_{field}")})
+            drifted = list(
+                model.objects.only("pk", *expected)
+                .annotate(
+                    **{f"expected_{field}": value for field, value in expected.items()}
+                )
+                .filter(drift)
+            )
+            for obj in drifted:
+                for field in expected:
+                    setattr(obj, field, getattr(obj, f"expected_{field}"))
+
+            if not options["dry_run"] and drifted:
+                model.objects.bulk_update(
+                    drifted, list(expected), batch_size=options["batch_size"]
+                )
+                # bulk_update는 신호를 보내지 않으므로 목록 ETag와 상세 캐시를 직접 무효화합니다.
+                etags.touch(collection)
+                if invalidate is not None:
+                    for obj in drifted:
+                        invalidate(obj.pk)
+            self.stdout.write(f"{model.__name__}: {len(drifted)}건 보정 필요")
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from events.models import Event, generate_tickets
+
+
+class Command(BaseCommand):
+    """
+    티켓 생성에 실패했거나(failed), 생성중(pending)인 채로 --older-than분이 지난 공연의 티켓을 다시 생성합니다.
+    백그라운드 생성 중에 프로세스가 재시작되면 공연이 pending으로 남으므로 배포 후나 주기적으로 실행합니다.
+    티켓은 하나의 트랜잭션에서 생성되므로 중단된 공연에는 티켓이 남아 있지 않습니다.
+    공연마다 조건부 UPDATE로 먼저 가져가므로 여러 번 동시에 실행해도 한 번만 다시 생성하고,
+    아직 끝나지 않은 생성과 겹쳐도 (공연, 날짜, 시간) 유니크 제약으로 티켓이 중복되지 않습니다.
+
+    python manage.py regenerate_tickets --dry-run
+    python manage.py regenerate_tickets --older-than 30
+    """
+
+    help = "티켓 생성에 실패했거나 생성중으로 남은 공연의 티켓을 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=30,
+            help="이 시간(분)보다 오래 생성중인 공연만 다시 생성합니다.",
+        )
+
+    def handle(self, *args, **options):
+        started_before = timezone.now() - timedelta(minutes=options["older_than"])
+        events = list(
+            Event.objects.filter(
+                Q(ticket_status=Event.TICKET_FAILED)
+                | Q(
+                    ticket_status=Event.TICKET_PENDING,
+                    ticket_started_at__lt=started_before,
+                )
+                | Q(
+                    ticket_status=Event.TICKET_PENDING,
+                    ticket_started_at__isnull=True,
+                    created_at__lt=started_before,
+                )
+            ).values_list("id", "ticket_status", "ticket_started_at")
+        )
+        skipped = failed = 0
+        if not options["dry_run"]:
+            for event_id, ticket_status, ticket_started_at in events:
+                # 조회한 상태 그대로일 때만 가져갑니다. 다른 실행이 먼저 가져갔으면 건너뜁니다.
+                claimed = Event.objects.filter(
+                    id=event_id,
+                    ticket_status=ticket_status,
+                    ticket_started_at=ticket_started_at,
+                ).update(
+                    ticket_status=Event.TICKET_PENDING,
+                    ticket_started_at=timezone.now(),
+                )
+                if not claimed:
+                    skipped += 1
+                    continue
+                try:
+                    generate_tickets(event_id)
+                except Exception as error:
+                    failed += 1
+                    self.stderr.write(f"공연 {event_id}: 티켓 생성 실패 ({error!r})")
+        self.stdout.write(
+            f"다시 생성할 공연 {len(events)}건, 건너뜀 {skipped}건, 실패 {failed}건"
+        )
@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from events.models import ScrapedPage
+from events.scraper import FixtureFetcher, HttpFetcher, month_range, save, scrape
+
+
+class Command(BaseCommand):
+    """
+    궁능유적본부 행사 달력에서 여러 달, 여러 장소의 공연을 동시에 가져와 EventList에 저장합니다.
+    지난 실행 이후 바뀐 페이지만 파싱하고, 새로 생기거나 바뀐 공연만 저장합니다. (--full 옵션으로 모든 페이지를 다시 파싱)
+
+    python manage.py scrape_events --start 202306 --end 202312 --workers 8
+    python manage.py scrape_events --start 202306 --end 202312 --save-fixtures fixtures/
+    python manage.py scrape_events --start 202306 --end 202312 --fixture-dir fixtures/ --dry-run
+    """
+
+    help = "궁능유적본부 행사 달력의 공연을 EventList에 저장합니다."
+
+    def add_arguments(self, parser):
+        this_month = timezone.localdate().strftime("%Y%m")
+        parser.add_argument("--start", default=this_month)
+        parser.add_argument("--end", default=None)
+        parser.add_argument("--venue", action="append", dest="venues")
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--fixture-dir", default=None)
+        parser.add_argument("--save-fixtures", default=None)
+        parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument("--full", action="store_true")
+
+    def handle(self, *args, **options):
+        months = month_range(options["start"], options["end"] or options["start"])
+        if not months:
+            raise CommandError("--start는 --end보다 늦을 수 없습니다.")
+
+        if options["fixture_dir"]:
+            fetcher = FixtureFetcher(options["fixture_dir"])
+        else:
+            fetcher = HttpFetcher(
+                workers=options["workers"], save_dir=options["save_fixtures"]
+            )
+
+        pages = {}
+        if not options["full"]:
+            pages = {
+                (page.venue, page.month): page
+                for page in ScrapedPage.objects.filter(month__in=months)
+            }
+
+        started = time.perf_counter()
+        result = scrape(fetcher, months, options["venues"], options["workers"], pages)
+        scraped = time.perf_counter()
+
+        created = updated = 0
+        if not options["dry_run"]:
+            created, updated = save(result.event_lists, result.pages)
+        saved = time.perf_counter()
+
+        self.stdout.write(
+            f"페이지 {result.fetched}개(변경 없음 {result.skipped}개, 실패 {result.failed}개) "
+            f"수집 {scraped - started:.2f}s, "
+            f"공연 {len(result.event_lists)}건 중 {created}건 추가, {updated}건 수정 "
+            f"{saved - scraped:.2f}s"
+        )
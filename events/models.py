@@ -1,12 +1,36 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F, Prefetch
 from users.models import User
 from django.core.validators import MinValueValidator
 from datetime import timedelta
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from config.tasks import run_in_background
+
+
+class EventQuerySet(models.QuerySet):
+    def for_list(self):
+        """
+        공연 목록 조회용 queryset 입니다.
+        likes, event_bookmarks는 회원 id만 prefetch 하여 공연 수와 관계없이 일정한 쿼리 수로 직렬화할 수 있습니다.
+        리뷰 수, 좋아요 수는 Event에 저장된 집계 값을 사용합니다.
+        """
+        return self.prefetch_related(
+            Prefetch("likes", queryset=User.objects.only("id")),
+            Prefetch("event_bookmarks", queryset=User.objects.only("id")),
+        )
 
 
 class Event(models.Model):
+    TICKET_PENDING = "pending"
+    TICKET_READY = "ready"
+    TICKET_FAILED = "failed"
+    TICKET_STATUS_CHOICES = [
+        (TICKET_PENDING, "생성중"),
+        (TICKET_READY, "생성완료"),
+        (TICKET_FAILED, "생성실패"),
+    ]
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     title = models.CharField(max_length=50)
     content = models.TextField()
@@ -22,32 +46,83 @@ class Event(models.Model):
     event_bookmarks = models.ManyToManyField(
         User, related_name="bookmark_events", blank=True
     )
+    ticket_status = models.CharField(
+        max_length=10, choices=TICKET_STATUS_CHOICES, default=TICKET_PENDING
+    )
+    # regenerate_tickets가 티켓을 다시 생성하기 시작한 시각
+    ticket_started_at = models.DateTimeField(null=True, blank=True)
+    # 아래 값들은 신호로 갱신되는 집계 값입니다. (reconcile_counters로 보정)
+    like_count = models.IntegerField(default=0)
+    bookmark_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_count = models.IntegerField(default=0)
 
+    objects = EventQuerySet.as_manager()
 
-@receiver(post_save, sender=Event)
-def create_tickets(sender, instance, created, **kwargs):
-    if created:
-        event_start_date = instance.event_start_date.date()
-        event_end_date = instance.event_end_date.date()
-        time_slots = instance.time_slots
-        current_date = event_start_date
-        while current_date <= event_end_date:
-            for time_slot_key, time_slot_value in time_slots.items():
-                # Create a ticket for each time slot
-                ticket = Ticket.objects.create(
-                    author=instance.author,
-                    event=instance,
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="event_created_idx"),
+        ]
+
+
+def build_tickets(event):
+    """
+    공연 기간의 날짜마다, time_slots의 시간대마다 하나씩 티켓을 메모리에서 만듭니다.
+    """
+    tickets = []
+    current_date = event.event_start_date.date()
+    while current_date <= event.event_end_date.date():
+        for time_slot_value in event.time_slots.values():
+            tickets.append(
+                Ticket(
+                    author_id=event.author_id,
+                    event_id=event.id,
                     event_date=current_date,
                     event_time=time_slot_value,
-                    max_booking_count=instance.max_booking,
-                    money=instance.money,
+                    max_booking_count=event.max_booking,
+                    money=event.money,
                     current_booking=0,
                     quantity=0,
                 )
-                # Additional logic for ticket creation if needed
-                # ...
+            )
+        current_date += timedelta(days=1)
+    return tickets
 
-            current_date += timedelta(days=1)
+
+def generate_tickets(event_id):
+    """
+    티켓을 TICKET_BULK_BATCH_SIZE개씩 나누어 bulk insert 하고 공연의 ticket_status를 갱신합니다.
+    모든 티켓은 하나의 트랜잭션 안에서 생성되며, 이미 있는 (날짜, 시간) 티켓은 건너뜁니다.
+    """
+    event = Event.objects.get(id=event_id)
+    try:
+        with transaction.atomic():
+            Ticket.objects.bulk_create(
+                build_tickets(event),
+                batch_size=settings.TICKET_BULK_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            Event.objects.filter(id=event_id).update(ticket_status=Event.TICKET_READY)
+    except Exception:
+        Event.objects.filter(id=event_id).update(ticket_status=Event.TICKET_FAILED)
+        raise
+
+
+@receiver(post_save, sender=Event)
+def create_tickets(sender, instance, created, **kwargs):
+    """
+    공연이 생성되면 티켓을 생성합니다.
+    공연 기간이 TICKET_BACKGROUND_DAYS일을 넘으면 응답을 막지 않도록 커밋 후 백그라운드에서 생성하고,
+    진행 상황은 ticket_status로 조회할 수 있습니다.
+    """
+    if created:
+        days = (instance.event_end_date.date() - instance.event_start_date.date()).days
+        if days + 1 > settings.TICKET_BACKGROUND_DAYS:
+            run_in_background(generate_tickets, instance.id)
+        else:
+            generate_tickets(instance.id)
+            instance.ticket_status = Event.TICKET_READY
 
 
 class EventList(models.Model):
@@ -55,6 +130,62 @@ class EventList(models.Model):
     start_date = models.DateField(null=True)
     end_date = models.DateField(null=True)
     image = models.CharField(max_length=500, null=True)
+    venue = models.CharField(max_length=20, blank=True, default="")
+
+    class Meta:
+        # 제약을 추가하기 전에 기존 중복 행을 dedupe_event_lists 명령으로 정리해야 합니다.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title", "start_date", "venue"], name="eventlist_natural_key"
+            ),
+            # NULL은 서로 다른 값으로 취급되므로 시작일이 없는 공연은 (제목, 장소)로 제약합니다.
+            models.UniqueConstraint(
+                fields=["title", "venue"],
+                condition=models.Q(start_date__isnull=True),
+                name="eventlist_natural_key_no_date",
+            ),
+        ]
+
+
+class ScrapedPage(models.Model):
+    """
+    크롤링한 행사 달력 페이지(장소, 월)의 마지막 상태 입니다.
+    etag/last_modified(str): 조건부 요청(If-None-Match/If-Modified-Since)에 사용합니다.
+    content_hash(str): 본문의 sha256 으로, 바뀌지 않은 페이지는 파싱하지 않습니다.
+    """
+
+    venue = models.CharField(max_length=20)
+    month = models.CharField(max_length=6)
+    etag = models.CharField(max_length=200, blank=True, default="")
+    last_modified = models.CharField(max_length=100, blank=True, default="")
+    content_hash = models.CharField(max_length=64)
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["venue", "month"], name="scrapedpage_venue_month"
+            )
+        ]
+
+
+class SearchGram(models.Model):
+    """
+    공연(Event) 제목/내용과 크롤링한 공연(EventList) 제목의 n-gram 역색인 입니다.
+    gram(str): 정규화한 단어의 2글자 조각(한 글자 단어는 그대로)을 표현합니다.
+    weight(int): 해당 문서에서 gram이 나온 위치(제목/내용)에 따른 가중치의 합을 표현합니다.
+    """
+
+    gram = models.CharField(max_length=2)
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, null=True)
+    event_list = models.ForeignKey(EventList, on_delete=models.CASCADE, null=True)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["gram", "event"], name="searchgram_event_idx"),
+            models.Index(fields=["gram", "event_list"], name="searchgram_list_idx"),
+        ]
 
 
 class Ticket(models.Model):
@@ -67,6 +198,50 @@ class Ticket(models.Model):
     money = models.IntegerField()
     quantity = models.IntegerField(default=0)
 
+    class Meta:
+        constraints = [
+            # 티켓 생성이 겹쳐 실행되어도 같은 회차 티켓이 두 번 만들어지지 않습니다.
+            models.UniqueConstraint(
+                fields=["event", "event_date", "event_time"],
+                name="ticket_event_date_time",
+            ),
+        ]
+
+    def book(self, author, quantity):
+        """
+        잔여 좌석 확인과 증가를 하나의 조건부 UPDATE로 처리하고, 같은 트랜잭션 안에서 예매 내역을 생성합니다.
+        동시에 요청이 들어와도 current_booking이 max_booking_count를 넘지 않습니다.
+        좌석이 부족하면 None을 반환합니다.
+        """
+        with transaction.atomic():
+            booked = Ticket.objects.filter(
+                id=self.id,
+                current_booking__lte=F("max_booking_count") - quantity,
+            ).update(current_booking=F("current_booking") + quantity)
+            if not booked:
+                return None
+            return TicketBooking.objects.create(
+                author=author,
+                ticket=self,
+                money=self.money,
+                quantity=quantity,
+            )
+
+
+class TicketBookingQuerySet(models.QuerySet):
+    def for_history(self):
+        """
+        예매 내역 조회용 queryset 입니다.
+        티켓과 공연을 JOIN 하여 예매 수와 관계없이 한 번의 쿼리로 직렬화할 수 있습니다.
+        """
+        return self.select_related("ticket__event")
+
+    def upcoming(self, today):
+        return self.filter(ticket__event_date__gte=today)
+
+    def past(self, today):
+        return self.filter(ticket__event_date__lt=today)
+
 
 class TicketBooking(models.Model):
     """
@@ -81,6 +256,14 @@ class TicketBooking(models.Model):
     money = models.IntegerField()
     quantity = models.IntegerField(default=0)
 
+    objects = TicketBookingQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["author", "-id"], name="ticketbooking_author_idx"),
+            models.Index(fields=["author", "ticket"], name="ticketbooking_ticket_idx"),
+        ]
+
 
 class EventReview(models.Model):
     RATING_CHOICES = [
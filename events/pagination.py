@@ -0,0 +1,35 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    공연 목록을 최신순으로 cursor 기반 페이지네이션 합니다.
+    OFFSET 없이 (created_at, id) 인덱스를 따라가므로 뒤 페이지도 일정한 비용으로 조회됩니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    검색 결과는 관련도 순으로 정렬되므로 page 번호로 페이지네이션 합니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class BookingCursorPagination(CursorPagination):
+    """
+    예매 내역을 최신 예매순으로 cursor 기반 페이지네이션 합니다.
+    (author, id) 인덱스를 따라가므로 예매 내역이 많아도 일정한 비용으로 조회됩니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-id"
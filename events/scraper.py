@@ -0,0 +1,278 @@
+import hashlib
+import logging
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+from bs4 import BeautifulSoup
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+
+from config import etags
+from events.models import EventList, ScrapedPage
+from events.search import index_event_lists
+
+logger = logging.getLogger(__name__)
+
+URL = "https://www.chf.or.kr/cont/calendar/all/month/menu/363"
+DEFAULT_VENUES = ("617",)
+DATE_PATTERN = re.compile(r"(\d{4})\D(\d{1,2})\D(\d{1,2})")
+
+# content가 None이면 페이지가 바뀌지 않았다는 응답(304) 입니다.
+Fetched = namedtuple("Fetched", ["content", "etag", "last_modified"])
+ScrapeResult = namedtuple(
+    "ScrapeResult", ["event_lists", "pages", "fetched", "skipped", "failed"]
+)
+
+
+def month_range(start, end):
+    """
+    "YYYYMM" 형식의 start부터 end까지(포함) 월 목록을 반환합니다.
+    """
+    year, month = int(start[:4]), int(start[4:])
+    months = []
+    while f"{year:04d}{month:02d}" <= end:
+        months.append(f"{year:04d}{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class HttpFetcher:
+    """
+    궁능유적본부 월간 행사 달력 페이지를 가져옵니다.
+    모든 작업 스레드가 하나의 Session(커넥션 풀)을 공유합니다.
+    save_dir이 있으면 가져온 페이지를 FixtureFetcher에서 다시 읽을 수 있도록 저장합니다.
+    """
+
+    def __init__(self, workers=8, timeout=10, save_dir=None):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=2)
+        self.session.mount("https://", adapter)
+        self.timeout = timeout
+        self.save_dir = save_dir
+
+    def fetch(self, venue, month, page=None):
+        """
+        page(ScrapedPage)가 있으면 조건부 요청을 보내고, 바뀌지 않았으면 content가 None인 결과를 반환합니다.
+        """
+        headers = {}
+        if page is not None and page.etag:
+            headers["If-None-Match"] = page.etag
+        if page is not None and page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        response = self.session.get(
+            URL,
+            params={
+                "thisPage": 1,
+                "idx": "",
+                "searchCategory1": "",
+                "searchCategory2": venue,
+                "searchField": "all",
+                "searchDate": month,
+                "weekSel": "",
+                "searchText": "",
+            },
+            headers=headers,
+            timeout=self.timeout,
+        )
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if response.status_code == 304:
+            return Fetched(None, etag or page.etag, last_modified or page.last_modified)
+        response.raise_for_status()
+        if self.save_dir:
+            os.makedirs(self.save_dir, exist_ok=True)
+            with open(fixture_path(self.save_dir, venue, month), "wb") as f:
+                f.write(response.content)
+        return Fetched(response.content, etag, last_modified)
+
+
+class FixtureFetcher:
+    """
+    HttpFetcher(save_dir=...)로 저장해 둔 페이지를 읽습니다. 네트워크 없이 크롤러를 실행하고 측정할 때 사용합니다.
+    저장된 페이지가 없는 (장소, 월)은 공연이 없는 페이지로 취급합니다.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, venue, month, page=None):
+        try:
+            with open(fixture_path(self.directory, venue, month), "rb") as f:
+                return Fetched(f.read(), "", "")
+        except FileNotFoundError:
+            return Fetched(b"", "", "")
+
+
+def fixture_path(directory, venue, month):
+    return os.path.join(directory, f"{venue}-{month}.html")
+
+
+def parse_venues(html):
+    """
+    달력 페이지의 장소 선택 목록(searchCategory2)에서 장소 코드를 읽습니다.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    select = soup.find("select", attrs={"name": "searchCategory2"})
+    if select is None:
+        return []
+    return [
+        option["value"] for option in select.find_all("option") if option.get("value")
+    ]
+
+
+def parse_date(text):
+    match = DATE_PATTERN.search(text)
+    if match is None:
+        return None
+    return date(*map(int, match.groups()))
+
+
+def parse_events(html, venue):
+    """
+    달력 페이지의 공연 목록을 저장하지 않은 EventList 목록으로 변환합니다.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    event_lists = []
+    for item in soup.find_all("div", class_="thumb_cont"):
+        title = item.find(class_="tit")
+        if title is None:
+            continue
+        dates = item.find(class_="thumb_date")
+        dates = dates.text.split("~") if dates else []
+        image = item.find("img")
+        event_lists.append(
+            EventList(
+                title=title.text.strip()[:50],
+                start_date=parse_date(dates[0]) if dates else None,
+                end_date=parse_date(dates[-1]) if dates else None,
+                image=image.get("src") if image else None,
+                venue=venue,
+            )
+        )
+    return event_lists
+
+
+def natural_key(event_list):
+    return event_list.title, event_list.start_date, event_list.venue
+
+
+def scrape(fetcher, months, venues=None, workers=8, pages=None):
+    """
+    months x venues 페이지를 최대 workers개씩 동시에 가져와 파싱합니다.
+    venues가 없으면 첫 페이지의 장소 선택 목록에서 찾고, 그래도 없으면 DEFAULT_VENUES를 사용합니다.
+    pages({(장소, 월): ScrapedPage})에 있는 페이지는 조건부 요청을 보내고,
+    304 응답이거나 본문 해시가 같으면 파싱하지 않고 건너뜁니다.
+    여러 달에 걸친 공연은 (제목, 시작일, 장소)로 한 번만 남깁니다.
+    """
+    pages = pages or {}
+    if not venues:
+        try:
+            venues = parse_venues(fetcher.fetch("", months[0]).content)
+        except requests.RequestException:
+            logger.warning("failed to fetch venues month=%s", months[0])
+        venues = venues or list(DEFAULT_VENUES)
+
+    def fetch_and_parse(key):
+        venue, month = key
+        page = pages.get(key)
+        try:
+            fetched = fetcher.fetch(venue, month, page)
+        except requests.RequestException:
+            logger.warning("failed to fetch venue=%s month=%s", venue, month)
+            return None, None
+        if fetched.content is None:
+            return page, []
+        content_hash = hashlib.sha256(fetched.content).hexdigest()
+        if page is not None and page.content_hash == content_hash:
+            return page, []
+        page = ScrapedPage(
+            venue=venue,
+            month=month,
+            etag=fetched.etag,
+            last_modified=fetched.last_modified,
+            content_hash=content_hash,
+        )
+        return page, parse_events(fetched.content, venue)
+
+    keys = [(venue, month) for venue in venues for month in months]
+    event_lists = {}
+    changed = []
+    skipped = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for key, (page, result) in zip(keys, executor.map(fetch_and_parse, keys)):
+            if page is None:
+                failed += 1
+            elif page is pages.get(key):
+                skipped += 1
+            else:
+                changed.append(page)
+            for event_list in result or []:
+                event_lists.setdefault(natural_key(event_list), event_list)
+    return ScrapeResult(list(event_lists.values()), changed, len(keys), skipped, failed)
+
+
+def save(event_lists, pages=()):
+    """
+    크롤링한 공연을 (제목, 시작일, 장소) 기준으로 upsert 합니다.
+    새 공연만 insert 후 색인하고, 종료일/이미지가 바뀐 공연만 update 하며, 그대로인 공연은 건드리지 않습니다.
+    바뀐 페이지의 상태(pages)도 같은 트랜잭션에서 저장합니다.
+    (새로 저장한 수, 수정한 수)를 반환합니다.
+    """
+
+    def existing_rows(rows):
+        return {
+            natural_key(row): row
+            for row in EventList.objects.filter(
+                title__in={row.title for row in rows},
+                venue__in={row.venue for row in rows},
+            )
+        }
+
+    existing = existing_rows(event_lists) if event_lists else {}
+    created = []
+    updated = []
+    for event_list in event_lists:
+        row = existing.get(natural_key(event_list))
+        if row is None:
+            created.append(event_list)
+        elif (row.end_date, row.image) != (event_list.end_date, event_list.image):
+            row.end_date, row.image = event_list.end_date, event_list.image
+            updated.append(row)
+
+    with transaction.atomic():
+        if created:
+            # 동시에 실행된 다른 크롤러가 먼저 저장한 경우에도 실패하지 않도록 upsert 합니다.
+            dated = [row for row in created if row.start_date is not None]
+            undated = [row for row in created if row.start_date is None]
+            EventList.objects.bulk_create(
+                dated,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["title", "start_date", "venue"],
+                update_fields=["end_date", "image"],
+            )
+            # 시작일이 없는 공연은 부분 unique 제약(eventlist_natural_key_no_date)에 걸리므로
+            # ON CONFLICT 대상을 지정할 수 없어 충돌하면 건너뜁니다.
+            EventList.objects.bulk_create(
+                undated, batch_size=500, ignore_conflicts=True
+            )
+            keys = {natural_key(event_list) for event_list in created}
+            index_event_lists(
+                [row for key, row in existing_rows(created).items() if key in keys]
+            )
+        if updated:
+            EventList.objects.bulk_update(updated, ["end_date", "image"], batch_size=500)
+        if pages:
+            ScrapedPage.objects.bulk_create(
+                pages,
+                update_conflicts=True,
+                unique_fields=["venue", "month"],
+                update_fields=["etag", "last_modified", "content_hash", "fetched_at"],
+            )
+    if created or updated:
+        etags.touch("event_lists")
+    return len(created), len(updated)
@@ -0,0 +1,120 @@
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from events.models import SearchGram
+
+TITLE_WEIGHT = 3
+CONTENT_WEIGHT = 1
+
+_word = re.compile(r"\w+")
+
+
+def ngrams(text, unigrams=False):
+    """
+    text를 소문자로 바꾸고 단어 단위로 나눈 뒤 2글자씩 잘라 n-gram 집합을 만듭니다.
+    한국어는 띄어쓰기 단위가 길고 조사가 붙기 때문에 형태소 분석 없이 2-gram으로 색인합니다.
+    ex) "경복궁 야간관람" -> {"경복", "복궁", "야간", "간관", "관람"}
+    한 글자 단어는 그 글자가 gram이 됩니다. unigrams가 True이면(색인용) 모든 글자를 한 글자 gram으로도 만들어
+    "궁", "a 공연"처럼 한 글자 단어가 있는 검색어도 같은 (gram, target) 인덱스로 찾을 수 있습니다.
+    """
+    grams = set()
+    for word in _word.findall((text or "").lower()):
+        if unigrams or len(word) == 1:
+            grams.update(word)
+        grams.update(word[i : i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def _weights(*fields):
+    weights = {}
+    for text, weight in fields:
+        for gram in ngrams(text, unigrams=True):
+            weights[gram] = weights.get(gram, 0) + weight
+    return weights
+
+
+def index_events(events):
+    """
+    공연의 제목과 내용을 색인합니다. 기존 색인은 지우고 다시 만듭니다.
+    """
+    SearchGram.objects.filter(event__in=[event.id for event in events]).delete()
+    SearchGram.objects.bulk_create(
+        [
+            SearchGram(gram=gram, event_id=event.id, weight=weight)
+            for event in events
+            for gram, weight in _weights(
+                (event.title, TITLE_WEIGHT), (event.content, CONTENT_WEIGHT)
+            ).items()
+        ],
+        batch_size=1000,
+    )
+
+
+def index_event_lists(event_lists):
+    """
+    크롤링한 공연의 제목을 색인합니다. 기존 색인은 지우고 다시 만듭니다.
+    """
+    SearchGram.objects.filter(
+        event_list__in=[event_list.id for event_list in event_lists]
+    ).delete()
+    SearchGram.objects.bulk_create(
+        [
+            SearchGram(gram=gram, event_list_id=event_list.id, weight=weight)
+            for event_list in event_lists
+            for gram, weight in _weights((event_list.title, TITLE_WEIGHT)).items()
+        ],
+        batch_size=1000,
+    )
+
+
+def _frequency(gram, target):
+    """
+    gram이 나오는 문서 수를 SEARCH_FREQUENCY_LIMIT까지만 세어 캐시합니다.
+    검색어 중 가장 드문 gram을 고르는 데만 사용하므로 정확한 값일 필요는 없습니다.
+    """
+    key = f"search:frequency:{target}:{gram}"
+    frequency = cache.get(key)
+    if frequency is None:
+        frequency = SearchGram.objects.filter(
+            gram=gram, **{f"{target}__isnull": False}
+        )[: settings.SEARCH_FREQUENCY_LIMIT].count()
+        cache.set(key, frequency, settings.SEARCH_FREQUENCY_TIMEOUT)
+    return frequency
+
+
+def rank(query, target="event"):
+    """
+    검색어의 모든 n-gram을 포함하는 문서를 (target, score) 형태로 관련도 순으로 반환합니다.
+    target은 "event" 또는 "event_list" 입니다.
+    가장 드문 gram을 가진 문서만 후보로 삼고 (gram, target) 인덱스로 나머지 gram을 확인하기 때문에,
+    "공연"처럼 흔한 gram이 섞여 있어도 전체 색인을 훑지 않습니다.
+    검색어가 비어 있으면 None을, 검색할 글자가 없으면(문장 부호만 있는 경우 등) 빈 결과를 반환합니다.
+    """
+    if not query or not query.strip():
+        return None
+    grams = ngrams(query)
+    if not grams:
+        return SearchGram.objects.none()
+    anchor = min(sorted(grams), key=lambda gram: _frequency(gram, target))
+    candidates = SearchGram.objects.filter(
+        gram=anchor, **{f"{target}__isnull": False}
+    ).values(target)
+    return (
+        SearchGram.objects.filter(gram__in=grams, **{f"{target}__in": candidates})
+        .values(target)
+        .annotate(hits=Count("gram"), score=Sum("weight"))
+        .filter(hits=len(grams))
+        .order_by("-score", f"-{target}")
+    )
+
+
+def fetch_ranked(queryset, ranked, target="event"):
+    """
+    rank()의 결과 순서대로 queryset의 객체를 반환합니다.
+    """
+    ids = [row[target] for row in ranked]
+    objects = queryset.in_bulk(ids)
+    return [objects[id] for id in ids if id in objects]
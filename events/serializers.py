@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from config.images import ImageVariantsField
 from events.models import Event, EventReview, Ticket, TicketBooking, EventList
 from users.models import User
 from datetime import datetime
@@ -46,21 +47,15 @@ class EventSerializer(serializers.ModelSerializer):
     updated_at = serializers.DateTimeField(format="%m월%d일 %H:%M", read_only=True)
     event_start_date = serializers.DateTimeField(format="%Y-%m-%d", read_only=True)
     event_end_date = serializers.DateTimeField(format="%Y-%m-%d", read_only=True)
-    review_count = serializers.SerializerMethodField()
-
-    likes_count = serializers.SerializerMethodField()
+    review_count = serializers.IntegerField(read_only=True)
+    likes_count = serializers.IntegerField(source="like_count", read_only=True)
+    image_variants = ImageVariantsField(source="image")
     author = serializers.SerializerMethodField()
 
     def get_author(self, obj):
         author = obj.author.email.split("@")[0]
         return author
 
-    def get_review_count(self, obj):
-        return obj.review_set.count()
-
-    def get_likes_count(self, obj):
-        return obj.likes.count()
-
     class Meta:
         model = Event
         fields = (
@@ -69,6 +64,7 @@ class EventSerializer(serializers.ModelSerializer):
             "title",
             "content",
             "image",
+            "image_variants",
             "created_at",
             "updated_at",
             "event_start_date",
@@ -90,6 +86,7 @@ class EventListSerializer(EventSerializer):
             "id",
             "title",
             "image",
+            "image_variants",
             "event_start_date",
             "event_end_date",
             "review_count",
@@ -103,6 +100,15 @@ class EventEditSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = "__all__"
+        read_only_fields = (
+            "ticket_status",
+            "ticket_started_at",
+            "like_count",
+            "bookmark_count",
+            "review_count",
+            "rating_sum",
+            "rating_count",
+        )
 
     def validate(self, attrs):
         event_start_date = attrs.get("event_start_date")
@@ -119,6 +125,7 @@ class EventReviewSerializer(serializers.ModelSerializer):
     created_at = serializers.DateTimeField(format="%m월%d일 %H:%M", read_only=True)
     updated_at = serializers.DateTimeField(format="%m월%d일 %H:%M", read_only=True)
     author_name = serializers.SerializerMethodField()
+    review_image_variants = ImageVariantsField(source="review_image")
 
     def get_author_name(self, obj):
         # author_name = obj.author.username
@@ -133,6 +140,7 @@ class EventReviewSerializer(serializers.ModelSerializer):
             "event",
             "content",
             "review_image",
+            "review_image_variants",
             "created_at",
             "updated_at",
             "grade",
@@ -177,6 +185,11 @@ class TicketCreateSerializer(serializers.ModelSerializer):
         if event_time not in time_slots.values():
             raise serializers.ValidationError("공연 시간을 확인해 주세요")
 
+        if Ticket.objects.filter(
+            event=event, event_date=event_date, event_time=event_time
+        ).exists():
+            raise serializers.ValidationError("이미 생성된 티켓입니다")
+
         max_bookig = event.max_booking
         if max_booking_count != max_bookig:
             raise serializers.ValidationError("최대 관객수를 확인해 주세요")
@@ -190,6 +203,22 @@ class TicketCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ("author", "event")
 
 
+class TicketStatusSerializer(serializers.ModelSerializer):
+    """
+    공연의 티켓 생성 진행 상황을 조회하기 위해 사용됩니다.
+    ticket_status는 pending(생성중), ready(생성완료), failed(생성실패) 중 하나입니다.
+    """
+
+    ticket_count = serializers.SerializerMethodField()
+
+    def get_ticket_count(self, obj):
+        return obj.ticket_set.count()
+
+    class Meta:
+        model = Event
+        fields = ("id", "ticket_status", "ticket_count")
+
+
 class TicketSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
@@ -218,6 +247,7 @@ class BookedTicketSerializer(serializers.ModelSerializer):
     class Meta:
         model = TicketBooking
         fields = (
+            "id",
             "event",
             "event_date",
             "event_time",
@@ -0,0 +1,98 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from config import etags, images
+from config.counters import count_relation, count_reviews
+from events import availability, detail_cache, eligibility, search
+from events.models import Event, EventList, EventReview, Ticket, TicketBooking
+
+count_relation(Event, "likes", "like_count")
+count_relation(Event, "event_bookmarks", "bookmark_count")
+count_reviews(EventReview, "event", Event)
+# 공연 상세 캐시에 변환본 URL이 포함됩니다.
+images.register(
+    Event, "image", on_ready=lambda event: detail_cache.invalidate(event.id)
+)
+images.register(EventReview, "review_image")
+
+
+@receiver([post_save, post_delete], sender=Ticket)
+def invalidate_ticket_availability(sender, instance, **kwargs):
+    availability.invalidate(instance.event_id, instance.event_date)
+
+
+@receiver([post_save, post_delete], sender=TicketBooking)
+def invalidate_booking_availability(sender, instance, **kwargs):
+    try:
+        ticket = instance.ticket
+    except Ticket.DoesNotExist:
+        return
+    availability.invalidate(ticket.event_id, ticket.event_date)
+
+
+@receiver([post_save, post_delete], sender=TicketBooking)
+def invalidate_review_eligibility(sender, instance, **kwargs):
+    eligibility.invalidate(instance.author_id)
+
+
+@receiver(post_save, sender=Event)
+def index_event(sender, instance, **kwargs):
+    search.index_events([instance])
+
+
+@receiver(post_save, sender=EventList)
+def index_event_list(sender, instance, **kwargs):
+    search.index_event_lists([instance])
+
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_event_detail(sender, instance, **kwargs):
+    detail_cache.invalidate(instance.id)
+
+
+@receiver([post_save, post_delete], sender=Event)
+@receiver([post_save, post_delete], sender=EventReview)
+def touch_events(sender, **kwargs):
+    etags.touch("events")
+
+
+@receiver([post_save, post_delete], sender=EventList)
+def touch_event_lists(sender, **kwargs):
+    etags.touch("event_lists")
+
+
+@receiver(m2m_changed, sender=Event.likes.through)
+@receiver(m2m_changed, sender=Event.event_bookmarks.through)
+def touch_events_relations(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        etags.touch("events")
+
+
+@receiver([post_save, post_delete], sender=EventReview)
+@receiver([post_save, post_delete], sender=Ticket)
+def invalidate_event_detail_children(sender, instance, **kwargs):
+    detail_cache.invalidate(instance.event_id)
+
+
+@receiver(m2m_changed, sender=Event.likes.through)
+@receiver(m2m_changed, sender=Event.event_bookmarks.through)
+def invalidate_event_detail_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    event.likes.add(user) 처럼 공연 쪽에서 바뀌면 instance가 공연이고,
+    user.like_event.add(event) 처럼 회원 쪽에서 바뀌면 pk_set이 공연 id 입니다.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            detail_cache.invalidate(instance.id)
+        return
+
+    if action in ("post_add", "post_remove"):
+        event_ids = pk_set
+    elif action == "pre_clear":
+        event_ids = sender.objects.filter(user=instance).values_list(
+            "event_id", flat=True
+        )
+    else:
+        return
+    for event_id in event_ids:
+        detail_cache.invalidate(event_id)
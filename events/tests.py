@@ -1 +1,975 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+from urllib.parse import quote
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+import requests
+from rest_framework.test import APITestCase
+
+from config.media import DerivedContentFile
+from events import eligibility
+from events.models import (
+    Event,
+    EventList,
+    EventReview,
+    ScrapedPage,
+    SearchGram,
+    Ticket,
+    TicketBooking,
+    generate_tickets,
+)
+from events.scraper import FixtureFetcher, HttpFetcher, scrape
+from events.serializers import EventListSerializer
+from stores.throttling import ObjectThrottle
+from users.models import User
+
+
+def create_event(author, days=1, time_slots=None, max_booking=10, **kwargs):
+    start = timezone.now()
+    return Event.objects.create(
+        author=author,
+        title=kwargs.pop("title", "야간관람"),
+        content=kwargs.pop("content", "경복궁 야간관람"),
+        event_start_date=start,
+        event_end_date=start + timedelta(days=days - 1),
+        time_slots=time_slots or {"1": "19:00-20:00"},
+        max_booking=max_booking,
+        money=1000,
+        **kwargs,
+    )
+
+
+class BookingTicketViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.event = create_event(self.user, max_booking=3)
+        self.ticket = Ticket.objects.get(event=self.event)
+        self.client.force_authenticate(self.user)
+
+    def book(self, quantity):
+        url = reverse("booking_ticket_view", args=[self.ticket.id])
+        return self.client.post(url, {"quantity": quantity}, format="json")
+
+    def test_booking(self):
+        response = self.book(2)
+        self.assertEqual(response.status_code, 201)
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.current_booking, 2)
+        self.assertEqual(TicketBooking.objects.get().quantity, 2)
+
+    def test_booking_over_capacity(self):
+        self.book(2)
+        response = self.book(2)
+        self.assertEqual(response.status_code, 400)
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.current_booking, 2)
+        self.assertEqual(TicketBooking.objects.count(), 1)
+
+    def test_booking_invalid_quantity(self):
+        response = self.book(0)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(TicketBooking.objects.exists())
+
+
+class TicketBookTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.ticket = Ticket.objects.get(event=create_event(self.user, max_booking=5))
+
+    def test_stale_instance_does_not_oversell(self):
+        stale = Ticket.objects.get(id=self.ticket.id)
+        self.assertIsNotNone(self.ticket.book(self.user, 4))
+        self.assertIsNone(stale.book(self.user, 2))
+        self.assertIsNotNone(stale.book(self.user, 1))
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.current_booking, 5)
+        self.assertEqual(TicketBooking.objects.count(), 2)
+
+
+class CreateTicketsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+
+    def test_tickets_for_every_day_and_slot(self):
+        event = create_event(
+            self.user, days=30, time_slots={"1": "10:00-11:00", "2": "14:00-15:00"}
+        )
+        self.assertEqual(Ticket.objects.filter(event=event).count(), 60)
+        self.assertEqual(event.ticket_status, Event.TICKET_READY)
+
+    @override_settings(TICKET_BULK_BATCH_SIZE=100, TICKET_BACKGROUND_DAYS=365)
+    def test_tickets_use_bulk_insert(self):
+        with CaptureQueriesContext(connection) as context:
+            create_event(self.user, days=150)
+        inserts = [
+            query
+            for query in context.captured_queries
+            # 중복 티켓은 건너뛰므로 DB에 따라 INSERT OR IGNORE / ON CONFLICT DO NOTHING 입니다.
+            if query["sql"].startswith("INSERT")
+            and 'INTO "events_ticket"' in query["sql"]
+        ]
+        self.assertEqual(len(inserts), 2)
+
+    @override_settings(TICKET_BACKGROUND_DAYS=10, BACKGROUND_TASKS_EAGER=True)
+    def test_long_event_generates_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            event = create_event(self.user, days=30)
+            self.assertFalse(Ticket.objects.filter(event=event).exists())
+            self.assertEqual(event.ticket_status, Event.TICKET_PENDING)
+
+        self.assertEqual(Ticket.objects.filter(event=event).count(), 30)
+        response = self.client.get(reverse("ticket_status_view", args=[event.id]))
+        self.assertEqual(response.json()["ticket_status"], Event.TICKET_READY)
+        self.assertEqual(response.json()["ticket_count"], 30)
+
+    def test_failure_marks_event_failed(self):
+        event = create_event(self.user, days=1)
+        Ticket.objects.filter(event=event).delete()
+        with mock.patch.object(
+            Ticket.objects, "bulk_create", side_effect=RuntimeError("db down")
+        ):
+            with self.assertRaises(RuntimeError):
+                generate_tickets(event.id)
+        event.refresh_from_db()
+        self.assertEqual(event.ticket_status, Event.TICKET_FAILED)
+
+    def test_regenerate_tickets(self):
+        stuck, failed, running = (create_event(self.user, days=2) for _ in range(3))
+        Ticket.objects.all().delete()
+        Event.objects.filter(id=stuck.id).update(
+            ticket_status=Event.TICKET_PENDING,
+            created_at=timezone.now() - timedelta(hours=1),
+        )
+        Event.objects.filter(id=failed.id).update(ticket_status=Event.TICKET_FAILED)
+        Event.objects.filter(id=running.id).update(ticket_status=Event.TICKET_PENDING)
+
+        out = StringIO()
+        call_command("regenerate_tickets", "--dry-run", stdout=out)
+        self.assertIn("다시 생성할 공연 2건", out.getvalue())
+        self.assertFalse(Ticket.objects.exists())
+
+        call_command("regenerate_tickets", stdout=StringIO())
+        for event, status, count in (
+            (stuck, Event.TICKET_READY, 2),
+            (failed, Event.TICKET_READY, 2),
+            (running, Event.TICKET_PENDING, 0),
+        ):
+            event.refresh_from_db()
+            self.assertEqual(event.ticket_status, status)
+            self.assertEqual(Ticket.objects.filter(event=event).count(), count)
+
+    def test_regenerate_tickets_concurrently(self):
+        first, second = (create_event(self.user, days=2) for _ in range(2))
+        Ticket.objects.all().delete()
+        Event.objects.update(ticket_status=Event.TICKET_FAILED)
+
+        def concurrent_run(event_id):
+            # 첫 번째 공연을 생성하는 동안 다른 실행이 두 번째 공연을 가져갑니다.
+            if event_id == first.id:
+                call_command("regenerate_tickets", stdout=out)
+            generate_tickets(event_id)
+
+        out = StringIO()
+        with mock.patch(
+            "events.management.commands.regenerate_tickets.generate_tickets",
+            side_effect=concurrent_run,
+        ):
+            call_command("regenerate_tickets", stdout=out)
+        self.assertIn("건너뜀 1건", out.getvalue())
+        for event in (first, second):
+            event.refresh_from_db()
+            self.assertEqual(event.ticket_status, Event.TICKET_READY)
+            self.assertEqual(Ticket.objects.filter(event=event).count(), 2)
+
+        # 이미 있는 티켓은 다시 만들지 않습니다.
+        generate_tickets(first.id)
+        self.assertEqual(Ticket.objects.filter(event=first).count(), 2)
+
+
+class TicketAvailabilityTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.event = create_event(
+            self.user, time_slots={"1": "10:00-11:00", "2": "19:00-20:00"}
+        )
+        self.ticket = Ticket.objects.get(event=self.event, event_time="19:00-20:00")
+        self.date_url = reverse(
+            "ticket_date_detail_view", args=[self.event.id, str(self.ticket.event_date)]
+        )
+        self.time_url = reverse(
+            "ticket_time_detail_view",
+            args=[self.event.id, str(self.ticket.event_date), self.ticket.event_time],
+        )
+        self.client.force_authenticate(self.user)
+
+    def current_booking(self, url):
+        response = self.client.get(url)
+        return {t["event_time"]: t["current_booking"] for t in response.json()}
+
+    def test_cached_lookup_skips_ticket_table(self):
+        self.client.get(self.date_url)
+        self.client.get(self.time_url)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.client.get(self.date_url).json()), 2)
+            self.assertEqual(len(self.client.get(self.time_url).json()), 1)
+
+    def test_booking_invalidates_on_commit(self):
+        self.assertEqual(self.current_booking(self.time_url), {"19:00-20:00": 0})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ticket.book(self.user, 3)
+        self.assertEqual(self.current_booking(self.time_url), {"19:00-20:00": 3})
+        self.assertEqual(
+            self.current_booking(self.date_url), {"10:00-11:00": 0, "19:00-20:00": 3}
+        )
+
+    def test_non_canonical_date_is_invalidated(self):
+        # 20230701처럼 isoformat이 아닌 날짜도 같은 캐시 버전을 사용해야 합니다.
+        url = reverse(
+            "ticket_time_detail_view",
+            args=[self.event.id, f"{self.ticket.event_date:%Y%m%d}", "19:00-20:00"],
+        )
+        self.assertEqual(self.current_booking(url), {"19:00-20:00": 0})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ticket.book(self.user, 3)
+        self.assertEqual(self.current_booking(url), {"19:00-20:00": 3})
+
+    def test_invalid_date_or_time(self):
+        for args in (
+            [self.event.id, "2023-02-30"],
+            [self.event.id, "tomorrow"],
+        ):
+            response = self.client.get(reverse("ticket_date_detail_view", args=args))
+            self.assertEqual(response.status_code, 400)
+        response = self.client.get(
+            reverse(
+                "ticket_time_detail_view",
+                args=[self.event.id, str(self.ticket.event_date), "evening"],
+            )
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_read_before_commit_is_not_served_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ticket.book(self.user, 3)
+            Ticket.objects.filter(id=self.ticket.id).update(current_booking=0)
+            # 커밋 전에 다른 요청이 이전 값으로 캐시를 채운 상황
+            self.current_booking(self.time_url)
+            Ticket.objects.filter(id=self.ticket.id).update(current_booking=3)
+        self.assertEqual(self.current_booking(self.time_url), {"19:00-20:00": 3})
+
+
+class EventListQueryTest(APITestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@test.com", username=f"user{i}", password="password"
+            )
+            for i in range(3)
+        ]
+        for i in range(25):
+            event = create_event(self.users[0], title=f"공연{i}")
+            event.likes.add(*self.users[: i % 3 + 1])
+            event.event_bookmarks.add(self.users[i % 3])
+            EventReview.objects.create(
+                author=self.users[1], event=event, content="좋아요", grade=5
+            )
+
+    def test_event_list_query_count(self):
+        # 공연 목록, likes prefetch, event_bookmarks prefetch
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("event_view"), {"page_size": 20})
+        self.assertEqual(len(response.json()["results"]), 20)
+        first = response.json()["results"][0]
+        self.assertEqual(first["title"], "공연24")
+        self.assertEqual(first["review_count"], 1)
+        self.assertEqual(first["likes_count"], 1)
+        self.assertEqual(first["likes"], [self.users[0].id])
+
+    def test_event_list_cursor(self):
+        response = self.client.get(reverse("event_view"), {"page_size": 20})
+        with self.assertNumQueries(3):
+            response = self.client.get(response.json()["next"])
+        titles = [event["title"] for event in response.json()["results"]]
+        self.assertEqual(titles, [f"공연{i}" for i in range(4, -1, -1)])
+
+    def test_event_list_conditional_get(self):
+        response = self.client.get(reverse("event_view"), {"page_size": 20})
+        etag = response["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                reverse("event_view"), {"page_size": 20}, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        # 쿼리 문자열이 다르면 다른 응답입니다.
+        response = self.client.get(reverse("event_view"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        Event.objects.first().likes.add(self.users[2])
+        response = self.client.get(
+            reverse("event_view"), {"page_size": 20}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_scraped_event_list_conditional_get(self):
+        etag = self.client.get(reverse("event_list_view"))["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                reverse("event_list_view"), HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+        EventList.objects.create(title="궁중문화축전", venue="617")
+        response = self.client.get(reverse("event_list_view"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_event_search_query_count(self):
+        cache.clear()
+        self.client.get(reverse("event_search_view"), {"title": "공연1"})
+        # 검색 결과 수, 관련도 순 id, 공연 목록, likes prefetch, event_bookmarks prefetch
+        # (n-gram별 문서 수는 첫 요청에서 캐시됩니다)
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse("event_search_view"), {"title": "공연1"})
+        self.assertEqual(len(response.json()["results"]), 11)
+
+
+class EventSearchTest(APITestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.night = create_event(user, title="경복궁 야간관람", content="달빛 아래 궁궐 산책")
+        self.moon = create_event(user, title="창덕궁 달빛기행", content="후원을 걷는 야간 프로그램")
+        self.food = create_event(user, title="궁중음식 체험", content="경복궁 소주방에서 진행")
+
+    def search(self, q, **params):
+        response = self.client.get(reverse("event_search_view"), {"q": q, **params})
+        return [event["id"] for event in response.json()["results"]]
+
+    def test_search_title_and_content_ranked(self):
+        self.assertEqual(self.search("경복궁"), [self.night.id, self.food.id])
+        self.assertEqual(self.search("달빛"), [self.moon.id, self.night.id])
+
+    def test_search_requires_every_gram(self):
+        self.assertEqual(self.search("야간관람"), [self.night.id])
+        self.assertEqual(self.search("덕수궁"), [])
+
+    def test_search_single_letter(self):
+        # 제목(가중치 3)에 "달"이 있는 공연이 먼저 나옵니다.
+        self.assertEqual(self.search("달"), [self.moon.id, self.night.id])
+        self.assertEqual(self.search(" 체 "), [self.food.id])
+        self.assertEqual(len(self.search("궁")), 3)
+        with CaptureQueriesContext(connection) as context:
+            self.search("달")
+        sql = [query["sql"] for query in context.captured_queries]
+        self.assertFalse(any("LIKE" in query for query in sql))
+
+    def test_search_with_single_letter_word(self):
+        # 한 글자 단어도 다른 단어와 같이 색인된 gram으로 찾습니다.
+        self.assertCountEqual(self.search("궁 야간"), [self.night.id, self.moon.id])
+        self.assertEqual(self.search("체 경복궁"), [self.food.id])
+        self.assertEqual(self.search("숲 경복궁"), [])
+
+    def test_search_without_letters_is_empty(self):
+        self.assertEqual(self.search("?!"), [])
+        self.assertEqual(len(self.search("")), 3)
+
+    def test_search_index_follows_updates(self):
+        self.food.title = "수라간 체험"
+        self.food.save()
+        self.assertEqual(self.search("경복궁"), [self.night.id, self.food.id])
+        self.assertEqual(self.search("수라간"), [self.food.id])
+        self.moon.delete()
+        self.assertEqual(self.search("달빛"), [self.night.id])
+
+    def test_search_paginated(self):
+        response = self.client.get(
+            reverse("event_search_view"), {"q": "경복궁", "page_size": 1}
+        )
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_search_event_list(self):
+        EventList.objects.create(title="경복궁 별빛야행")
+        EventList.objects.create(title="덕수궁 풍류")
+        response = self.client.get(reverse("event_list_view"), {"q": "별빛"})
+        titles = [event["title"] for event in response.json()["results"]]
+        self.assertEqual(titles, ["경복궁 별빛야행"])
+
+
+class EventDetailCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.event = create_event(self.user)
+        self.url = reverse("event_detail_view", args=[self.event.id])
+
+    def get(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.get(self.url).json()
+
+    def test_cache_hit_runs_no_query(self):
+        self.get()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get()["title"], self.event.title)
+
+    def test_signals_invalidate(self):
+        self.assertEqual(self.get()["likes_count"], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.likes.add(self.user)
+        self.assertEqual(self.get()["likes_count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.bookmark_events.add(self.event)
+        self.assertEqual(self.get()["event_bookmarks"], [self.user.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EventReview.objects.create(
+                author=self.user, event=self.event, content="좋아요", grade=5
+            )
+        self.assertEqual(self.get()["review_count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.title = "창덕궁 달빛기행"
+            self.event.save()
+        self.assertEqual(self.get()["title"], "창덕궁 달빛기행")
+
+    def test_stats(self):
+        self.get()
+        self.get()
+        admin = User.objects.create_superuser(
+            email="admin@test.com", username="admin", password="password"
+        )
+        self.client.force_authenticate(admin)
+        response = self.client.get(reverse("event_detail_cache_stats_view"))
+        self.assertEqual(response.json(), {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+
+
+class EventRelationToggleTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.other = User.objects.create_user(
+            email="other@test.com", username="other", password="password"
+        )
+        self.event = create_event(self.user)
+        self.event.likes.add(self.other)
+        self.like_url = reverse("like", args=[self.event.id])
+        self.bookmark_url = reverse("bookmark_event_view", args=[self.event.id])
+        self.client.force_authenticate(self.user)
+
+    def test_like_toggle(self):
+        response = self.client.post(self.like_url)
+        self.assertEqual(response.json()["message"], "like했습니다.")
+        self.assertTrue(self.event.likes.filter(id=self.user.id).exists())
+        response = self.client.post(self.like_url)
+        self.assertEqual(response.json()["message"], "unlike했습니다.")
+        self.assertEqual(list(self.event.likes.all()), [self.other])
+
+    def test_like_set_and_unset_are_idempotent(self):
+        self.client.put(self.like_url)
+        self.client.put(self.like_url)
+        self.assertEqual(self.event.likes.count(), 2)
+        self.client.delete(self.like_url)
+        self.client.delete(self.like_url)
+        self.assertEqual(list(self.event.likes.all()), [self.other])
+
+    def test_toggle_does_not_load_likers(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.like_url)
+        self.assertFalse(
+            any('FROM "users_user" INNER JOIN' in q["sql"] for q in context.captured_queries)
+        )
+
+    def test_bookmark_toggle(self):
+        self.client.post(self.bookmark_url)
+        self.assertEqual(list(self.user.bookmark_events.all()), [self.event])
+        self.client.post(self.bookmark_url)
+        self.assertFalse(self.user.bookmark_events.exists())
+
+    def test_anonymous(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.post(self.bookmark_url).status_code, 401)
+
+
+class EventCounterTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.other = User.objects.create_user(
+            email="other@test.com", username="other", password="password"
+        )
+        self.event = create_event(self.user)
+
+    def assertCounters(self, **expected):
+        self.event.refresh_from_db()
+        for field, value in expected.items():
+            self.assertEqual(getattr(self.event, field), value, field)
+
+    def test_like_and_bookmark_counters(self):
+        self.event.likes.add(self.user, self.other)
+        self.event.likes.add(self.user)
+        self.other.bookmark_events.add(self.event)
+        self.assertCounters(like_count=2, bookmark_count=1)
+
+        self.event.likes.remove(self.user)
+        self.event.likes.remove(self.user)
+        self.other.like_event.remove(self.event)
+        self.other.bookmark_events.clear()
+        self.assertCounters(like_count=0, bookmark_count=0)
+
+        self.event.likes.add(self.user, self.other)
+        self.event.likes.clear()
+        self.assertCounters(like_count=0)
+
+    def test_review_counters(self):
+        review = EventReview.objects.create(
+            author=self.user, event=self.event, content="좋아요", grade=5
+        )
+        EventReview.objects.create(
+            author=self.other, event=self.event, content="보통", grade=3
+        )
+        self.assertCounters(review_count=2, rating_count=2, rating_sum=8)
+        review.grade = 1
+        review.save()
+        self.assertCounters(review_count=2, rating_sum=4)
+        review.delete()
+        self.assertCounters(review_count=1, rating_count=1, rating_sum=3)
+
+    def test_reconcile_counters(self):
+        self.event.likes.add(self.user)
+        EventReview.objects.create(
+            author=self.user, event=self.event, content="좋아요", grade=4
+        )
+        Event.objects.filter(id=self.event.id).update(
+            like_count=7, review_count=0, rating_sum=0
+        )
+        detail_url = reverse("event_detail_view", args=[self.event.id])
+        self.assertEqual(self.client.get(detail_url).json()["likes_count"], 7)
+        etag = self.client.get(reverse("event_view"))["ETag"]
+
+        call_command("reconcile_counters", stdout=StringIO())
+        self.assertCounters(like_count=1, review_count=1, rating_count=1, rating_sum=4)
+        # 보정한 값이 캐시된 상세 응답과 목록 ETag에도 반영됩니다.
+        self.assertEqual(self.client.get(detail_url).json()["likes_count"], 1)
+        response = self.client.get(reverse("event_view"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+CALENDAR_PAGE = """
+<select name="searchCategory2">
+  <option value="">전체</option><option value="617">경복궁</option><option value="618">창덕궁</option>
+</select>
+{}
+"""
+EVENT_ITEM = """
+<div class="thumb_cont">
+  <img src="/img/{0}.jpg"><p class="tit"> {0} </p>
+  <p class="thumb_date">{1} ~ {2}</p>
+</div>
+"""
+
+
+class ScrapeEventsTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        pages = {
+            ("", "202306"): [],
+            ("617", "202306"): [("야간관람", "2023.06.01", "2023.07.31")],
+            ("617", "202307"): [("야간관람", "2023.06.01", "2023.07.31")],
+            ("618", "202307"): [("달빛기행", "2023.07.01", "2023.07.02")],
+        }
+        for (venue, month), items in pages.items():
+            self.write_page(venue, month, items)
+
+    def write_page(self, venue, month, items):
+        html = CALENDAR_PAGE.format("".join(EVENT_ITEM.format(*i) for i in items))
+        with open(os.path.join(self.directory, f"{venue}-{month}.html"), "w") as f:
+            f.write(html)
+
+    def scrape(self, **options):
+        out = StringIO()
+        call_command(
+            "scrape_events",
+            start="202306",
+            end="202307",
+            fixture_dir=self.directory,
+            stdout=out,
+            **options,
+        )
+        return out.getvalue()
+
+    def test_scrape_from_fixtures(self):
+        output = self.scrape()
+        self.assertIn("페이지 4개(변경 없음 0개, 실패 0개)", output)
+        self.assertIn("공연 2건 중 2건 추가, 0건 수정", output)
+        event_lists = EventList.objects.order_by("venue")
+        self.assertEqual(
+            [(e.title, e.start_date, e.end_date, e.venue) for e in event_lists],
+            [
+                ("야간관람", date(2023, 6, 1), date(2023, 7, 31), "617"),
+                ("달빛기행", date(2023, 7, 1), date(2023, 7, 2), "618"),
+            ],
+        )
+
+        # bulk insert 후에도 검색 색인이 만들어집니다.
+        response = self.client.get(reverse("event_list_view"), {"q": "달빛"})
+        self.assertEqual(
+            [e["title"] for e in response.data["results"]], ["달빛기행"]
+        )
+
+    def test_rescrape_only_touches_changes(self):
+        self.scrape()
+        self.assertIn("페이지 4개(변경 없음 4개, 실패 0개)", self.scrape())
+
+        self.write_page("618", "202307", [("달빛기행", "2023.07.01", "2023.07.09")])
+        output = self.scrape()
+        self.assertIn("변경 없음 3개", output)
+        self.assertIn("공연 1건 중 0건 추가, 1건 수정", output)
+        self.assertEqual(EventList.objects.count(), 2)
+        self.assertEqual(
+            EventList.objects.get(title="달빛기행").end_date, date(2023, 7, 9)
+        )
+
+    def test_undated_events_are_not_duplicated(self):
+        self.write_page("617", "202306", [("상설전시", "", "")])
+        self.scrape()
+        self.assertIn("공연 3건 중 0건 추가, 0건 수정", self.scrape(full=True))
+        self.assertEqual(EventList.objects.filter(start_date=None).count(), 1)
+
+    def test_venue_discovery_failure_falls_back(self):
+        fetcher = FixtureFetcher(self.directory)
+        fetch = fetcher.fetch
+
+        def fail_discovery(venue, month, page=None):
+            if venue == "":
+                raise requests.ConnectionError
+            return fetch(venue, month, page)
+
+        with mock.patch.object(fetcher, "fetch", side_effect=fail_discovery):
+            with self.assertLogs("events.scraper", "WARNING"):
+                result = scrape(fetcher, ["202306"])
+        self.assertEqual([e.title for e in result.event_lists], ["야간관람"])
+
+    def test_conditional_request(self):
+        page = ScrapedPage(venue="617", month="202306", etag='"v1"', content_hash="")
+        fetcher = HttpFetcher()
+        response = mock.Mock(status_code=304, headers={})
+        with mock.patch.object(fetcher.session, "get", return_value=response) as get:
+            fetched = fetcher.fetch("617", "202306", page)
+        self.assertIsNone(fetched.content)
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+
+class DedupeEventListsTest(TransactionTestCase):
+    def setUp(self):
+        # 제약을 추가하기 전의 DB처럼 중복 행을 만들 수 있도록 제약을 잠시 없앱니다.
+        # (SQLite는 테이블을 다시 만들 때 모델의 제약을 사용하므로 모델에서도 잠시 없앱니다.)
+        constraints = EventList._meta.constraints
+        with mock.patch.object(EventList._meta, "constraints", []):
+            with connection.schema_editor() as editor:
+                for constraint in reversed(constraints):
+                    editor.remove_constraint(EventList, constraint)
+
+        def restore():
+            with connection.schema_editor() as editor:
+                for constraint in reversed(constraints):
+                    editor.add_constraint(EventList, constraint)
+
+        self.addCleanup(restore)
+
+    def test_merge_duplicates(self):
+        for end_date in (date(2023, 7, 1), date(2023, 7, 31), date(2023, 8, 31)):
+            EventList.objects.create(
+                title="야간관람",
+                start_date=date(2023, 6, 1),
+                end_date=end_date,
+                venue="617",
+            )
+        for _ in range(2):
+            EventList.objects.create(title="상설전시", venue="617")
+        EventList.objects.create(title="달빛기행", start_date=date(2023, 7, 1), venue="618")
+        first = EventList.objects.order_by("id").first()
+
+        out = StringIO()
+        call_command("dedupe_event_lists", stdout=out)
+        self.assertIn("중복 공연 2건, 삭제할 행 3개", out.getvalue())
+        self.assertEqual(EventList.objects.count(), 3)
+        kept = EventList.objects.get(title="야간관람")
+        self.assertEqual((kept.id, kept.end_date), (first.id, date(2023, 8, 31)))
+        grams = SearchGram.objects.filter(event_list=kept)
+        self.assertEqual(grams.values("gram").distinct().count(), grams.count())
+
+
+class BookedTicketHistoryTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.client.force_authenticate(self.user)
+
+    def book(self, count, days_ago=0):
+        for _ in range(count):
+            event = create_event(self.user)
+            ticket = Ticket.objects.get(event=event)
+            if days_ago:
+                ticket.event_date -= timedelta(days=days_ago)
+                ticket.save()
+            ticket.book(self.user, 1)
+
+    def test_query_count_does_not_grow_with_bookings(self):
+        self.book(2)
+        with self.assertNumQueries(1):
+            self.client.get(reverse("booked_list_view"))
+
+        self.book(20)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("booked_list_view"))
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertEqual(response.data["results"][0]["event"], "야간관람")
+
+        booking = TicketBooking.objects.latest("id")
+        url = reverse("booking_ticket_detail_view", args=[booking.id])
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.data["id"], booking.id)
+
+    def test_keyset_pagination(self):
+        self.book(3)
+        ids = list(TicketBooking.objects.order_by("-id").values_list("id", flat=True))
+        response = self.client.get(reverse("booked_list_view"), {"page_size": 2})
+        self.assertEqual([b["id"] for b in response.data["results"]], ids[:2])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([b["id"] for b in response.data["results"]], ids[2:])
+        self.assertIsNone(response.data["next"])
+
+    def test_upcoming_and_past(self):
+        self.book(2)
+        self.book(1, days_ago=3)
+        url = reverse("booked_list_view")
+        response = self.client.get(url, {"when": "upcoming"})
+        self.assertEqual(len(response.data["results"]), 2)
+        response = self.client.get(url, {"when": "past"})
+        self.assertEqual(len(response.data["results"]), 1)
+
+
+class EventReviewEligibilityTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.client.force_authenticate(self.user)
+        self.events = [create_event(self.user, title=f"공연{i}") for i in range(3)]
+        cache.clear()
+        patcher = mock.patch.object(ObjectThrottle, "rate", "100/s")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def book(self, event):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Ticket.objects.get(event=event).book(self.user, 1)
+
+    def review(self, event):
+        return self.client.post(
+            reverse("event_review_view", args=[event.id]),
+            {"content": "좋아요", "grade": 5},
+        )
+
+    def test_review_requires_booking(self):
+        self.assertEqual(self.review(self.events[0]).status_code, 403)
+        self.book(self.events[0])
+        self.assertEqual(self.review(self.events[0]).status_code, 201)
+
+    def test_cached_and_invalidated_on_cancel(self):
+        booking = self.book(self.events[0])
+        with self.assertNumQueries(1):
+            self.assertTrue(eligibility.can_review(self.user, self.events[0].id))
+        with self.assertNumQueries(0):
+            self.assertFalse(eligibility.can_review(self.user, self.events[1].id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.delete()
+        self.assertFalse(eligibility.can_review(self.user, self.events[0].id))
+
+    def test_batch(self):
+        self.book(self.events[0])
+        self.book(self.events[2])
+        ids = ",".join(str(event.id) for event in self.events[:2])
+        response = self.client.get(reverse("reviewable_event_view"), {"ids": ids})
+        self.assertEqual(response.data["reviewable"], [self.events[0].id])
+
+
+class ImageVariantTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root, BACKGROUND_TASKS_EAGER=True)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+
+    def upload(self):
+        buffer = BytesIO()
+        Image.new("RGB", (2000, 1000), "red").save(buffer, "JPEG")
+        return SimpleUploadedFile("poster.jpg", buffer.getvalue(), "image/jpeg")
+
+    def test_variants_generated_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            event = create_event(self.user, image=self.upload())
+        original = default_storage.url(event.image.name)
+        variants = EventListSerializer(event).data["image_variants"]
+        self.assertEqual(variants["thumb"]["webp"], original)
+
+        for callback in callbacks:
+            callback()
+        variants = EventListSerializer(event).data["image_variants"]
+        self.assertTrue(variants["thumb"]["webp"].endswith(".thumb.webp"))
+        self.assertTrue(variants["medium"]["jpeg"].endswith(".medium.jpeg"))
+        thumb = event.image.name.replace(".jpg", ".thumb.jpeg")
+        with default_storage.open(thumb) as f:
+            self.assertEqual(Image.open(f).size, (320, 160))
+
+    def test_detail_cache_invalidated_when_variants_ready(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            event = create_event(self.user, image=self.upload())
+        url = reverse("event_detail_view", args=[event.id])
+        variants = self.client.get(url).json()["image_variants"]
+        self.assertFalse(variants["thumb"]["webp"].endswith(".thumb.webp"))
+
+        for callback in callbacks:
+            callback()
+        variants = self.client.get(url).json()["image_variants"]
+        self.assertTrue(variants["thumb"]["webp"].endswith(".thumb.webp"))
+
+    def test_failed_generation_is_not_checked_again(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            event = create_event(
+                self.user, image=SimpleUploadedFile("broken.jpg", b"not an image")
+            )
+        with self.assertLogs("config.images", "ERROR"):
+            for callback in callbacks:
+                callback()
+        with mock.patch.object(default_storage, "exists") as exists:
+            variants = EventListSerializer(event).data["image_variants"]
+        exists.assert_not_called()
+        self.assertEqual(
+            variants["thumb"]["webp"], default_storage.url(event.image.name)
+        )
+
+
+class MediaServeTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.name = default_storage.save("2024/05/poster.txt", ContentFile(b"0123456789"))
+        self.url = f"/media/{self.name}"
+
+    def test_hashed_name_is_immutable(self):
+        self.assertRegex(self.name, r"^2024/05/poster\.[0-9a-f]{12}\.txt$")
+        # 같은 내용은 같은 이름으로 한 번만 저장합니다.
+        self.assertEqual(
+            default_storage.save("2024/05/poster.txt", ContentFile(b"0123456789")),
+            self.name,
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_long_name_fits_max_length(self):
+        name = default_storage.save(
+            f"2024/05/{'a' * 88}.txt", ContentFile(b"long"), max_length=100
+        )
+        self.assertLessEqual(len(name), 100)
+        self.assertRegex(name, r"^2024/05/a+_?\w*\.[0-9a-f]{12}\.txt$")
+        self.assertTrue(default_storage.exists(name))
+
+    def test_upload_with_hash_like_name_is_hashed_again(self):
+        name = default_storage.save(
+            "2024/05/poster.0123456789ab.txt", ContentFile(b"other")
+        )
+        self.assertRegex(name, r"^2024/05/poster\.0123456789ab\.[0-9a-f]{12}\.txt$")
+
+        # 이미지 변환본만 이름 그대로 저장합니다.
+        self.assertEqual(
+            default_storage.save(
+                "2024/05/poster.0123456789ab.thumb.webp", DerivedContentFile(b"thumb")
+            ),
+            "2024/05/poster.0123456789ab.thumb.webp",
+        )
+
+    def test_conditional_request(self):
+        etag = self.client.get(self.url)["ETag"]
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(self.url, HTTP_IF_NONE_MATCH=if_none_match)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH='W/"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_range_request(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=2-4")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"234")
+        self.assertEqual(response["Content-Range"], "bytes 2-4/10")
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=-3")
+        self.assertEqual(b"".join(response.streaming_content), b"789")
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=20-")
+        self.assertEqual(response.status_code, 416)
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=2-4", HTTP_IF_RANGE='"old"')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(MEDIA_SENDFILE="x-accel-redirect")
+    def test_accel_redirect(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{self.name}")
+        self.assertEqual(response.content, b"")
+
+        name = default_storage.save("2024/05/공연 포스터#1.txt", ContentFile(b"poster"))
+        response = self.client.get(f"/media/{quote(name)}")
+        self.assertEqual(
+            response["X-Accel-Redirect"], f"/protected-media/{quote(name)}"
+        )
+        self.assertTrue(response["X-Accel-Redirect"].isascii())
+
+    def test_missing_and_traversal(self):
+        self.assertEqual(self.client.get("/media/missing.txt").status_code, 404)
+        self.assertEqual(self.client.get("/media/../manage.py").status_code, 404)
@@ -5,6 +5,16 @@ urlpatterns = [
     path("", views.EventView.as_view(), name="event_view"),
     path("search/", views.EventSearchView.as_view(), name="event_search_view"),
     path("<int:event_id>/", views.EventDetailView.as_view(), name="event_detail_view"),
+    path(
+        "reviewable/",
+        views.ReviewableEventView.as_view(),
+        name="reviewable_event_view",
+    ),
+    path(
+        "cache-stats/",
+        views.EventDetailCacheStatsView.as_view(),
+        name="event_detail_cache_stats_view",
+    ),
     path("<int:event_id>/like/", views.LikeView.as_view(), name="like"),
     path(
         "<int:event_id>/review/",
@@ -17,6 +27,11 @@ urlpatterns = [
         name="event_review_detail_view",
     ),
     path("<int:event_id>/booking/", views.TicketView.as_view(), name="ticket_view"),
+    path(
+        "<int:event_id>/ticket-status/",
+        views.TicketStatusView.as_view(),
+        name="ticket_status_view",
+    ),
     path(
         "<int:ticket_id>/ticket/",
         views.TicketDetailView.as_view(),
@@ -3,10 +3,21 @@ from rest_framework import status, permissions, generics
 from rest_framework.decorators import APIView
 from rest_framework.response import Response
 from rest_framework.generics import get_object_or_404
+from config.etags import collections, conditional_get
 from events.models import Event, EventReview, Ticket, TicketBooking, EventList
+from events import availability, detail_cache, eligibility
 from stores.throttling import ObjectThrottle
 from django.db.models import F, Q
+from django.utils import timezone
 from events.permissons import CustomPermission, IsOwnerOrReadOnly
+from events.pagination import (
+    BookingCursorPagination,
+    EventCursorPagination,
+    SearchPagination,
+)
+from users.authentication import ClaimsJWTAuthentication
+from users.relations import set_relation
+from events.search import fetch_ranked, rank
 from events.serializers import (
     EventCreateSerializer,
     EventSerializer,
@@ -16,6 +27,7 @@ from events.serializers import (
     EventReviewCreateSerializer,
     TicketCreateSerializer,
     TicketSerializer,
+    TicketStatusSerializer,
     BookedTicketSerializer,
     BookedTicketCountSerializer,
     EventScrapSerializer,
@@ -23,28 +35,67 @@ from events.serializers import (
 
 
 class EventListView(APIView):
+    """
+    크롤링한 공연 목록을 조회합니다.
+    q 값이 있으면 제목을 n-gram 색인으로 검색하여 관련도 순으로 페이지네이션 합니다.
+    크롤링한 공연이 바뀌지 않았으면 If-None-Match 요청에 쿼리 없이 304를 응답합니다.
+    """
+
+    @conditional_get(collections("event_lists"))
     def get(self, request):
-        eventlist = EventList.objects.all()
+        ranked = rank(request.GET.get("q", ""), "event_list")
+        if ranked is None:
+            eventlist = EventList.objects.all()
+            serializer = EventScrapSerializer(eventlist, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(ranked, request, view=self)
+        eventlist = fetch_ranked(EventList.objects.all(), page, "event_list")
         serializer = EventScrapSerializer(eventlist, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class EventSearchView(APIView):
+    """
+    공연 제목과 내용을 n-gram 색인으로 검색합니다.
+    검색어(q 또는 title)의 모든 2-gram을 포함하는 공연을 제목 일치에 가중치를 두어 관련도 순으로 페이지네이션 합니다.
+    검색어가 없으면 전체 공연을 최신순으로 조회합니다.
+    """
+
     def get(self, request):
-        event = Event.objects.all().order_by("-created_at")
-        search = request.GET.get("title", "")
-        search_list = event.filter(Q(title__icontains=search))
-        serializer = EventListSerializer(search_list, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        query = request.GET.get("q", request.GET.get("title", ""))
+        ranked = rank(query)
+        if ranked is None:
+            paginator = EventCursorPagination()
+            page = paginator.paginate_queryset(
+                Event.objects.for_list(), request, view=self
+            )
+            serializer = EventListSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
+
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(ranked, request, view=self)
+        events = fetch_ranked(Event.objects.for_list(), page)
+        serializer = EventListSerializer(events, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class EventView(APIView):
+    """
+    공연 목록은 최신순으로 cursor 페이지네이션 되어 next, previous, results 형태로 응답합니다.
+    공연 목록이 바뀌지 않았으면 If-None-Match 요청에 쿼리 없이 304를 응답합니다.
+    """
+
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, CustomPermission]
 
+    @conditional_get(collections("events"))
     def get(self, request):
-        event = Event.objects.all().order_by("-created_at")
-        serializer = EventListSerializer(event, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        event = Event.objects.for_list()
+        paginator = EventCursorPagination()
+        page = paginator.paginate_queryset(event, request, view=self)
+        serializer = EventListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     def post(self, request, *args, **kwargs):
         serializer = EventCreateSerializer(data=request.data)
@@ -56,12 +107,20 @@ class EventView(APIView):
 
 
 class EventDetailView(APIView):
+    """
+    공연 상세 응답은 공연별 버전 번호로 캐시되며,
+    공연/리뷰/티켓/좋아요/북마크가 바뀌면 신호로 버전이 올라가 무효화됩니다.
+    """
+
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, CustomPermission]
 
     def get(self, request, event_id):
-        event = get_object_or_404(Event, id=event_id)
-        serializer = EventSerializer(event)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        def build():
+            event = get_object_or_404(Event.objects.select_related("author"), id=event_id)
+            return EventSerializer(event).data
+
+        data = detail_cache.get_or_build(event_id, build)
+        return Response(data, status=status.HTTP_200_OK)
 
     def put(self, request, event_id):
         event = get_object_or_404(Event, id=event_id)
@@ -80,9 +139,21 @@ class EventDetailView(APIView):
         return Response({"message": "삭제완료"}, status=status.HTTP_200_OK)
 
 
+class EventDetailCacheStatsView(APIView):
+    """
+    공연 상세 응답 캐시의 hit/miss 수와 hit ratio를 조회합니다. 관리자만 사용가능합니다.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(detail_cache.stats(), status=status.HTTP_200_OK)
+
+
 class EventReviewView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     throttle_classes = [ObjectThrottle]
+    throttle_scope = "event_review"
     serializer_class = EventReviewSerializer
 
     def get(self, request, event_id):
@@ -99,10 +170,7 @@ class EventReviewView(APIView):
             data=request.data, context={"request": request}
         )
         event = get_object_or_404(Event, id=event_id)
-        ticket_bookings = TicketBooking.objects.filter(
-            ticket__event_id=event_id, author=request.user
-        )
-        if ticket_bookings.exists():
+        if eligibility.can_review(request.user, event.id):
             if serializer.is_valid():
                 serializer.save(author=request.user, event=event)
                 return Response({"message": "작성완료"}, status=status.HTTP_201_CREATED)
@@ -112,6 +180,28 @@ class EventReviewView(APIView):
         return Response({"message": "구매 기록이 없습니다"}, status=status.HTTP_403_FORBIDDEN)
 
 
+class ReviewableEventView(APIView):
+    """
+    ids(쉼표로 구분한 공연 id) 중 로그인한 회원이 후기를 작성할 수 있는 공연 id 목록을 조회합니다.
+    공연 목록/상세 페이지의 "후기 작성" 표시를 공연마다 따로 확인하지 않고 한 번에 확인할 때 사용합니다.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        try:
+            event_ids = [int(i) for i in request.GET.get("ids", "").split(",") if i]
+        except ValueError:
+            return Response(
+                {"message": "ids 값을 확인해 주세요."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        reviewable = eligibility.reviewable(request.user, event_ids)
+        return Response(
+            {"reviewable": sorted(reviewable)}, status=status.HTTP_200_OK
+        )
+
+
 class EventReviewDetailView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
 
@@ -171,6 +261,20 @@ class TicketView(generics.ListCreateAPIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class TicketStatusView(APIView):
+    """
+    공연 생성 후 티켓 생성 진행 상황을 조회합니다.
+    기간이 긴 공연은 티켓을 백그라운드에서 생성하므로, 공연 작성자는 이 값을 polling 하여 완료 여부를 확인합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get(self, request, event_id):
+        event = get_object_or_404(Event, id=event_id)
+        serializer = TicketStatusSerializer(event)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
 class TicketDetailView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, CustomPermission]
 
@@ -191,15 +295,20 @@ class TicketDateDetailView(APIView):
     공연id, 공연날짜를 이용하여, 해당 값에 맞는 티켓의 정보를 조회합니다.
     로그인한 회원만 사용가능합니다.
     event_date의 타입이 date 타입이기 때문에 url에서 사용하기 위해서 event_date의 타입은 str형으로 사용되어야 합니다.
+    잔여 좌석 정보는 캐시에서 조회하며, 예매/취소가 커밋되면 무효화됩니다.
     """
 
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, event_id, event_date):
-        ticket = Ticket.objects.filter(event=event_id, event_date=str(event_date))
-        # ).exclude(current_booking=F("max_booking_count"))
-        serializer = TicketSerializer(ticket, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        event_date = availability.parse_event_date(event_date)
+        if event_date is None:
+            return Response(
+                {"message": "올바른 날짜(YYYY-MM-DD)를 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        tickets = availability.get_tickets(event_id, event_date)
+        return Response(tickets, status=status.HTTP_200_OK)
 
 
 class TicketTimeDetailView(APIView):
@@ -208,16 +317,21 @@ class TicketTimeDetailView(APIView):
     로그인한 회원만 사용가능합니다.
     event_date의 타입이 date 타입이기 때문에 url에서 사용하기 위해서 event_date의 타입은 str형으로 사용되어야 합니다.
     event_time의 타입이 varchar 타입이기 때문에 url에서 사용하기 위해서 event_time의 타입은 str형으로 사용되어야 합니다.
+    잔여 좌석 정보는 캐시에서 조회하며, 예매/취소가 커밋되면 무효화됩니다.
     """
 
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, event_id, event_date, event_time):
-        ticket = Ticket.objects.filter(
-            event=event_id, event_date=str(event_date), event_time=str(event_time)
-        )
-        serializer = TicketSerializer(ticket, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        event_date = availability.parse_event_date(event_date)
+        event_time = availability.parse_event_time(event_time)
+        if event_date is None or event_time is None:
+            return Response(
+                {"message": "올바른 날짜(YYYY-MM-DD)와 시간(HH:MM-HH:MM)을 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        tickets = availability.get_tickets(event_id, event_date, event_time)
+        return Response(tickets, status=status.HTTP_200_OK)
 
 
 class LikeView(APIView):
@@ -229,18 +343,27 @@ class LikeView(APIView):
     요청 성공 시 상태메시지 200을 출력합니다
     해당 likes 필드에 요청한 회원이 없을 경우 "like했습니다."메시지를 출력합니다
     해당 likes 필드에 요청한 회원이 있을 경우 "unlike했습니다.: 메시지를 출력합니다
+    PUT / DELETE
+    현재 상태와 관계없이 좋아요를 설정 / 해제합니다. 여러 번 요청해도 결과가 같습니다.
     """
 
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, event_id):
-        event = get_object_or_404(Event, id=event_id)
-        if request.user in event.likes.all():
-            event.likes.remove(request.user)
-            return Response({"message": "unlike했습니다."}, status=status.HTTP_200_OK)
-        else:
-            event.likes.add(request.user)
+        event = get_object_or_404(Event.objects.only("id"), id=event_id)
+        if set_relation(event.likes, request.user):
             return Response({"message": "like했습니다."}, status=status.HTTP_200_OK)
+        return Response({"message": "unlike했습니다."}, status=status.HTTP_200_OK)
+
+    def put(self, request, event_id):
+        event = get_object_or_404(Event.objects.only("id"), id=event_id)
+        set_relation(event.likes, request.user, True)
+        return Response({"message": "like했습니다."}, status=status.HTTP_200_OK)
+
+    def delete(self, request, event_id):
+        event = get_object_or_404(Event.objects.only("id"), id=event_id)
+        set_relation(event.likes, request.user, False)
+        return Response({"message": "unlike했습니다."}, status=status.HTTP_200_OK)
 
 
 class BookingTicketDetailView(APIView):
@@ -255,7 +378,9 @@ class BookingTicketDetailView(APIView):
     def get(self, request, id):
         try:
             user = self.request.user
-            ticket_booking = TicketBooking.objects.filter(id=id, author=user).first()
+            ticket_booking = (
+                TicketBooking.objects.for_history().filter(id=id, author=user).first()
+            )
             if not ticket_booking:
                 return Response(
                     {"message": "예매한 티켓이 없습니다."}, status=status.HTTP_404_NOT_FOUND
@@ -283,7 +408,8 @@ class BookingTicketView(APIView):
         current_booking(현재 예매된 티켓의 수량)의 값이 quantity(예매하고자 하는 수량)을 더하여 max_booking_count(최대 수량)을 넘을 경우
         "예매가 불가능합니다." 메시지와 400 상태메시지를 출력합니다
 
-        예매가 가능한 상황이라면, current_booking에 quantity 값을 더해주고, 더해준 값을 해당 티켓에 저장해주고, 예매 내역을 ticket_booking에 저장해주고
+        예매가 가능한 상황이라면, Ticket.book()이 좌석 확인과 current_booking 증가를 하나의 조건부 UPDATE로 처리하고
+        같은 트랜잭션 안에서 예매 내역을 ticket_booking에 저장한 뒤
         "예매가 완료되었습니다." 메시지와 201 상태메시지를 출력합니다.
         """
 
@@ -302,21 +428,13 @@ class BookingTicketView(APIView):
                     {"message": "올바른 수량(quantity)을 입력해주세요."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            if ticket.current_booking + quantity > ticket.max_booking_count:
+
+            ticket_booking = ticket.book(request.user, quantity)
+            if ticket_booking is None:
                 return Response(
                     {"message": "예매가 불가능합니다."}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            ticket_booking = TicketBooking(
-                author=request.user,
-                ticket=ticket,
-                money=ticket.money,
-                quantity=quantity,
-            )
-            ticket.current_booking += quantity
-            ticket.save()
-            ticket_booking.save()
-
             serializer = BookedTicketCountSerializer(ticket_booking)
             return Response({"message": "예매가 완료되었습니다."}, status=status.HTTP_201_CREATED)
 
@@ -324,21 +442,46 @@ class BookingTicketView(APIView):
 
 
 class BookingTicketListView(generics.ListAPIView):
+    """
+    회원의 예매 내역을 최신 예매순으로 cursor 기반 페이지네이션 합니다.
+    when=upcoming 이면 관람일이 오늘 이후인 예매만, when=past 이면 지난 예매만 조회합니다.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = BookedTicketSerializer
+    pagination_class = BookingCursorPagination
 
     def get_queryset(self):
         user = self.request.user
-        booked_tickets = TicketBooking.objects.filter(author=user)
+        booked_tickets = TicketBooking.objects.for_history().filter(author=user)
+        when = self.request.GET.get("when")
+        if when == "upcoming":
+            booked_tickets = booked_tickets.upcoming(timezone.localdate())
+        elif when == "past":
+            booked_tickets = booked_tickets.past(timezone.localdate())
         return booked_tickets
 
 
 class EventBookmarkView(APIView):
+    """
+    POST 요청은 북마크를 토글하고, PUT / DELETE 요청은 북마크를 설정 / 해제합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
     def post(self, request, event_id):
-        event = get_object_or_404(Event, id=event_id)
-        if request.user in event.event_bookmarks.all():
-            event.event_bookmarks.remove(request.user)
-            return Response({"message": "북마크가 취소되었습니다."}, status=status.HTTP_200_OK)
-        else:
-            event.event_bookmarks.add(request.user)
+        event = get_object_or_404(Event.objects.only("id"), id=event_id)
+        if set_relation(event.event_bookmarks, request.user):
             return Response({"message": "북마크 완료했습니다."}, status=status.HTTP_200_OK)
+        return Response({"message": "북마크가 취소되었습니다."}, status=status.HTTP_200_OK)
+
+    def put(self, request, event_id):
+        event = get_object_or_404(Event.objects.only("id"), id=event_id)
+        set_relation(event.event_bookmarks, request.user, True)
+        return Response({"message": "북마크 완료했습니다."}, status=status.HTTP_200_OK)
+
+    def delete(self, request, event_id):
+        event = get_object_or_404(Event.objects.only("id"), id=event_id)
+        set_relation(event.event_bookmarks, request.user, False)
+        return Response({"message": "북마크가 취소되었습니다."}, status=status.HTTP_200_OK)
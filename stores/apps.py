@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class StoresConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "stores"
+
+    def ready(self):
+        from stores import signals  # noqa: F401
@@ -0,0 +1,195 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from config import etags
+from stores import spatial
+from stores.models import GeocodeCache, Store
+
+logger = logging.getLogger(__name__)
+
+
+class GeocodingError(Exception):
+    """
+    외부 API 호출이 실패한 경우(시간 초과, 연결 실패, 5xx 등) 발생합니다.
+    주소를 찾지 못한 경우는 오류가 아니라 None을 반환합니다.
+    """
+
+
+class KakaoGeocoder:
+    """
+    카카오 로컬 API로 주소를 좌표로 변환합니다.
+    GEOCODE_TIMEOUT(초) 안에 응답이 없으면 GEOCODE_RETRIES번 다시 시도합니다.
+    """
+
+    url = "https://dapi.kakao.com/v2/local/search/address.json"
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = os.environ.get("KakaoAK", "")
+
+    def geocode(self, address):
+        for attempt in range(settings.GEOCODE_RETRIES + 1):
+            try:
+                response = self.session.get(
+                    self.url,
+                    params={"query": address},
+                    timeout=settings.GEOCODE_TIMEOUT,
+                )
+                if response.status_code < 500:
+                    break
+            except requests.RequestException:
+                pass
+            # 마지막 시도가 실패하면 기다리지 않고 바로 실패로 처리합니다.
+            if attempt < settings.GEOCODE_RETRIES:
+                time.sleep(0.2 * 2**attempt)
+        else:
+            raise GeocodingError(address)
+
+        if response.status_code >= 400:
+            raise GeocodingError(f"{response.status_code}: {address}")
+        documents = response.json().get("documents")
+        if not documents:
+            return None
+        return float(documents[0]["x"]), float(documents[0]["y"])
+
+
+class StubGeocoder:
+    """
+    테스트와 로컬 개발용 geocoder 입니다. 외부 API를 호출하지 않고 locations에 등록된 좌표만 반환합니다.
+    """
+
+    locations = {}
+
+    def geocode(self, address):
+        return self.locations.get(address)
+
+
+def get_geocoder():
+    return import_string(settings.GEOCODER_BACKEND)()
+
+
+def normalize_address(address):
+    return " ".join(address.split())
+
+
+MISSING = object()
+
+
+def _cached(address):
+    """
+    GEOCODE_CACHE_TTL 안에 저장된 변환 결과를 반환합니다. 저장된 결과가 없으면 MISSING을 반환합니다.
+    """
+    cached = (
+        GeocodeCache.objects.filter(
+            address=address,
+            fetched_at__gte=timezone.now()
+            - timedelta(seconds=settings.GEOCODE_CACHE_TTL),
+        )
+        .values_list("location_x", "location_y")
+        .first()
+    )
+    if cached is None:
+        return MISSING
+    if cached[0] is None:
+        return None
+    return cached
+
+
+def _save(address, location):
+    GeocodeCache.objects.update_or_create(
+        address=address,
+        defaults={
+            "location_x": location[0] if location else None,
+            "location_y": location[1] if location else None,
+        },
+    )
+
+
+def cached_location(address):
+    """
+    캐시에 저장된 좌표만 반환하고 외부 API는 호출하지 않습니다.
+    저장된 값이 없거나, 주소를 찾지 못했던 경우 None을 반환합니다.
+    """
+    location = _cached(normalize_address(address))
+    return None if location is MISSING else location
+
+
+def geocode(address):
+    """
+    주소를 좌표 (x, y)로 변환합니다. 캐시에 없을 때만 외부 API를 호출하고 결과를 캐시에 저장합니다.
+    주소를 찾지 못하면 None을, API 호출이 실패하면 GeocodingError를 발생시킵니다.
+    """
+    address = normalize_address(address)
+    location = _cached(address)
+    if location is MISSING:
+        location = get_geocoder().geocode(address)
+        _save(address, location)
+    return location
+
+
+def geocode_store(store_id):
+    """
+    좌표가 비어 있는(pending) 한복집의 좌표를 채웁니다. 한복집 생성 후 백그라운드에서 실행됩니다.
+    """
+    store = Store.objects.get(id=store_id)
+    location = geocode(store.store_address)
+    if location:
+        store.location_x, store.location_y = location
+        store.save(update_fields=["location_x", "location_y"])
+
+
+def geocode_stores(stores, concurrency=None):
+    """
+    여러 한복집의 좌표를 채웁니다.
+    같은 주소는 한 번만 조회하고, 캐시에 없는 주소만 최대 concurrency개씩 동시에 외부 API로 조회합니다.
+    실패한 한복집은 좌표를 비워두어 다음 실행 때 다시 시도합니다.
+    (채운 개수, 실패한 개수)를 반환합니다.
+    """
+    geocoder = get_geocoder()
+    locations = {}
+    pending = []
+    for address in {normalize_address(store.store_address) for store in stores}:
+        location = _cached(address)
+        if location is MISSING:
+            pending.append(address)
+        else:
+            locations[address] = location
+
+    def lookup(address):
+        try:
+            return address, geocoder.geocode(address)
+        except Exception:
+            logger.warning("geocoding failed: %s", address, exc_info=True)
+            return address, GeocodingError
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency or settings.GEOCODE_CONCURRENCY
+    ) as executor:
+        for address, location in executor.map(lookup, pending):
+            if location is not GeocodingError:
+                _save(address, location)
+            locations[address] = location
+
+    updated = []
+    failed = 0
+    for store in stores:
+        location = locations[normalize_address(store.store_address)]
+        if location is GeocodingError:
+            failed += 1
+        elif location:
+            store.location_x, store.location_y = location
+            updated.append(store)
+    Store.objects.bulk_update(updated, ["location_x", "location_y"], batch_size=500)
+    if updated:
+        # bulk_update는 신호를 보내지 않으므로 직접 무효화합니다.
+        spatial.invalidate()
+        etags.touch("stores")
+    return len(updated), failed
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from stores import purchases
+from stores.models import PurchaseRecord
+
+
+class Command(BaseCommand):
+    """
+    store/hanbok 링크가 없는 한복 결제 내역에 한복점과 한복을 채웁니다.
+    링크 도입 전 결제는 partner_order_id와 item_name에서 찾으며, 여러 번 실행해도 안전합니다.
+    """
+
+    help = "한복 결제 내역에 한복점/한복 링크를 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        records = PurchaseRecord.objects.filter(
+            Q(store__isnull=True) | Q(hanbok__isnull=True), type="hanbok"
+        ).order_by("id")
+        total = linked = 0
+        last_id = 0
+        while True:
+            batch = list(records.filter(id__gt=last_id)[: options["batch_size"]])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            total += len(batch)
+            changed = []
+            for record in batch:
+                before = (record.store_id, record.hanbok_id)
+                purchases.link(record)
+                if (record.store_id, record.hanbok_id) != before:
+                    changed.append(record)
+            with transaction.atomic():
+                PurchaseRecord.objects.bulk_update(changed, ["store", "hanbok"])
+                for user_id in {record.user_id for record in changed}:
+                    purchases.invalidate(user_id)
+            linked += len(changed)
+        self.stdout.write(f"한복 결제 {total}건 중 {linked}건 연결 완료")
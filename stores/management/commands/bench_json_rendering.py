@@ -0,0 +1,138 @@
+import random
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+
+from config.middleware import brotli
+from config.renderers import FastJSONRenderer
+from events.models import Event
+from events.serializers import EventListSerializer
+from stores.models import Store
+from stores.serializers import StoreListSerializer
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    한복집 목록(StoreListView)과 공연 목록(EventView) 응답 데이터를 JSONRenderer와 FastJSONRenderer로
+    만드는 시간, 그리고 gzip/brotli 압축 전후의 크기와 압축 시간을 비교합니다.
+    측정용 회원, 한복집, 공연은 마지막에 삭제됩니다.
+
+    python manage.py bench_json_rendering --stores 300 --events 200 --users 50
+    """
+
+    help = "JSON 렌더러별 렌더링 시간과 압축 전후 응답 크기를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stores", type=int, default=300)
+        parser.add_argument("--events", type=int, default=200)
+        parser.add_argument("--users", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def seed(self, options):
+        rng = random.Random(0)
+        users = User.objects.bulk_create(
+            User(email=f"bench_json{i}@gwolnadri.local", password="bench")
+            for i in range(options["users"])
+        )
+        stores = Store.objects.bulk_create(
+            Store(
+                owner=users[0],
+                store_name=f"bench_json 한복집{i}",
+                store_address=f"bench_json 서울 종로구 사직로 {i}",
+                location_x=rng.uniform(126.8, 127.2),
+                location_y=rng.uniform(37.4, 37.7),
+                like_count=rng.randint(0, len(users)),
+                review_count=rng.randint(0, 100),
+                rating_sum=rng.randint(0, 500),
+                rating_count=rng.randint(1, 100),
+            )
+            for i in range(options["stores"])
+        )
+        now = timezone.now()
+        events = Event.objects.bulk_create(
+            Event(
+                author=users[0],
+                title=f"bench_json 공연{i}",
+                content="경복궁 야간관람",
+                event_start_date=now,
+                event_end_date=now,
+                time_slots={"1": "19:00-20:00", "2": "20:00-21:00"},
+                max_booking=10,
+                money=1000,
+                like_count=rng.randint(0, len(users)),
+                review_count=rng.randint(0, 100),
+            )
+            for i in range(options["events"])
+        )
+        for relation, objects in (
+            (Store.likes, stores),
+            (Store.store_bookmarks, stores),
+            (Event.likes, events),
+            (Event.event_bookmarks, events),
+        ):
+            through = relation.through
+            source = relation.field.m2m_field_name() + "_id"
+            target = relation.field.m2m_reverse_field_name() + "_id"
+            through.objects.bulk_create(
+                through(**{source: obj.id, target: user.id})
+                for obj in objects
+                for user in rng.sample(users, rng.randint(0, len(users) // 2))
+            )
+        for store in stores:
+            store.tags.add(*rng.sample(["경복궁", "창덕궁", "덕수궁", "당의", "철릭"], 3))
+        return users, stores, events
+
+    def handle(self, *args, **options):
+        users, stores, events = self.seed(options)
+        try:
+            payloads = {
+                "stores": {
+                    "StoreList": StoreListSerializer(
+                        Store.objects.for_list().filter(id__in=[s.id for s in stores]),
+                        many=True,
+                    ).data
+                },
+                "events": EventListSerializer(
+                    Event.objects.for_list().filter(id__in=[e.id for e in events]),
+                    many=True,
+                ).data,
+            }
+            for name, data in payloads.items():
+                self.stdout.write(f"[{name}]")
+                content = None
+                for renderer in (JSONRenderer(), FastJSONRenderer()):
+                    started = time.perf_counter()
+                    for _ in range(options["repeat"]):
+                        rendered = renderer.render(data)
+                    elapsed = (time.perf_counter() - started) / options["repeat"]
+                    assert content is None or rendered == content
+                    content = rendered
+                    self.stdout.write(
+                        f"{renderer.__class__.__name__:>17}: {elapsed * 1000:.2f}ms"
+                    )
+
+                compressors = [("gzip", compress_string)]
+                if brotli is not None:
+                    quality = settings.COMPRESSION_BROTLI_QUALITY
+                    compressors.append(
+                        ("br", lambda s: brotli.compress(s, quality=quality))
+                    )
+                self.stdout.write(f"{'identity':>17}: {len(content) / 1024:.1f}KiB")
+                for encoding, compress in compressors:
+                    started = time.perf_counter()
+                    for _ in range(options["repeat"]):
+                        compressed = compress(content)
+                    elapsed = (time.perf_counter() - started) / options["repeat"]
+                    self.stdout.write(
+                        f"{encoding:>17}: {len(compressed) / 1024:.1f}KiB"
+                        f" ({elapsed * 1000:.2f}ms)"
+                    )
+        finally:
+            Store.objects.filter(id__in=[s.id for s in stores]).delete()
+            # 공연은 작성자와 함께 삭제됩니다.
+            User.objects.filter(id__in=[u.id for u in users]).delete()
@@ -0,0 +1,63 @@
+import heapq
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from stores.spatial import GridIndex, distance
+
+
+class Command(BaseCommand):
+    """
+    서울 일대에 임의의 한복집 좌표를 만들어 격자 색인 검색과 전체 탐색(brute force)의 시간을 비교합니다.
+    DB를 사용하지 않고 색인 자체의 성능만 측정합니다.
+
+    python manage.py bench_nearby_stores --stores 50000 --radius 1000
+    """
+
+    help = "주변 한복집 검색의 격자 색인과 전체 탐색 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stores", type=int, default=50000)
+        parser.add_argument("--queries", type=int, default=500)
+        parser.add_argument("--radius", type=float, default=1000)
+        parser.add_argument("--limit", type=int, default=20)
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        # 서울 (경도 126.8 ~ 127.2, 위도 37.4 ~ 37.7)
+        points = [
+            (i, rng.uniform(126.8, 127.2), rng.uniform(37.4, 37.7))
+            for i in range(options["stores"])
+        ]
+        queries = [
+            (rng.uniform(126.8, 127.2), rng.uniform(37.4, 37.7))
+            for _ in range(options["queries"])
+        ]
+        radius, limit = options["radius"], options["limit"]
+
+        started = time.perf_counter()
+        index = GridIndex(points)
+        build = time.perf_counter() - started
+
+        def brute_force(x, y):
+            found = []
+            for id, px, py in points:
+                d = distance(x, y, px, py)
+                if d <= radius:
+                    found.append((d, id))
+            return heapq.nsmallest(limit, found)
+
+        results = {}
+        for name, func in (
+            ("grid", lambda x, y: index.nearby(x, y, radius, limit)),
+            ("brute", brute_force),
+        ):
+            started = time.perf_counter()
+            results[name] = [func(x, y) for x, y in queries]
+            elapsed = (time.perf_counter() - started) / len(queries) * 1000
+            self.stdout.write(f"{name:>6}: {elapsed:.3f}ms / query")
+
+        self.stdout.write(f"build : {build * 1000:.1f}ms ({len(points)} stores)")
+        if results["grid"] != results["brute"]:
+            self.stderr.write(self.style.ERROR("격자 색인과 전체 탐색의 결과가 다릅니다."))
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from stores.geocoding import geocode_stores
+from stores.models import Store
+
+
+class Command(BaseCommand):
+    """
+    좌표가 비어 있는(pending) 한복집의 좌표를 채웁니다.
+    --all 옵션을 주면 모든 한복집의 좌표를 다시 조회합니다. (캐시가 만료된 주소만 외부 API를 호출합니다)
+
+    python manage.py geocode_stores --concurrency 4
+    """
+
+    help = "좌표가 비어 있는 한복집의 좌표를 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true")
+        parser.add_argument("--concurrency", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        stores = Store.objects.only("id", "store_address", "location_x", "location_y")
+        if not options["all"]:
+            stores = stores.filter(location_x__isnull=True)
+        stores = list(stores.order_by("id"))
+
+        started = time.perf_counter()
+        updated = failed = 0
+        batch_size = options["batch_size"]
+        for i in range(0, len(stores), batch_size):
+            done, error = geocode_stores(
+                stores[i : i + batch_size], options["concurrency"]
+            )
+            updated += done
+            failed += error
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{len(stores)}곳 중 {updated}곳 좌표 저장, {failed}곳 실패 ({elapsed:.1f}s)"
+        )
@@ -4,6 +4,21 @@ from users.models import User
 from django.core.validators import MaxValueValidator, MinValueValidator
 
 
+class StoreQuerySet(models.QuerySet):
+    def for_list(self):
+        """
+        한복집 목록 조회용 queryset 입니다.
+        좋아요 수, 평균 별점은 Store에 저장된 집계 값을 사용하고,
+        likes, store_bookmarks는 회원 id만, tags는 태그 이름과 함께 prefetch 하여
+        한복집 수와 관계없이 일정한 쿼리 수로 직렬화할 수 있습니다.
+        """
+        return self.prefetch_related(
+            models.Prefetch("likes", queryset=User.objects.only("id")),
+            models.Prefetch("store_bookmarks", queryset=User.objects.only("id")),
+            "tags",
+        )
+
+
 class Store(models.Model):
     owner = models.ForeignKey(
         User,
@@ -19,11 +34,39 @@ class Store(models.Model):
         User, related_name="bookmark_stores", blank=True
     )
     tags = TaggableManager(blank=True)
+    # 아래 값들은 신호로 갱신되는 집계 값입니다. (reconcile_counters로 보정)
+    like_count = models.IntegerField("좋아요 수", default=0)
+    bookmark_count = models.IntegerField("북마크 수", default=0)
+    review_count = models.IntegerField("후기 수", default=0)
+    rating_sum = models.IntegerField("평점 합계", default=0)
+    rating_count = models.IntegerField("평점 수", default=0)
+
+    objects = StoreQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["location_x", "location_y"], name="store_location_idx"),
+        ]
 
     def __str__(self):
         return self.store_name
 
 
+class GeocodeCache(models.Model):
+    """
+    주소 -> 좌표 변환 결과를 저장합니다.
+    address는 공백을 정리한 주소이며, 주소를 찾지 못한 경우 좌표는 null로 저장됩니다.
+    """
+
+    address = models.CharField("주소", max_length=500, unique=True)
+    location_x = models.FloatField("x좌표", blank=True, null=True)
+    location_y = models.FloatField("y좌표", blank=True, null=True)
+    fetched_at = models.DateTimeField("조회일", auto_now=True)
+
+    def __str__(self):
+        return self.address
+
+
 class Hanbok(models.Model):
     store = models.ForeignKey(
         Store,
@@ -60,9 +103,32 @@ class HanbokComment(models.Model):
         return self.content
 
 
+class PurchaseRecordQuerySet(models.QuerySet):
+    def history(self, user, type=None, approved=True):
+        """
+        회원의 결제 내역을 예약일순으로 조회합니다.
+        approved가 True이면 결제 완료, False이면 결제 대기 내역을 조회하며,
+        각각 approved_at 조건의 부분 인덱스(purchase_*_idx)를 사용합니다.
+        """
+        records = self.filter(user=user, approved_at__isnull=not approved)
+        if type:
+            records = records.filter(type=type)
+        return records.order_by("rsrvt_date", "id")
+
+
 class PurchaseRecord(models.Model):
+    """
+    store/hanbok(ForeignKey): 결제한 한복점/한복을 표현합니다. 행사 결제와 링크 도입 전 결제는 비어 있을 수 있습니다.
+    """
+
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    tid = models.CharField(max_length=100)
+    store = models.ForeignKey(
+        Store, on_delete=models.SET_NULL, null=True, blank=True, related_name="purchases"
+    )
+    hanbok = models.ForeignKey(
+        Hanbok, on_delete=models.SET_NULL, null=True, blank=True, related_name="purchases"
+    )
+    tid = models.CharField(max_length=100, unique=True)
     type = models.CharField(max_length=10)
     partner_order_id = models.BigIntegerField()
     partner_user_id = models.CharField(max_length=50)
@@ -77,3 +143,29 @@ class PurchaseRecord(models.Model):
     payment_method_type = models.CharField(max_length=50, blank=True, null=True)
     aid = models.CharField(max_length=100, blank=True, null=True)
     approved_at = models.DateTimeField(blank=True, null=True)
+
+    objects = PurchaseRecordQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "rsrvt_date"],
+                condition=models.Q(approved_at__isnull=False),
+                name="purchase_approved_idx",
+            ),
+            models.Index(
+                fields=["user", "type", "rsrvt_date"],
+                condition=models.Q(approved_at__isnull=False),
+                name="purchase_approved_type_idx",
+            ),
+            models.Index(
+                fields=["user", "type", "rsrvt_date"],
+                condition=models.Q(approved_at__isnull=True),
+                name="purchase_pending_idx",
+            ),
+            models.Index(
+                fields=["user", "store"],
+                condition=models.Q(approved_at__isnull=False, type="hanbok"),
+                name="purchase_store_idx",
+            ),
+        ]
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class PurchaseCursorPagination(CursorPagination):
+    """
+    결제 내역을 예약일순으로 cursor 기반 페이지네이션 합니다.
+    OFFSET 없이 (user, [type,] rsrvt_date) 부분 인덱스를 따라가므로 뒤 페이지도 일정한 비용으로 조회됩니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("rsrvt_date", "id")
@@ -0,0 +1,83 @@
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.cache import bump_version_on_commit, get_version
+from stores.models import Hanbok, PurchaseRecord, Store
+
+
+def hanbok_purchases(user):
+    """
+    회원의 결제 완료된 한복 구매 내역 입니다. (purchase_store_idx 부분 인덱스)
+    """
+    return PurchaseRecord.objects.filter(
+        user=user, type="hanbok", approved_at__isnull=False
+    )
+
+
+def can_review(user, store_id):
+    """
+    한복점 후기를 작성할 수 있는지(해당 한복점에서 결제를 완료했는지) 하나의 EXISTS 쿼리로 확인합니다.
+    """
+    return hanbok_purchases(user).filter(store_id=store_id).exists()
+
+
+def version_key(user_id):
+    return f"purchases:eligible:{user_id}:version"
+
+
+def eligible_store_ids(user):
+    """
+    회원이 후기를 작성할 수 있는 한복점 id 집합을 캐시에서 조회합니다.
+    후기가 많은 페이지에서 한복점마다 can_review를 호출하지 않고 한 번에 확인할 때 사용합니다.
+    """
+    key = f"purchases:eligible:{user.id}:v{get_version(version_key(user.id))}"
+    store_ids = cache.get(key)
+    if store_ids is None:
+        store_ids = set(
+            hanbok_purchases(user)
+            .filter(store__isnull=False)
+            .values_list("store_id", flat=True)
+        )
+        cache.set(key, store_ids, settings.PURCHASE_ELIGIBILITY_TIMEOUT)
+    return store_ids
+
+
+def invalidate(user_id):
+    bump_version_on_commit(version_key(user_id))
+
+
+def legacy_store_id(partner_order_id, year):
+    """
+    store 링크가 없던 결제의 partner_order_id("...{결제 연도}{한복점 id}")에서 한복점 id를 읽습니다.
+    예전 코드는 "2023"으로 나누었기 때문에 2024년 이후 결제에서는 한복점을 찾지 못했습니다.
+    """
+    match = re.search(rf"{year}(\d+)$", str(partner_order_id))
+    return int(match.group(1)) if match else None
+
+
+def link(record):
+    """
+    store/hanbok 링크가 없는 결제 내역에 한복점과 한복을 채웁니다. 저장은 하지 않습니다.
+    한복은 한복점의 한복 중 이름(item_name)이 하나만 일치할 때만 연결합니다.
+    """
+    if record.type != "hanbok":
+        return record
+    if record.store_id is None and record.hanbok_id is not None:
+        record.store_id = Hanbok.objects.values_list("store_id", flat=True).get(
+            id=record.hanbok_id
+        )
+    if record.store_id is None:
+        store_id = legacy_store_id(record.partner_order_id, record.created_at.year)
+        if store_id is not None and Store.objects.filter(id=store_id).exists():
+            record.store_id = store_id
+    if record.store_id is not None and record.hanbok_id is None:
+        hanboks = list(
+            Hanbok.objects.filter(
+                store_id=record.store_id, hanbok_name=record.item_name
+            ).values_list("id", flat=True)[:2]
+        )
+        if len(hanboks) == 1:
+            record.hanbok_id = hanboks[0]
+    return record
@@ -1,42 +1,24 @@
 from rest_framework import serializers
 from taggit.serializers import TagListSerializerField, TaggitSerializer
 from .models import Store, Hanbok, HanbokComment, PurchaseRecord
-import requests, json
-import os
-import environ
-from django.db.models import Avg
+from config.tasks import run_in_background
+from config.images import ImageVariantsField
+from . import geocoding, purchases
 from taggit.serializers import TagListSerializerField, TaggitSerializer
 
 
-# ✅ 위치정보 api
-def get_location(address):
-    url = "https://dapi.kakao.com/v2/local/search/address.json?query=" + address
-    headers = {"Authorization": os.environ.get("KakaoAK")}
-    location = requests.get(url, headers=headers).json()["documents"][0]
-    result = [
-        location["x"],
-        location["y"],
-    ]
-    return result
-
-
-# ✅ 한복집 리스트 (id, 판매자, 가게이름, 가게주소, x좌표, y좌표, 전체 좋아요 수, 평균 별점, 북마크)
+# ✅ 한복집 리스트 (id, 판매자, 가게이름, 가게주소, x좌표, y좌표, 전체 좋아요 수, 평균 별점, 후기 수, 북마크)
 class StoreListSerializer(TaggitSerializer, serializers.ModelSerializer):
-    owner = serializers.SerializerMethodField()
-    total_likes = serializers.SerializerMethodField()
+    owner = serializers.IntegerField(source="owner_id", read_only=True)
+    total_likes = serializers.IntegerField(source="like_count", read_only=True)
     avg_stars = serializers.SerializerMethodField()
+    review_count = serializers.IntegerField(read_only=True)
     tags = TagListSerializerField()
 
-    def get_owner(self, obj):
-        return obj.owner.id
-
-    def get_total_likes(self, obj):
-        return obj.likes.count()
-
     def get_avg_stars(self, obj):
-        return HanbokComment.objects.filter(store=obj.id).aggregate(
-            avg_stars=Avg("grade")
-        )
+        if not obj.rating_count:
+            return None
+        return round(obj.rating_sum / obj.rating_count, 2)
 
     class Meta:
         model = Store
@@ -50,11 +32,23 @@ class StoreListSerializer(TaggitSerializer, serializers.ModelSerializer):
             "likes",
             "total_likes",
             "avg_stars",
+            "review_count",
             "store_bookmarks",
             "tags",
         )
 
 
+# ✅ 주변 한복집 리스트 (한복집 리스트 + 거리(m))
+class NearbyStoreSerializer(StoreListSerializer):
+    distance = serializers.SerializerMethodField()
+
+    def get_distance(self, obj):
+        return round(self.context["distances"][obj.id])
+
+    class Meta(StoreListSerializer.Meta):
+        fields = StoreListSerializer.Meta.fields + ("distance",)
+
+
 # ✅ 한복집 추가 (가게이름, 가게주소)
 class CreateStoreSerializer(TaggitSerializer, serializers.ModelSerializer):
     tags = TagListSerializerField()
@@ -67,24 +61,26 @@ class CreateStoreSerializer(TaggitSerializer, serializers.ModelSerializer):
             "tags",
         )
 
-    # ✅ 한복집 x,y좌표 | 별점(후기없는경우 0) 추가
+    # ✅ 한복집 x,y좌표 추가
+    # 캐시된 좌표가 없으면 좌표를 비워둔 채(pending) 생성하고, 커밋 후 백그라운드에서 좌표를 채웁니다.
     def create(self, validated_data):
-        location_result = get_location(validated_data["store_address"])
-        print(validated_data)
+        location_result = geocoding.cached_location(validated_data["store_address"])
         store = Store.objects.create(
             owner=validated_data["owner"],
             store_name=validated_data["store_name"],
             store_address=validated_data["store_address"],
-            location_x=location_result[0],
-            location_y=location_result[1],
+            location_x=location_result[0] if location_result else None,
+            location_y=location_result[1] if location_result else None,
         )
-        store.save()
+        if location_result is None:
+            run_in_background(geocoding.geocode_store, store.id)
         return store
 
 
 # ✅ 한복상품정보 (제품명, 제품설명, 가격, 이미지)
 class HanbokSerializer(serializers.ModelSerializer):
     owner = serializers.SerializerMethodField()
+    hanbok_image_variants = ImageVariantsField(source="hanbok_image")
 
     def get_owner(self, obj):
         owner = obj.owner.email.split("@")[0]
@@ -110,6 +106,7 @@ class CreateHanbokSerializer(serializers.ModelSerializer):
 # ✅ 한복점 리뷰 열람 (후기내용, 후기사진, 평점, 생성일, 수정일)
 class CommentSerializer(serializers.ModelSerializer):
     username = serializers.SerializerMethodField()
+    review_image_variants = ImageVariantsField(source="review_image")
 
     def get_username(self, obj):
         return obj.user.username
@@ -123,6 +120,7 @@ class CommentSerializer(serializers.ModelSerializer):
             "user",
             "content",
             "review_image",
+            "review_image_variants",
             "grade",
             "created_at",
             "updated_at",
@@ -142,9 +140,27 @@ class CreateCommentSerializer(serializers.ModelSerializer):
 
 # ✅ 결제 정보 기록용 Serializer
 class PurchaseRecordCreateSerializer(serializers.ModelSerializer):
+    """
+    한복 결제는 store/hanbok 값이 없으면 hanbok 또는 partner_order_id에서 찾아 연결합니다.
+    """
+
+    def create(self, validated_data):
+        record = purchases.link(PurchaseRecord(**validated_data))
+        record.save()
+        return record
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        purchases.link(instance)
+        instance.save()
+        return instance
+
     class Meta:
         model = PurchaseRecord
         fields = [
+            "store",
+            "hanbok",
             "tid",
             "type",
             "partner_order_id",
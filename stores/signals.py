@@ -0,0 +1,42 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from config import etags, images
+from config.counters import count_relation, count_reviews
+from stores import purchases, spatial
+from stores.models import Hanbok, HanbokComment, PurchaseRecord, Store
+
+count_relation(Store, "likes", "like_count")
+count_relation(Store, "store_bookmarks", "bookmark_count")
+count_reviews(HanbokComment, "store", Store)
+images.register(Hanbok, "hanbok_image")
+images.register(HanbokComment, "review_image")
+
+
+@receiver([post_save, post_delete], sender=Store)
+def invalidate_spatial_index(sender, instance, **kwargs):
+    spatial.invalidate()
+
+
+@receiver([post_save, post_delete], sender=Store)
+def touch_stores(sender, **kwargs):
+    etags.touch("stores")
+
+
+@receiver([post_save, post_delete], sender=HanbokComment)
+def touch_store_comments(sender, instance, **kwargs):
+    # 한복집 목록의 평균 별점/후기 수도 바뀝니다.
+    etags.touch("stores", f"comments:{instance.store_id}")
+
+
+@receiver(m2m_changed, sender=Store.likes.through)
+@receiver(m2m_changed, sender=Store.store_bookmarks.through)
+@receiver(m2m_changed, sender=Store.tags.through)
+def touch_stores_relations(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        etags.touch("stores")
+
+
+@receiver([post_save, post_delete], sender=PurchaseRecord)
+def invalidate_eligible_stores(sender, instance, **kwargs):
+    purchases.invalidate(instance.user_id)
@@ -0,0 +1,94 @@
+import heapq
+import math
+import threading
+from collections import defaultdict
+
+from config.cache import bump_version_on_commit, get_version
+
+EARTH_RADIUS = 6371000
+METERS_PER_DEGREE = 111320
+VERSION_KEY = "stores:spatial:version"
+
+
+def distance(x1, y1, x2, y2):
+    """
+    두 좌표 사이의 거리(m)를 haversine 공식으로 계산합니다.
+    x는 경도, y는 위도 입니다. (카카오 좌표계)
+    """
+    lon1, lat1, lon2, lat2 = map(math.radians, (x1, y1, x2, y2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+def bounding_box(x, y, radius):
+    """
+    (x, y)에서 radius(m) 안의 점을 모두 포함하는 (min_x, max_x, min_y, max_y)를 반환합니다.
+    """
+    dy = radius / METERS_PER_DEGREE
+    dx = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(y)), 0.01))
+    return x - dx, x + dx, y - dy, y + dy
+
+
+class GridIndex:
+    """
+    좌표를 cell_size(도) 크기의 격자로 나누어 저장하는 공간 색인 입니다.
+    반경 검색 시 bounding box와 겹치는 격자만 확인하므로 전체 점을 훑지 않습니다.
+    """
+
+    def __init__(self, points, cell_size=0.01):
+        self.cell_size = cell_size
+        self.size = 0
+        self.cells = defaultdict(list)
+        for id, x, y in points:
+            self.cells[self._cell(x, y)].append((id, x, y))
+            self.size += 1
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def nearby(self, x, y, radius, limit):
+        """
+        (x, y)에서 radius(m) 안에 있는 점을 가까운 순으로 최대 limit개 [(거리, id), ...] 반환합니다.
+        """
+        min_x, max_x, min_y, max_y = bounding_box(x, y, radius)
+        min_cx, min_cy = self._cell(min_x, min_y)
+        max_cx, max_cy = self._cell(max_x, max_y)
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for id, px, py in self.cells.get((cx, cy), ()):
+                    d = distance(x, y, px, py)
+                    if d <= radius:
+                        found.append((d, id))
+        return heapq.nsmallest(limit, found)
+
+
+_lock = threading.Lock()
+_index = None
+_index_version = None
+
+
+def get_index():
+    """
+    프로세스마다 한 번 만든 색인을 재사용합니다.
+    한복집이 저장/삭제되면 캐시의 버전이 올라가고, 각 프로세스는 다음 검색 때 버전을 비교해 색인을 다시 만듭니다.
+    """
+    global _index, _index_version
+    from stores.models import Store
+
+    version = get_version(VERSION_KEY)
+    with _lock:
+        if _index is None or _index_version != version:
+            points = Store.objects.filter(
+                location_x__isnull=False, location_y__isnull=False
+            ).values_list("id", "location_x", "location_y")
+            _index = GridIndex(points)
+            _index_version = version
+        return _index
+
+
+def invalidate():
+    bump_version_on_commit(VERSION_KEY)
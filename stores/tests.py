@@ -1 +1,588 @@
-from django.test import TestCase
+import gzip
+import multiprocessing
+from datetime import datetime, time
+from decimal import Decimal
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+import requests
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from config.renderers import FastJSONRenderer
+from stores import geocoding, purchases
+from stores.models import GeocodeCache, Hanbok, HanbokComment, PurchaseRecord, Store
+from stores.throttling import ObjectThrottle
+from users.models import User
+
+
+def create_store(owner, **kwargs):
+    return Store.objects.create(
+        owner=owner,
+        store_name=kwargs.pop("store_name", "궐나드리 한복"),
+        store_address=kwargs.pop("store_address", "서울 종로구 사직로 161"),
+        **kwargs,
+    )
+
+
+class StoreRelationToggleTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.store = create_store(self.user)
+        self.like_url = reverse("like_view", args=[self.store.id])
+        self.bookmark_url = reverse("bookmark_store_view", args=[self.store.id])
+        self.client.force_authenticate(self.user)
+
+    def test_like_toggle(self):
+        response = self.client.post(self.like_url)
+        self.assertEqual(response.json()["message"], "좋아요 눌렀습니다")
+        response = self.client.post(self.like_url)
+        self.assertEqual(response.json()["message"], "좋아요가 취소되었습니다")
+        self.assertFalse(self.store.likes.exists())
+
+    def test_bookmark_set_and_unset_are_idempotent(self):
+        self.client.put(self.bookmark_url)
+        self.client.put(self.bookmark_url)
+        self.assertEqual(list(self.user.bookmark_stores.all()), [self.store])
+        self.client.delete(self.bookmark_url)
+        self.client.delete(self.bookmark_url)
+        self.assertFalse(self.user.bookmark_stores.exists())
+
+
+class StoreCounterTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.store = create_store(self.user)
+
+    def test_counters(self):
+        self.store.likes.add(self.user)
+        self.user.bookmark_stores.add(self.store)
+        comment = HanbokComment.objects.create(
+            store=self.store, user=self.user, content="예뻐요", grade=4
+        )
+        self.store.refresh_from_db()
+        self.assertEqual(
+            (self.store.like_count, self.store.bookmark_count, self.store.review_count),
+            (1, 1, 1),
+        )
+        self.assertEqual((self.store.rating_sum, self.store.rating_count), (4, 1))
+
+        comment.delete()
+        self.user.like_stores.clear()
+        self.store.refresh_from_db()
+        self.assertEqual((self.store.like_count, self.store.review_count), (0, 0))
+        self.assertEqual((self.store.rating_sum, self.store.rating_count), (0, 0))
+
+
+class StoreListQueryTest(APITestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@test.com", username=f"user{i}", password="password"
+            )
+            for i in range(3)
+        ]
+        for i in range(10):
+            store = create_store(
+                self.users[0], store_name=f"한복집{i}", store_address=f"서울 종로구 {i}"
+            )
+            store.tags.add("경복궁", f"태그{i}")
+            store.likes.add(*self.users[: i % 3 + 1])
+            store.store_bookmarks.add(self.users[1])
+            for user, grade in zip(self.users, (5, 4)):
+                HanbokComment.objects.create(
+                    store=store, user=user, content="예뻐요", grade=grade
+                )
+            Hanbok.objects.create(
+                store=store,
+                owner=self.users[0],
+                hanbok_name="당의",
+                hanbok_description="궁중 예복",
+                hanbok_price=30000,
+            )
+
+    def test_store_list_query_count(self):
+        # 한복집 목록, likes, store_bookmarks, tags prefetch
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("store_list"))
+        stores = response.json()["StoreList"]
+        self.assertEqual(len(stores), 10)
+        self.assertEqual(stores[0]["owner"], self.users[0].id)
+        self.assertEqual(stores[0]["avg_stars"], 4.5)
+        self.assertEqual(stores[0]["review_count"], 2)
+        self.assertEqual(stores[0]["total_likes"], 1)
+        self.assertEqual(sorted(stores[0]["tags"]), ["경복궁", "태그0"])
+
+    def test_store_list_conditional_get(self):
+        etag = self.client.get(reverse("store_list"))["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("store_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # 후기가 추가되면 평균 별점과 후기 수가 바뀝니다.
+        store = Store.objects.first()
+        HanbokComment.objects.create(
+            store=store, user=self.users[2], content="좋아요", grade=1
+        )
+        response = self.client.get(reverse("store_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_store_list_compressed(self):
+        plain = self.client.get(reverse("store_list"))
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        response = self.client.get(reverse("store_list"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        # 압축한 응답의 weak ETag로도 304를 받습니다.
+        self.assertEqual(response["ETag"], "W/" + plain["ETag"])
+        response = self.client.get(
+            reverse("store_list"),
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    @mock.patch.object(ObjectThrottle, "rate", "100/s")
+    def test_comment_list_conditional_get(self):
+        stores = list(Store.objects.all()[:2])
+        url = reverse("comment_view", args=[stores[0].id])
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # 다른 한복집의 후기는 ETag를 바꾸지 않습니다.
+        HanbokComment.objects.create(
+            store=stores[1], user=self.users[2], content="좋아요", grade=1
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        HanbokComment.objects.create(
+            store=stores[0], user=self.users[2], content="좋아요", grade=1
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["Comment"]), 3)
+
+    def test_store_detail_query_count(self):
+        store = Store.objects.first()
+        # 한복집, likes, store_bookmarks, tags, 한복 목록, 후기 목록
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse("store_detail_view", args=[store.id]))
+        self.assertEqual(response.json()["Store"]["avg_stars"], 4.5)
+        self.assertEqual(len(response.json()["Comment"]), 2)
+
+
+class NearbyStoreTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            # 경복궁 근처, 창덕궁 근처, 부산
+            self.near = create_store(
+                self.user, store_address="경복궁", location_x=126.9770, location_y=37.5796
+            )
+            self.middle = create_store(
+                self.user, store_address="창덕궁", location_x=126.9910, location_y=37.5794
+            )
+            self.far = create_store(
+                self.user, store_address="부산", location_x=129.0756, location_y=35.1796
+            )
+        self.url = reverse("nearby_store_list")
+
+    def nearby(self, **params):
+        response = self.client.get(self.url, {"x": 126.9768, "y": 37.5788, **params})
+        return [store["id"] for store in response.json()["StoreList"]]
+
+    def test_sorted_by_distance(self):
+        self.assertEqual(self.nearby(radius=3000), [self.near.id, self.middle.id])
+        self.assertEqual(self.nearby(radius=500), [self.near.id])
+        self.assertEqual(self.nearby(radius=3000, limit=1), [self.near.id])
+
+    def test_index_follows_store_changes(self):
+        self.assertEqual(self.nearby(radius=3000), [self.near.id, self.middle.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.far.location_x, self.far.location_y = 126.9769, 37.5789
+            self.far.save()
+            self.near.delete()
+        self.assertEqual(self.nearby(radius=3000), [self.far.id, self.middle.id])
+
+    def test_invalid_params(self):
+        for params in (
+            {"x": "경복궁"},
+            {"x": "nan", "y": "37.57"},
+            {"x": "126.97", "y": "inf"},
+            {"x": "126.97", "y": "37.57", "radius": "-inf"},
+            {"x": "126.97", "y": "37.57", "radius": "nan"},
+            {"x": "126.97", "y": "37.57", "radius": "-100"},
+            {"x": "126.97", "y": "37.57", "radius": "0"},
+            {"x": "126.97", "y": "37.57", "limit": "0"},
+            {"x": "126.97", "y": "37.57", "limit": "-5"},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+
+
+@override_settings(
+    GEOCODER_BACKEND="stores.geocoding.StubGeocoder", BACKGROUND_TASKS_EAGER=True
+)
+class GeocodingTest(APITestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            email="staff@test.com", username="staff", password="password"
+        )
+        self.staff.is_staff = True
+        self.staff.save()
+        self.client.force_authenticate(self.staff)
+        locations = {"서울 종로구 사직로 161": (126.977, 37.5796)}
+        patcher = mock.patch.object(geocoding.StubGeocoder, "locations", locations)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create(self, address):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("store_list"),
+                {"store_name": "궐나드리 한복", "store_address": address, "tags": []},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+        return Store.objects.get(store_address=address)
+
+    @override_settings(GEOCODE_RETRIES=2)
+    def test_kakao_retries_without_sleeping_after_last_attempt(self):
+        geocoder = geocoding.KakaoGeocoder()
+        with mock.patch.object(
+            geocoder.session, "get", side_effect=requests.ConnectionError
+        ) as get, mock.patch("stores.geocoding.time.sleep") as sleep:
+            with self.assertRaises(geocoding.GeocodingError):
+                geocoder.geocode("서울 종로구 사직로 161")
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual([c.args for c in sleep.call_args_list], [(0.2,), (0.4,)])
+
+    def test_store_created_pending_then_geocoded(self):
+        with mock.patch.object(
+            geocoding.StubGeocoder, "geocode", wraps=geocoding.StubGeocoder().geocode
+        ) as geocode:
+            store = self.create("서울  종로구 사직로 161")
+        self.assertEqual((store.location_x, store.location_y), (126.977, 37.5796))
+        geocode.assert_called_once_with("서울 종로구 사직로 161")
+
+        # 같은 주소는 캐시된 좌표로 바로 생성됩니다.
+        store.delete()
+        with mock.patch.object(geocoding.StubGeocoder, "geocode") as geocode:
+            store = self.create("서울 종로구 사직로 161")
+        geocode.assert_not_called()
+        self.assertEqual(store.location_x, 126.977)
+
+    def test_unknown_address_stays_pending(self):
+        store = self.create("없는 주소")
+        self.assertIsNone(store.location_x)
+        self.assertTrue(GeocodeCache.objects.filter(address="없는 주소").exists())
+
+    def test_failure_stays_pending(self):
+        with mock.patch.object(
+            geocoding.StubGeocoder, "geocode", side_effect=geocoding.GeocodingError
+        ):
+            # 백그라운드에서는 실패가 로그로만 남고, 좌표는 다음 일괄 조회 때 다시 시도합니다.
+            with self.assertRaises(geocoding.GeocodingError):
+                self.create("서울 종로구 사직로 161")
+        store = Store.objects.get()
+        self.assertIsNone(store.location_x)
+        self.assertFalse(GeocodeCache.objects.exists())
+
+    def test_batch(self):
+        pending = [
+            create_store(self.staff, store_address="서울 종로구 사직로 161"),
+            create_store(self.staff, store_address="서울  종로구 사직로 161 "),
+            create_store(self.staff, store_address="없는 주소"),
+        ]
+        etag = self.client.get(reverse("store_list"))["ETag"]
+        self.assertEqual(geocoding.geocode_stores(pending, concurrency=2), (2, 0))
+        self.assertEqual(
+            Store.objects.filter(location_x__isnull=False).count(), 2
+        )
+        # 좌표가 바뀌었으므로 이전 ETag로 304를 받지 않습니다.
+        response = self.client.get(reverse("store_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+def create_purchase(user, day, type="hanbok", approved=True, **kwargs):
+    moment = timezone.make_aware(datetime(2024, 5, day, 10))
+    return PurchaseRecord.objects.create(
+        user=user,
+        tid=kwargs.pop("tid", f"T{PurchaseRecord.objects.count()}"),
+        type=type,
+        partner_order_id=kwargs.pop("partner_order_id", 1),
+        partner_user_id=str(user.id),
+        item_name=kwargs.pop("item_name", "한복 대여"),
+        quantity=1,
+        total_amount=10000,
+        vat_amount=1000,
+        rsrvt_date=moment,
+        rsrvt_time=time(10),
+        created_at=moment,
+        approved_at=moment if approved else None,
+        **kwargs,
+    )
+
+
+class PurchaseHistoryTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.client.force_authenticate(self.user)
+        for day in (3, 1, 2):
+            create_purchase(self.user, day)
+        create_purchase(self.user, 4, type="event")
+        create_purchase(self.user, 5, approved=False)
+
+    def history(self, **params):
+        response = self.client.get(reverse("purchase_history"), params)
+        self.assertEqual(response.status_code, 200)
+        return [record["rsrvt_date"][:10] for record in response.data["results"]]
+
+    def test_filters(self):
+        self.assertEqual(
+            self.history(),
+            ["2024-05-01", "2024-05-02", "2024-05-03", "2024-05-04"],
+        )
+        self.assertEqual(self.history(type="event"), ["2024-05-04"])
+        self.assertEqual(self.history(status="pending"), ["2024-05-05"])
+        self.assertEqual(
+            self.history(**{"from": "2024-05-02", "to": "2024-05-03"}),
+            ["2024-05-02", "2024-05-03"],
+        )
+        response = self.client.get(reverse("purchase_history"), {"to": "5월"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_pagination(self):
+        self.assertEqual(self.history(page_size=2), ["2024-05-01", "2024-05-02"])
+        response = self.client.get(reverse("purchase_history"), {"page_size": 2})
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_legacy_list_endpoints_are_paginated(self):
+        response = self.client.get(reverse("purchase_record"), {"page_size": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+        url = reverse("hanbok_purchase_record", args=[self.user.id])
+        response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 3)
+        # type 파라미터로 다른 종류를 조회할 수 없습니다.
+        response = self.client.get(url, {"type": "event"})
+        self.assertEqual(len(response.data["results"]), 3)
+        url = reverse("event_purchase_record", args=[self.user.id])
+        self.assertEqual(len(self.client.get(url).data["results"]), 1)
+
+        other = User.objects.create_user(
+            email="other@test.com", username="other", password="password"
+        )
+        url = reverse("event_purchase_record", args=[other.id])
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def explain(self, queryset):
+        if connection.vendor == "postgresql":
+            # 행이 적으면 순차 탐색을 고르므로 인덱스 사용 가능 여부만 확인합니다.
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off")
+        return queryset.explain()
+
+    def test_history_uses_partial_indexes(self):
+        history = PurchaseRecord.objects.history
+        self.assertIn("purchase_approved_idx", self.explain(history(self.user)))
+        self.assertIn(
+            "purchase_approved_type_idx", self.explain(history(self.user, "hanbok"))
+        )
+        self.assertIn(
+            "purchase_pending_idx",
+            self.explain(history(self.user, "hanbok", approved=False)),
+        )
+
+    def test_tid_lookup_uses_unique_index(self):
+        plan = self.explain(PurchaseRecord.objects.filter(tid="T0"))
+        self.assertRegex(plan, r"(?i)index.*tid")
+
+
+class PurchaseEligibilityTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.client.force_authenticate(self.user)
+        self.store = create_store(self.user)
+        self.hanbok = Hanbok.objects.create(
+            store=self.store,
+            owner=self.user,
+            hanbok_name="당의",
+            hanbok_description="당의",
+            hanbok_price=10000,
+        )
+        cache.clear()
+        patcher = mock.patch.object(ObjectThrottle, "rate", "100/s")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def comment(self):
+        return self.client.post(
+            reverse("comment_view", args=[self.store.id]),
+            {"content": "좋아요", "grade": 5},
+        )
+
+    def test_review_requires_linked_purchase(self):
+        self.assertEqual(self.comment().status_code, 403)
+        create_purchase(self.user, 1, approved=False, store=self.store)
+        self.assertEqual(self.comment().status_code, 403)
+        create_purchase(self.user, 2, store=self.store)
+        with self.assertNumQueries(1):
+            self.assertTrue(purchases.can_review(self.user, self.store.id))
+        self.assertEqual(self.comment().status_code, 200)
+
+    def test_can_review_changes_comment_etag(self):
+        url = reverse("comment_view", args=[self.store.id])
+        response = self.client.get(url)
+        self.assertFalse(response.json()["can_review"])
+        self.assertIn("Authorization", response["Vary"])
+        etag = response["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        create_purchase(self.user, 1, store=self.store)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["can_review"])
+
+    def test_eligible_store_ids_cached_and_invalidated(self):
+        self.assertEqual(purchases.eligible_store_ids(self.user), set())
+        with self.captureOnCommitCallbacks(execute=True):
+            create_purchase(self.user, 1, store=self.store)
+        self.assertEqual(purchases.eligible_store_ids(self.user), {self.store.id})
+        with self.assertNumQueries(0):
+            purchases.eligible_store_ids(self.user)
+
+        response = self.client.get(reverse("comment_view", args=[self.store.id]))
+        self.assertTrue(response.data["can_review"])
+
+    def test_link_from_legacy_order_id(self):
+        # 2024년 결제도 한복점을 찾습니다. (예전 코드는 "2023"으로만 나누었습니다)
+        record = create_purchase(
+            self.user, 1, partner_order_id=int(f"7{2024}{self.store.id}"), item_name="당의"
+        )
+        out = StringIO()
+        call_command("backfill_purchase_links", stdout=out)
+        self.assertIn("1건 중 1건 연결", out.getvalue())
+        record.refresh_from_db()
+        self.assertEqual((record.store_id, record.hanbok_id), (self.store.id, self.hanbok.id))
+        self.assertEqual(self.comment().status_code, 200)
+
+
+class SharedCache:
+    """
+    여러 프로세스가 공유하는 캐시(redis/memcached) 대신 사용하는 테스트용 캐시 입니다.
+    add/incr이 서로 다른 프로세스 사이에서도 원자적으로 동작합니다.
+    """
+
+    def __init__(self, manager):
+        self.data = manager.dict()
+        self.lock = manager.Lock()
+
+    def add(self, key, value, timeout=None):
+        with self.lock:
+            if key in self.data:
+                return False
+            self.data[key] = value
+            return True
+
+    def incr(self, key, delta=1):
+        with self.lock:
+            if key not in self.data:
+                raise ValueError(key)
+            self.data[key] += delta
+            return self.data[key]
+
+
+def throttle_worker(cache, user_id, attempts, allowed):
+    throttle = ObjectThrottle()
+    throttle.cache = cache
+    throttle.rate = "5/m"
+    throttle.timer = lambda: 120.0
+    request = SimpleNamespace(user=SimpleNamespace(is_authenticated=True, pk=user_id))
+    view = SimpleNamespace(throttle_scope="store_review")
+    for _ in range(attempts):
+        if throttle.allow_request(request, view):
+            with allowed.get_lock():
+                allowed.value += 1
+
+
+class AtomicRateThrottleTest(SimpleTestCase):
+    def request(self, user_id=1):
+        return SimpleNamespace(user=SimpleNamespace(is_authenticated=True, pk=user_id))
+
+    def test_fixed_window_and_scopes(self):
+        cache.clear()
+        throttle = ObjectThrottle()
+        throttle.timer = lambda: 10.2
+        review = SimpleNamespace(throttle_scope="store_review")
+        other = SimpleNamespace(throttle_scope="event_review")
+        self.assertTrue(throttle.allow_request(self.request(), review))
+        self.assertFalse(throttle.allow_request(self.request(), review))
+        self.assertAlmostEqual(throttle.wait(), 0.8)
+        self.assertTrue(throttle.allow_request(self.request(2), review))
+        self.assertTrue(throttle.allow_request(self.request(), other))
+
+        throttle.timer = lambda: 11.0
+        self.assertTrue(throttle.allow_request(self.request(), review))
+
+    def test_limit_is_shared_across_worker_processes(self):
+        context = multiprocessing.get_context("fork")
+        with context.Manager() as manager:
+            shared_cache = SharedCache(manager)
+            allowed = context.Value("i", 0)
+            workers = [
+                context.Process(
+                    target=throttle_worker, args=(shared_cache, 1, 10, allowed)
+                )
+                for _ in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        # 프로세스별 캐시였다면 4개 워커가 각각 5번씩, 20번이 허용됩니다.
+        self.assertEqual(allowed.value, 5)
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    def test_same_output_as_json_renderer(self):
+        data = {
+            "created_at": timezone.make_aware(datetime(2024, 5, 1, 9, 30, 0, 123456)),
+            "day": datetime(2024, 5, 1).date(),
+            "price": Decimal("30000.50"),
+            "tags": ["경복궁", "당의"],
+            "content": "첫 줄\u2028둘째 줄\u2029셋째 줄",
+            1: None,
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_falls_back_to_json_renderer(self):
+        data = {"store_name": "궐나드리 한복"}
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=2"),
+            JSONRenderer().render(data, "application/json; indent=2"),
+        )
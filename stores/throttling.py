@@ -1,5 +1,66 @@
-from rest_framework.throttling import UserRateThrottle
+import time
 
+from django.core.cache import cache as default_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
 
-class ObjectThrottle(UserRateThrottle):
+
+class AtomicRateThrottle(BaseThrottle):
+    """
+    공유 캐시(CACHE_URL)의 원자적 카운터로 요청 수를 세는 고정 윈도(fixed window) throttle 입니다.
+    요청 기록 목록을 저장하지 않고 (scope, 회원, 윈도)별 카운터 하나만 incr 하므로
+    확인 비용이 O(1)이고, 여러 워커 프로세스가 같은 캐시를 보면 제한이 워커 수만큼 늘어나지 않습니다.
+
+    scope는 view의 throttle_scope(없으면 view 클래스 이름)이며 view마다 따로 셉니다.
+    REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]에 scope가 있으면 그 값을, 없으면 rate를 사용합니다.
+    """
+
+    cache = default_cache
+    timer = time.time
+    rate = None
+
+    def get_scope(self, view):
+        return getattr(view, "throttle_scope", None) or view.__class__.__name__
+
+    def get_rate(self, scope):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(scope, self.rate)
+
+    def parse_rate(self, rate):
+        num, period = rate.split("/")
+        duration = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+        return int(num), duration
+
+    def get_ident(self, request):
+        if request.user and request.user.is_authenticated:
+            return request.user.pk
+        return super().get_ident(request)
+
+    def allow_request(self, request, view):
+        scope = self.get_scope(view)
+        rate = self.get_rate(scope)
+        if rate is None:
+            return True
+        num_requests, duration = self.parse_rate(rate)
+
+        now = self.timer()
+        window = int(now // duration)
+        key = f"throttle:{scope}:{self.get_ident(request)}:{window}"
+        count = self.incr(key, duration)
+        self.wait_seconds = (window + 1) * duration - now
+        return count <= num_requests
+
+    def incr(self, key, duration):
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # 윈도의 첫 요청입니다. 동시에 들어온 다른 요청이 먼저 만들었다면 그 카운터를 올립니다.
+            if self.cache.add(key, 1, duration + 1):
+                return 1
+            return self.cache.incr(key)
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ObjectThrottle(AtomicRateThrottle):
     rate = "1/s"
@@ -3,6 +3,7 @@ from stores import views
 
 urlpatterns = [
     path("", views.StoreListView.as_view(), name="store_list"),
+    path("nearby/", views.NearbyStoreView.as_view(), name="nearby_store_list"),
     path("<int:store_id>/", views.StoreDetailView.as_view(), name="store_detail_view"),
     path("<int:store_id>/like/", views.LikeView.as_view(), name="like_view"),
     path("<int:store_id>/comments/", views.CommentView.as_view(), name="comment_view"),
@@ -17,6 +18,11 @@ urlpatterns = [
         name="hanbok_detail",
     ),
     path("payment/", views.PurchaseRecordView.as_view(), name="purchase_record"),
+    path(
+        "payment/history/",
+        views.PurchaseHistoryView.as_view(),
+        name="purchase_history",
+    ),
     path(
         "payment/<tid>/",
         views.PutPurchaseRecordView.as_view(),
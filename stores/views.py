@@ -1,13 +1,24 @@
-from rest_framework import status
+import math
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import generics, status
 from rest_framework import permissions
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.views import APIView
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
+from config.etags import collection_key, collections, conditional_get
 from users.models import User
+from users.relations import set_relation
+from .pagination import PurchaseCursorPagination
 from .throttling import ObjectThrottle
+from . import purchases, spatial
 from .models import Store, Hanbok, HanbokComment, PurchaseRecord
 from .serializers import (
     StoreListSerializer,
+    NearbyStoreSerializer,
     CreateStoreSerializer,
     HanbokSerializer,
     CreateHanbokSerializer,
@@ -22,12 +33,14 @@ from .serializers import (
 class StoreListView(APIView):
     """
     모든 한복집 리스트 -> 궁별 한복집 리스트로 변경할 예정
+    한복집 목록이 바뀌지 않았으면 If-None-Match 요청에 쿼리 없이 304를 응답합니다.
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    @conditional_get(collections("stores"))
     def get(self, request):
-        store = Store.objects.all()
+        store = Store.objects.for_list()
         store_serializer = StoreListSerializer(store, many=True)
 
         return Response(
@@ -57,6 +70,47 @@ class StoreListView(APIView):
             )
 
 
+# 주변 한복집 리스트
+class NearbyStoreView(APIView):
+    """
+    x(경도), y(위도)에서 radius(m) 안에 있는 한복집을 가까운 순으로 limit개 조회합니다.
+    프로세스 안의 격자 색인으로 후보를 찾고, DB에서는 bounding box 조건과 함께 조회합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get(self, request):
+        try:
+            x = float(request.GET["x"])
+            y = float(request.GET["y"])
+            radius = min(float(request.GET.get("radius", 1000)), 20000)
+            limit = min(int(request.GET.get("limit", 20)), 100)
+            # float()는 nan, inf도 받으므로 격자 색인에 넘기기 전에 거릅니다.
+            if not all(map(math.isfinite, (x, y, radius))):
+                raise ValueError
+            if radius <= 0 or limit < 1:
+                raise ValueError
+        except (KeyError, ValueError):
+            return Response(
+                {"message": "x, y, radius, limit 값을 확인해 주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        nearby = spatial.get_index().nearby(x, y, radius, limit)
+        distances = {id: d for d, id in nearby}
+        min_x, max_x, min_y, max_y = spatial.bounding_box(x, y, radius)
+        stores = Store.objects.for_list().filter(
+            id__in=distances,
+            location_x__range=(min_x, max_x),
+            location_y__range=(min_y, max_y),
+        )
+        stores = sorted(stores, key=lambda store: distances[store.id])
+        serializer = NearbyStoreSerializer(
+            stores, many=True, context={"distances": distances}
+        )
+        return Response({"StoreList": serializer.data}, status=status.HTTP_200_OK)
+
+
 # 한복집 상세 페이지
 class StoreDetailView(APIView):
     """
@@ -66,9 +120,9 @@ class StoreDetailView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request, store_id):
-        store = get_object_or_404(Store, id=store_id)
-        hanboks = Hanbok.objects.filter(store=store_id)
-        comments = HanbokComment.objects.filter(store=store_id)
+        store = get_object_or_404(Store.objects.for_list(), id=store_id)
+        hanboks = Hanbok.objects.filter(store=store_id).select_related("owner")
+        comments = HanbokComment.objects.filter(store=store_id).select_related("user")
 
         store_serializer = StoreListSerializer(store)
         hanbok_serializer = HanbokSerializer(hanboks, many=True)
@@ -108,39 +162,45 @@ class StoreDetailView(APIView):
             )
 
 
+def comment_version_keys(request, store_id):
+    keys = [collection_key(f"comments:{store_id}"), collection_key("users")]
+    if request.user.is_authenticated:
+        # can_review는 회원의 구매 기록에 따라 달라집니다.
+        keys.append(purchases.version_key(request.user.id))
+    return keys
+
+
 class CommentView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     throttle_classes = [ObjectThrottle]
+    throttle_scope = "store_review"
 
+    @conditional_get(comment_version_keys, vary=("Authorization",))
     def get(self, request, store_id):
         """
         한복점에 달린 모든 리뷰만 열람
+        can_review는 로그인한 회원이 이 한복점에 후기를 작성할 수 있는지를 나타냅니다.
+        후기와 회원의 구매 기록이 바뀌지 않았으면 If-None-Match 요청에 쿼리 없이 304를 응답합니다.
         """
         store = get_object_or_404(Store, id=store_id)
         comments = store.comments.all()
         comment_serializer = CommentSerializer(comments, many=True)
+        can_review = request.user.is_authenticated and (
+            store.id in purchases.eligible_store_ids(request.user)
+        )
         return Response(
             {
                 "Comment": comment_serializer.data,
+                "can_review": can_review,
             },
             status=status.HTTP_200_OK,
         )
 
     def post(self, request, store_id):
         """
-        한복점 리뷰 작성 로그인한 사람이면 모두 가능
+        한복점 리뷰 작성 해당 한복점에서 결제를 완료한 회원만 가능
         """
-        user = self.request.user.id
-        purchase_stores = PurchaseRecord.objects.filter(
-            type="hanbok", approved_at__isnull=False, user_id=user
-        )
-        purchase_store_id = list(
-            {
-                int(str(purchase_store.partner_order_id).split("2023")[1])
-                for purchase_store in purchase_stores
-            }
-        )
-        if store_id in purchase_store_id:
+        if purchases.can_review(request.user, store_id):
             comment_serializer = CreateCommentSerializer(data=request.data)
             if comment_serializer.is_valid():
                 comment_serializer.save(store_id=store_id, user=request.user)
@@ -205,20 +265,39 @@ class CommentDetailView(APIView):
 
 
 class LikeView(APIView):
+    """
+    POST 요청은 좋아요를 토글하고, PUT / DELETE 요청은 좋아요를 설정 / 해제합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
     def post(self, request, store_id):
-        store = get_object_or_404(Store, id=store_id)
-        if request.user in store.likes.all():
-            store.likes.remove(request.user)
-            return Response(
-                {"message": "좋아요가 취소되었습니다"},
-                status=status.HTTP_200_OK,
-            )
-        else:
-            store.likes.add(request.user)
+        store = get_object_or_404(Store.objects.only("id"), id=store_id)
+        if set_relation(store.likes, request.user):
             return Response(
                 {"message": "좋아요 눌렀습니다"},
                 status=status.HTTP_200_OK,
             )
+        return Response(
+            {"message": "좋아요가 취소되었습니다"},
+            status=status.HTTP_200_OK,
+        )
+
+    def put(self, request, store_id):
+        store = get_object_or_404(Store.objects.only("id"), id=store_id)
+        set_relation(store.likes, request.user, True)
+        return Response(
+            {"message": "좋아요 눌렀습니다"},
+            status=status.HTTP_200_OK,
+        )
+
+    def delete(self, request, store_id):
+        store = get_object_or_404(Store.objects.only("id"), id=store_id)
+        set_relation(store.likes, request.user, False)
+        return Response(
+            {"message": "좋아요가 취소되었습니다"},
+            status=status.HTTP_200_OK,
+        )
 
 
 # 한복 상세페이지
@@ -229,18 +308,51 @@ class HanbokDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-# 전체예약 조회 & 결제 승인요청
-class PurchaseRecordView(APIView):
+# 결제 내역 조회 (페이지네이션)
+class PurchaseHistoryView(generics.ListAPIView):
+    """
+    회원의 결제 내역을 예약일순으로 cursor 기반 페이지네이션 합니다.
+    type: hanbok / event (없으면 전체)
+    status: approved(결제 완료, 기본값) / pending(결제 대기)
+    from, to: 예약일 범위 (YYYY-MM-DD, 양 끝 포함)
+    """
+
     permission_classes = [permissions.IsAuthenticated]
+    serializer_class = PurchaseRecordSerializer
+    pagination_class = PurchaseCursorPagination
+    # 지정하면 type 파라미터 대신 이 종류의 결제 내역만 조회합니다.
+    record_type = None
+
+    def get_queryset(self):
+        params = self.request.GET
+        record_status = params.get("status", "approved")
+        if record_status not in ("approved", "pending"):
+            raise ValidationError({"message": "status는 approved 또는 pending 입니다."})
+        records = PurchaseRecord.objects.history(
+            self.request.user,
+            self.record_type or params.get("type"),
+            record_status == "approved",
+        )
+        for param, lookup, days in (("from", "gte", 0), ("to", "lt", 1)):
+            if not params.get(param):
+                continue
+            try:
+                day = parse_date(params[param])
+            except ValueError:
+                day = None
+            if day is None:
+                raise ValidationError({"message": f"{param} 값을 확인해 주세요. (YYYY-MM-DD)"})
+            # 인덱스를 사용할 수 있도록 rsrvt_date에 함수를 씌우지 않고 시각 범위로 비교합니다.
+            moment = timezone.make_aware(datetime.combine(day + timedelta(days), time.min))
+            records = records.filter(**{f"rsrvt_date__{lookup}": moment})
+        return records
 
-    def get(self, request):
-        user = self.request.user.id
-        complete = PurchaseRecord.objects.filter(
-            user_id=user, approved_at__isnull=False
-        ).order_by("rsrvt_date")
-        print(user)
-        serializer = PurchaseRecordSerializer(complete, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+
+# 전체예약 조회 & 결제 승인요청
+class PurchaseRecordView(PurchaseHistoryView):
+    """
+    GET은 payment/history/ 와 같이 결제 내역을 페이지네이션 합니다.
+    """
 
     def post(self, request):
         try:
@@ -298,43 +410,48 @@ class PutPurchaseRecordView(APIView):
 
 # 한복점 북마크
 class StoreBookmarkView(APIView):
+    """
+    POST 요청은 북마크를 토글하고, PUT / DELETE 요청은 북마크를 설정 / 해제합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
     def post(self, request, store_id):
-        store = get_object_or_404(Store, id=store_id)
-        if request.user in store.store_bookmarks.all():
-            store.store_bookmarks.remove(request.user)
-            return Response("북마크가 취소되었습니다.", status=status.HTTP_200_OK)
-        else:
-            store.store_bookmarks.add(request.user)
+        store = get_object_or_404(Store.objects.only("id"), id=store_id)
+        if set_relation(store.store_bookmarks, request.user):
             return Response("북마크 완료했습니다.", status=status.HTTP_200_OK)
+        return Response("북마크가 취소되었습니다.", status=status.HTTP_200_OK)
 
+    def put(self, request, store_id):
+        store = get_object_or_404(Store.objects.only("id"), id=store_id)
+        set_relation(store.store_bookmarks, request.user, True)
+        return Response("북마크 완료했습니다.", status=status.HTTP_200_OK)
 
-# 한복 예약 결제 리스트 조회
-class HanbokPurchaseRecordView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
+    def delete(self, request, store_id):
+        store = get_object_or_404(Store.objects.only("id"), id=store_id)
+        set_relation(store.store_bookmarks, request.user, False)
+        return Response("북마크가 취소되었습니다.", status=status.HTTP_200_OK)
 
-    def get(self, request, user_id):
-        user = get_object_or_404(User, id=user_id)
-        if request.user == user:
-            complete = PurchaseRecord.objects.filter(
-                user_id=user_id, approved_at__isnull=False, type="hanbok"
-            ).order_by("rsrvt_date")
-            serializer = PurchaseRecordSerializer(complete, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        else:
-            return Response({"message": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
+# 회원별 결제 내역 조회 (페이지네이션)
+class UserPurchaseRecordView(PurchaseHistoryView):
+    """
+    payment/<user_id>/hanbok/, payment/<user_id>/event/ 는 본인의 결제 내역만
+    payment/history/?type=hanbok(event) 와 같이 페이지네이션 하여 조회합니다.
+    """
+
+    def get_queryset(self):
+        user = get_object_or_404(User, id=self.kwargs["user_id"])
+        if self.request.user != user:
+            raise PermissionDenied({"message": "권한이 없습니다."})
+        return super().get_queryset()
 
-# 행사 예약 결제 리스트 조회
-class EventPurchaseRecordView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
 
-    def get(self, request, user_id):
-        user = get_object_or_404(User, id=user_id)
-        if request.user == user:
-            complete = PurchaseRecord.objects.filter(
-                user_id=user_id, approved_at__isnull=False, type="event"
-            ).order_by("rsrvt_date")
-            serializer = PurchaseRecordSerializer(complete, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        else:
-            return Response({"message": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+# 한복 예약 결제 리스트 조회
+class HanbokPurchaseRecordView(UserPurchaseRecordView):
+    record_type = "hanbok"
+
+
+# 행사 예약 결제 리스트 조회
+class EventPurchaseRecordView(UserPurchaseRecordView):
+    record_type = "event"
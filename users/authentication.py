@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from config.cache import bump_version_on_commit, get_version
+
+
+def _version_key(user_id):
+    return f"users:auth:{user_id}:version"
+
+
+def invalidate(user_id):
+    """
+    회원 정보가 바뀌거나(비활성화, 비밀번호 변경 포함) 삭제되면 캐시된 회원을 무효화합니다.
+    """
+    bump_version_on_commit(_version_key(user_id))
+
+
+def _read_only_save(*args, **kwargs):
+    raise NotImplementedError(
+        "캐시된 회원 정보로 만든 User는 저장할 수 없습니다. JWTAuthentication을 사용해주세요."
+    )
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    토큰의 user_id로 찾은 회원을 AUTH_USER_CACHE_TIMEOUT초 동안 캐시하여, 인증된 요청마다 User를 조회하지 않습니다.
+    회원이 저장/삭제되면(비밀번호 변경 포함) 버전이 올라가 바로 무효화되므로
+    비활성화된 회원은 다음 요청부터 인증에 실패합니다.
+    캐시에는 CACHED_FIELDS만 저장하고(비밀번호 해시 제외) 저장하지 않은 User로 다시 만듭니다.
+    이 User는 save()/delete()를 호출하면 NotImplementedError가 발생하므로 조회용 view에서만 사용합니다.
+    """
+
+    CACHED_FIELDS = (
+        "id",
+        "email",
+        "username",
+        "profile_image",
+        "is_active",
+        "is_admin",
+        "is_staff",
+    )
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        key = f"users:auth:{user_id}:v{get_version(_version_key(user_id))}"
+        fields = cache.get(key)
+        if fields is None:
+            user = super().get_user(validated_token)
+            fields = {name: getattr(user, name) for name in self.CACHED_FIELDS}
+            fields["profile_image"] = user.profile_image.name
+            cache.set(key, fields, settings.AUTH_USER_CACHE_TIMEOUT)
+            return user
+        user = self.user_model(**fields)
+        user._state.adding = False
+        # 비어 있는 비밀번호 등 캐시하지 않은 필드가 DB에 쓰이지 않도록 합니다.
+        user.save = user.delete = _read_only_save
+        return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    DB와 캐시를 조회하지 않고 토큰의 claim(user_id, email)으로 저장하지 않은 User를 만듭니다.
+    request.user의 id만 사용하는 조회용 view에서 사용합니다.
+    토큰이 만료될 때까지는 비활성화된 회원도 인증되므로, 데이터를 바꾸는 view에는 사용하지 않습니다.
+    """
+
+    def get_user(self, validated_token):
+        user_model = self.user_model
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        user = user_model(
+            **{api_settings.USER_ID_FIELD: user_id},
+            email=validated_token.get("email", ""),
+        )
+        user._state.adding = False
+        return user
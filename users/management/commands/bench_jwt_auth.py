@@ -0,0 +1,61 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import Client
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.cache import bench_cache
+from users.authentication import CachedJWTAuthentication, ClaimsJWTAuthentication
+from users.models import User
+from users.views import MeSummaryView
+
+
+class Command(BaseCommand):
+    """
+    JWT 인증 방식별로 me/summary/ 요청의 초당 처리량(req/s)을 측정합니다.
+    db: 매 요청 User 조회 (simplejwt 기본), cached: 회원 캐시, claims: 토큰 claim만 사용
+    측정용 회원은 마지막에 삭제됩니다.
+
+    python manage.py bench_jwt_auth --requests 2000
+    """
+
+    help = "JWT 인증 방식별 요청 처리량을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        user = User.objects.create_user(
+            email="bench_jwt@gwolnadri.local", username="bench_jwt", password="bench"
+        )
+        token = RefreshToken.for_user(user)
+        token["email"] = user.email
+        client = Client(
+            HTTP_HOST="localhost", HTTP_AUTHORIZATION=f"Bearer {token.access_token}"
+        )
+        modes = (
+            ("db", JWTAuthentication),
+            ("cached", CachedJWTAuthentication),
+            ("claims", ClaimsJWTAuthentication),
+        )
+        try:
+            with bench_cache():
+                for name, authentication in modes:
+                    cache.clear()
+                    with mock.patch.object(
+                        MeSummaryView, "authentication_classes", [authentication]
+                    ):
+                        client.get("/users/me/summary/")
+                        started = time.perf_counter()
+                        for _ in range(options["requests"]):
+                            response = client.get("/users/me/summary/")
+                        elapsed = time.perf_counter() - started
+                    assert response.status_code == 200, response.status_code
+                    self.stdout.write(
+                        f"{name:>7}: {options['requests'] / elapsed:,.0f} req/s"
+                    )
+        finally:
+            user.delete()
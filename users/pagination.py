@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class BookmarkPagination(CursorPagination):
+    """
+    북마크한 한복집/공연을 cursor 기반으로 페이지네이션 합니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-id"
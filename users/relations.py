@@ -0,0 +1,37 @@
+from django.db import transaction
+
+from users.models import User
+
+
+def _exists(manager, user):
+    """
+    through 테이블의 (대상, 회원) unique 인덱스로 관계 여부만 확인합니다.
+    manager.all()처럼 관계된 회원 전체를 불러오지 않습니다.
+    """
+    return manager.through.objects.filter(
+        **{
+            f"{manager.source_field_name}_id": manager.instance.pk,
+            f"{manager.target_field_name}_id": user.pk,
+        }
+    ).exists()
+
+
+def set_relation(manager, user, value=None):
+    """
+    좋아요, 북마크 같은 회원과의 M2M 관계를 설정합니다.
+    manager(ex: event.likes)에 value가 True이면 user를 추가하고, False이면 제거합니다.
+    이미 원하는 상태라면 아무것도 하지 않으므로 여러 번 요청해도 결과가 같습니다.
+    value가 None이면 현재 상태를 뒤집습니다(토글).
+    같은 회원이 연달아 요청해도 회원 row lock으로 순서대로 처리됩니다.
+    변경 후의 관계 여부를 반환합니다.
+    """
+    with transaction.atomic():
+        list(User.objects.select_for_update().filter(pk=user.pk).values_list("pk"))
+        exists = _exists(manager, user)
+        if value is None:
+            value = not exists
+        if value and not exists:
+            manager.add(user)
+        elif not value and exists:
+            manager.remove(user)
+    return value
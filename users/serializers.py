@@ -5,6 +5,7 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.password_validation import validate_password
 from stores.serializers import StoreListSerializer
 from events.serializers import EventSerializer
+from config.images import ImageVariantsField
 
 
 # 회원가입
@@ -62,6 +63,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         use_url=True,
         required=False,
     )
+    profile_image_variants = ImageVariantsField(source="profile_image")
 
     class Meta:
         model = User
@@ -70,11 +72,22 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "email",
             "username",
             "profile_image",
+            "profile_image_variants",
             "bookmark_stores",
             "bookmark_events",
         )
 
 
+# 마이 프로필 요약 - 헤더, 프로필 이미지 위젯용 (추가 쿼리 없음)
+class UserSummarySerializer(serializers.ModelSerializer):
+    profile_image = serializers.ImageField(read_only=True, use_url=True)
+    profile_image_variants = ImageVariantsField(source="profile_image")
+
+    class Meta:
+        model = User
+        fields = ("id", "email", "username", "profile_image", "profile_image_variants")
+
+
 # 회원정보 수정
 class UpdateUserSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(required=True)
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from config import etags, images
+from users import authentication
+from users.models import User
+
+images.register(User, "profile_image")
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    authentication.invalidate(instance.id)
+    # 후기 목록에 작성자 이름이 포함됩니다.
+    etags.touch("users")
@@ -1,3 +1,140 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from config.cache import get_version
 
-# Create your tests here.
+from events.tests import create_event
+from stores.tests import create_store
+from users.authentication import CachedJWTAuthentication
+from users.models import User
+
+
+class MeQueryTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        self.client.force_authenticate(self.user)
+
+    def bookmark(self, count, start=0):
+        for i in range(start, start + count):
+            store = create_store(
+                self.user, store_name=f"한복집{i}", store_address=f"주소{i}"
+            )
+            store.store_bookmarks.add(self.user)
+            store.tags.add(f"태그{i}")
+            event = create_event(self.user, title=f"공연{i}")
+            event.event_bookmarks.add(self.user)
+            event.likes.add(self.user)
+
+    def test_me_query_count_does_not_grow_with_bookmarks(self):
+        # 한복집, 한복집 좋아요/북마크/태그, 공연(+작성자), 공연 좋아요/북마크
+        self.bookmark(1)
+        with self.assertNumQueries(7):
+            self.client.get(reverse("profile_view"))
+
+        self.bookmark(10, start=1)
+        self.client.force_authenticate(User.objects.get(id=self.user.id))
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse("profile_view"))
+        self.assertEqual(len(response.data["bookmark_stores"]), 11)
+        self.assertEqual(len(response.data["bookmark_events"]), 11)
+        self.assertEqual(response.data["bookmark_events"][0]["author"], "user")
+
+    def test_summary(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("profile_summary"))
+        self.assertEqual(response.data["email"], "user@test.com")
+        self.assertNotIn("bookmark_stores", response.data)
+
+    def test_paginated_bookmarks(self):
+        self.bookmark(3)
+        response = self.client.get(reverse("bookmark_store_list"), {"page_size": 2})
+        self.assertEqual(
+            [s["store_name"] for s in response.data["results"]], ["한복집2", "한복집1"]
+        )
+        response = self.client.get(response.data["next"])
+        self.assertEqual([s["store_name"] for s in response.data["results"]], ["한복집0"])
+
+        response = self.client.get(reverse("bookmark_event_list"))
+        self.assertEqual(len(response.data["results"]), 3)
+
+
+class CachedJWTAuthenticationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="password"
+        )
+        token = RefreshToken.for_user(self.user)
+        token["email"] = self.user.email
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token.access_token}")
+
+    def summary(self):
+        return self.client.get(reverse("profile_summary"))
+
+    def test_user_is_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.summary().status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.summary()
+        self.assertEqual(response.data["email"], "user@test.com")
+
+    def test_password_hash_is_not_cached(self):
+        expected = self.summary().data
+        with self.assertNumQueries(0):
+            self.assertEqual(self.summary().data, expected)
+        version = get_version(f"users:auth:{self.user.id}:version")
+        cached = cache.get(f"users:auth:{self.user.id}:v{version}")
+        self.assertEqual(cached["email"], "user@test.com")
+        self.assertNotIn("password", cached)
+
+    def test_profile_update_uses_database_user(self):
+        self.summary()
+        response = self.client.put(
+            reverse("profile_modify"),
+            {"email": "user@test.com", "username": "renamed"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, "renamed")
+        self.assertTrue(self.user.check_password("password"))
+
+    def test_cached_user_cannot_be_saved(self):
+        token = RefreshToken.for_user(self.user).access_token
+        authentication = CachedJWTAuthentication()
+        authentication.get_user(token)
+        user = authentication.get_user(token)
+        with self.assertRaises(NotImplementedError):
+            user.save()
+
+    def test_dj_rest_auth_user_update_keeps_password(self):
+        self.summary()
+        response = self.client.patch("/dj-rest-auth/user/", {"username": "renamed"})
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("password"))
+
+    def test_deactivated_user_is_rejected(self):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.summary().status_code, 401)
+
+    def test_password_change_invalidates(self):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password("new-password")
+            self.user.save()
+        with self.assertNumQueries(1):
+            self.summary()
+
+    def test_stateless_read_view(self):
+        store = create_store(self.user)
+        store.store_bookmarks.add(self.user)
+        # 회원 조회 없이 북마크 목록만 조회합니다. (한복집, 좋아요, 북마크, 태그)
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("bookmark_store_list"))
+        self.assertEqual(len(response.data["results"]), 1)
@@ -11,6 +11,17 @@ urlpatterns = [
     path("logout/", views.LogoutView.as_view(), name="logout"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("me/", views.Me.as_view(), name="profile_view"),
+    path("me/summary/", views.MeSummaryView.as_view(), name="profile_summary"),
+    path(
+        "me/bookmarks/stores/",
+        views.BookmarkStoreListView.as_view(),
+        name="bookmark_store_list",
+    ),
+    path(
+        "me/bookmarks/events/",
+        views.BookmarkEventListView.as_view(),
+        name="bookmark_event_list",
+    ),
     path("me/modify/", views.UpdateProfileView.as_view(), name="profile_modify"),
     # path("me/delete/", views.UpdateProfileView.as_view(), name="profile_delete"),
     path(
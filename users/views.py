@@ -1,6 +1,7 @@
 import os
 import requests
 import random, string
+from django.db.models import Prefetch, prefetch_related_objects
 from django.http import JsonResponse
 from rest_framework import status, permissions, generics
 from rest_framework.permissions import AllowAny
@@ -10,11 +11,18 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
 
 
+from events.models import Event
+from events.serializers import EventSerializer
+from stores.models import Store
+from stores.serializers import StoreListSerializer
+from .authentication import CachedJWTAuthentication, ClaimsJWTAuthentication
 from .models import User
+from .pagination import BookmarkPagination
 from .serializers import (
     UserTokenObtainPairSerializer,
     UserSerializer,
     UserProfileSerializer,
+    UserSummarySerializer,
     UpdateUserSerializer,
     ChangePasswordSerializer,
 )
@@ -79,19 +87,70 @@ class LogoutView(APIView):
         return response
 
 
+def bookmarked_stores():
+    return Store.objects.for_list()
+
+
+def bookmarked_events():
+    return Event.objects.for_list().select_related("author")
+
+
 # 마이페이지 보기
 class Me(APIView):
+    """
+    북마크한 한복집/공연을 목록용 queryset으로 prefetch 하여 북마크 수와 관계없이 일정한 쿼리 수로 조회합니다.
+    북마크가 많으면 me/bookmarks/stores/, me/bookmarks/events/ 에서 페이지 단위로 조회할 수 있습니다.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
         user = request.user
         if user:
+            prefetch_related_objects(
+                [user],
+                Prefetch("bookmark_stores", queryset=bookmarked_stores()),
+                Prefetch("bookmark_events", queryset=bookmarked_events()),
+            )
             serializer = UserProfileSerializer(user)
             return Response(serializer.data, status=status.HTTP_200_OK)
         else:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
 
+# 마이페이지 요약 (헤더, 프로필 이미지 위젯용)
+class MeSummaryView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        serializer = UserSummarySerializer(request.user)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+# 북마크한 한복집 목록 (페이지네이션)
+class BookmarkStoreListView(generics.ListAPIView):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = StoreListSerializer
+    pagination_class = BookmarkPagination
+
+    def get_queryset(self):
+        return bookmarked_stores().filter(store_bookmarks=self.request.user)
+
+
+# 북마크한 공연 목록 (페이지네이션)
+class BookmarkEventListView(generics.ListAPIView):
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = EventSerializer
+    pagination_class = BookmarkPagination
+
+    def get_queryset(self):
+        return bookmarked_events().filter(event_bookmarks=self.request.user)
+
+
 # 회원정보 수정하기, 탈퇴하기
 class UpdateProfileView(generics.UpdateAPIView):
     def get_serializer_class(self):